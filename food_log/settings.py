@@ -60,6 +60,27 @@ REST_FRAMEWORK = {
     ),
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'food-log-throttle',
+    },
+}
+
+TOKEN_BUCKET_THROTTLE = {
+    'CACHE': 'throttle',
+    'CAPACITY': 60,
+    'REFILL_PER_SECOND': 1.0,
+    'COSTS': {
+        'search_food': 5,
+        'daily_summary': 3,
+        'nutritional_insights': 10,
+    },
+}
+
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
@@ -68,6 +89,67 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "SIGNING_KEY": SECRET_KEY,
     "ALGORITHM": "HS256",
+    "TOKEN_REFRESH_SERIALIZER": "food_log_api.serializers.FilteredTokenRefreshSerializer",
+}
+
+# A token blacklisted by another process can still pass the in-memory filter for up to REFRESH_SECONDS.
+# 0 re-syncs new blacklist rows on every filter miss, so revocation takes effect immediately.
+TOKEN_BLACKLIST_FILTER = {
+    "REFRESH_SECONDS": 0.0,
+}
+
+REQUEST_PROFILING = {
+    "HEADER": "X-Profile",
+    "QUERY_PARAM": "_profile",
+    "MAX_QUERIES": 1000,
+    "TOP_FUNCTIONS": 50,
+}
+
+EVENT_STREAM = {
+    "BACKEND": "food_log_api.events.InProcessBroker",
+    "HISTORY": 500,
+    "QUEUE_SIZE": 1000,
+    "HEARTBEAT_SECONDS": 15,
+}
+
+RECOMMENDATIONS = {
+    "MAX_USERS": 1000,
+    "MAX_AGE_SECONDS": 300,
+}
+
+CALORIE_COMPLIANCE = {
+    "TOLERANCE_PERCENT": 10,
+    "MAX_DAYS": 366,
+}
+
+# Peak tracemalloc MB per view with ROWS food and hydration logs for one user on one day. These views
+# return every matching row, so their peak grows with the result; each budget is about 1.5x the peak
+# measured at 50,000 rows, so a change that buffers a second copy of the rows fails the test.
+MEMORY_BUDGET = {
+    "ROWS": 50_000,
+    "PEAK_MB": {
+        "daily_summary": 56,
+        "nutritional_insights": 8,
+        "filter_food_date": 40,
+        "filter_food_by_rating": 40,
+        "food_cooking_time": 32,
+        "search_food": 72,
+    },
+}
+
+STARTUP_BUDGET = {
+    "IMPORT_MS": 600,
+    "FIRST_REQUEST_MS": 1000,
+    "FIRST_REQUEST_PATH": "/api/list-hydration-logs/",
+    "DEFERRED_MODULES": [
+        "numpy",
+        "cProfile",
+        "food_log_api.analytics",
+        "food_log_api.views.analytics",
+        "food_log_api.views.food",
+        "food_log_api.vectors",
+        "rest_framework_simplejwt.views",
+    ],
 }
 
 MIDDLEWARE = [
@@ -76,6 +158,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'food_log_api.sharding.UserShardMiddleware',
+    'food_log_api.profiling.RequestProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -105,13 +189,35 @@ WSGI_APPLICATION = 'food_log.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# IMMEDIATE transactions take the writer lock up front, so concurrent writers queue for
+# 'timeout' seconds instead of failing with "database is locked" when a read upgrades to a write.
+SQLITE_OPTIONS = {'transaction_mode': 'IMMEDIATE', 'timeout': 20}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': SQLITE_OPTIONS,
     }
 }
 
+# Per-user data (logs, preferences, templates, archives) is spread over USER_SHARDS by a
+# consistent hash of the user id; auth users, tokens and shared tables stay on 'default'.
+# Each SQLite file has its own writer lock, so write throughput grows with the shard count.
+# After raising the count, run `migrate --database shard_N` for each new alias and then
+# `rebalance_shards` to move users onto their new placement.
+USER_SHARD_COUNT = 1
+
+for shard in range(1, USER_SHARD_COUNT):
+    DATABASES[f'shard_{shard}'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'db_shard_{shard}.sqlite3',
+        'OPTIONS': SQLITE_OPTIONS,
+    }
+
+USER_SHARDS = list(DATABASES)
+DATABASE_ROUTERS = ['food_log_api.sharding.UserShardRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -132,6 +238,28 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing runs on a bounded thread pool (food_log_api.hashers). WORKERS caps how many hashes
+# run at once across request threads; the calling thread still waits for its own hash to finish.
+# PROFILE picks the hasher used for new passwords; both stay available to verify existing hashes.
+# The argon2 profile requires the argon2-cffi package.
+
+PASSWORD_HASHING = {
+    'PROFILE': 'pbkdf2',
+    'WORKERS': 4,
+    'PBKDF2_ITERATIONS': 1_000_000,
+    'ARGON2_TIME_COST': 2,
+    'ARGON2_MEMORY_COST': 102400,
+    'ARGON2_PARALLELISM': 8,
+}
+
+PASSWORD_HASHERS = [
+    'food_log_api.hashers.PooledPBKDF2PasswordHasher',
+    'food_log_api.hashers.PooledArgon2PasswordHasher',
+]
+if PASSWORD_HASHING['PROFILE'] == 'argon2':
+    PASSWORD_HASHERS.reverse()
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
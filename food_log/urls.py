@@ -16,11 +16,11 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from food_log_api.lazy import lazy_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('food_log_api.urls')),
-    path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('api/token/', lazy_view('rest_framework_simplejwt.views.TokenObtainPairView'), name='token_obtain_pair'),
+    path('api/token/refresh/', lazy_view('rest_framework_simplejwt.views.TokenRefreshView'), name='token_refresh'),
 ]
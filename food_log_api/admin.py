@@ -1,3 +1,63 @@
+import json
+
 from django.contrib import admin
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from .models import PopulationStats, RequestProfile
+from .profiling import profile_report
+
+
+@admin.register(PopulationStats)
+class PopulationStatsAdmin(admin.ModelAdmin):
+    list_display = ("computed_at", "user_count", "food_log_count", "hydration_log_count")
+    readonly_fields = [field.name for field in PopulationStats._meta.fields]
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "user", "method", "path", "status_code", "duration_ms", "query_count", "sql_time_ms", "downloads")
+    list_filter = ("method", "status_code")
+    search_fields = ("path", "user__username")
+    exclude = ("profile",)
+    readonly_fields = [field.name for field in RequestProfile._meta.fields if field.name != "profile"] + ["downloads"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                "<int:object_id>/download/<str:artifact>/",
+                self.admin_site.admin_view(self.download),
+                name="food_log_api_requestprofile_download",
+            ),
+        ] + super().get_urls()
+
+    @admin.display(description="Artifacts")
+    def downloads(self, obj):
+        return format_html(
+            '<a href="{}">.prof</a> | <a href="{}">JSON</a>',
+            reverse("admin:food_log_api_requestprofile_download", args=[obj.pk, "prof"]),
+            reverse("admin:food_log_api_requestprofile_download", args=[obj.pk, "json"]),
+        )
+
+    def download(self, request, object_id, artifact):
+        if not self.has_view_permission(request):
+            return HttpResponse(status=403)
+
+        profile = get_object_or_404(RequestProfile, pk=object_id)
+        if artifact == "prof":
+            response = HttpResponse(bytes(profile.profile), content_type="application/octet-stream")
+        elif artifact == "json":
+            response = HttpResponse(json.dumps(profile_report(profile), indent=2), content_type="application/json")
+        else:
+            return HttpResponse(status=404)
 
-# Register your models here.
+        response["Content-Disposition"] = f'attachment; filename="request-profile-{profile.pk}.{artifact}"'
+        return response
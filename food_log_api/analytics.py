@@ -0,0 +1,151 @@
+from datetime import timedelta
+
+import numpy as np
+
+from .filters import day_bounds
+from .models import FoodLog, HydrationLog, LogArchive
+from .rows import stream_log_rows
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+def _epoch_seconds(timestamps):
+    return np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(timestamps))
+
+
+def day_edges(first_day, days, tz):
+    edges = [day_bounds(first_day + timedelta(days=i), first_day + timedelta(days=i), tz)[0] for i in range(days + 1)]
+    return np.array([edge.timestamp() for edge in edges], dtype=np.float64)
+
+
+def day_index(epochs, edges):
+    return np.searchsorted(edges, epochs, side="right") - 1
+
+
+def load_food_arrays(user, start, end):
+    rows = list(stream_log_rows(
+        LogArchive.FOOD, user, FoodLog.objects.filter(user=user, timestamp__gte=start, timestamp__lt=end).order_by(),
+        ["timestamp", "calories", "rating", "cooking_time", "category"], start, end,
+    ))
+    if not rows:
+        return {
+            "timestamp": np.empty(0, dtype=np.float64),
+            "calories": np.empty(0, dtype=np.float64),
+            "rating": np.empty(0, dtype=np.float64),
+            "cooking_time": np.empty(0, dtype=np.float64),
+            "category": np.empty(0, dtype=object),
+        }
+
+    timestamps, calories, ratings, cooking_times, categories = zip(*rows)
+    return {
+        "timestamp": _epoch_seconds(timestamps),
+        "calories": np.array(calories, dtype=np.float64),
+        "rating": np.array(ratings, dtype=np.float64),
+        "cooking_time": np.array(cooking_times, dtype=np.float64),
+        "category": np.array([category or "Uncategorized" for category in categories], dtype=object),
+    }
+
+
+def load_hydration_arrays(user, start, end):
+    rows = list(stream_log_rows(
+        LogArchive.HYDRATION, user, HydrationLog.objects.filter(user=user, timestamp__gte=start, timestamp__lt=end).order_by(),
+        ["timestamp", "amount"], start, end,
+    ))
+    if not rows:
+        return {"timestamp": np.empty(0, dtype=np.float64), "amount": np.empty(0, dtype=np.float64)}
+
+    timestamps, amounts = zip(*rows)
+    return {"timestamp": _epoch_seconds(timestamps), "amount": np.array(amounts, dtype=np.float64)}
+
+
+def daily_totals(index, values, days):
+    values = np.nan_to_num(values)
+    return np.bincount(index, weights=values, minlength=days)[:days]
+
+
+def rolling_mean(series, window):
+    cumulative = np.concatenate(([0.0], np.cumsum(series)))
+    upper = np.arange(1, len(series) + 1)
+    lower = np.maximum(0, upper - window)
+    return (cumulative[upper] - cumulative[lower]) / (upper - lower)
+
+
+def streaks(mask):
+    if not len(mask):
+        return 0, 0
+
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    changes = np.diff(padded)
+    starts = np.flatnonzero(changes == 1)
+    ends = np.flatnonzero(changes == -1)
+    lengths = ends - starts
+
+    longest = int(lengths.max()) if len(lengths) else 0
+    current = int(lengths[-1]) if len(lengths) and ends[-1] == len(mask) else 0
+    return longest, current
+
+
+def percentiles(values):
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return None
+    return {f"p{p}": round(float(v), 1) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+
+def category_mix_by_month(categories, index, dates):
+    if not len(categories):
+        return {}
+
+    month_labels = np.array([date.strftime("%Y-%m") for date in dates], dtype=object)
+    months, month_index = np.unique(month_labels[index], return_inverse=True)
+    labels, category_index = np.unique(categories, return_inverse=True)
+    counts = np.zeros((len(months), len(labels)), dtype=np.int64)
+    np.add.at(counts, (month_index, category_index), 1)
+
+    return {
+        month: {label: int(count) for label, count in zip(labels, row) if count}
+        for month, row in zip(months, counts)
+    }
+
+
+def compute_trends(user, first_day, days, tz, window=7, hydration_goal=2000):
+    edges = day_edges(first_day, days, tz)
+    start, end = day_bounds(first_day, first_day + timedelta(days=days - 1), tz)
+    dates = [first_day + timedelta(days=i) for i in range(days)]
+
+    food = load_food_arrays(user, start, end)
+    hydration = load_hydration_arrays(user, start, end)
+    food_index = day_index(food["timestamp"], edges)
+    hydration_index = day_index(hydration["timestamp"], edges)
+
+    calories_per_day = daily_totals(food_index, food["calories"], days)
+    meals_per_day = np.bincount(food_index, minlength=days)[:days]
+    hydration_per_day = daily_totals(hydration_index, hydration["amount"], days)
+    logged_days = meals_per_day > 0
+
+    longest_logging, current_logging = streaks(logged_days)
+    longest_hydration, current_hydration = streaks(hydration_per_day >= hydration_goal)
+
+    return {
+        "date_from": dates[0].isoformat(),
+        "date_to": dates[-1].isoformat(),
+        "dates": [date.isoformat() for date in dates],
+        "calories": {
+            "daily_totals": calories_per_day.astype(int).tolist(),
+            "rolling_average": np.round(rolling_mean(calories_per_day, window), 1).tolist(),
+            "window": window,
+            "daily_percentiles": percentiles(calories_per_day[logged_days]),
+            "meal_percentiles": percentiles(food["calories"]),
+        },
+        "rating_average": round(float(np.nanmean(food["rating"])), 2) if np.any(~np.isnan(food["rating"])) else None,
+        "cooking_time_percentiles": percentiles(food["cooking_time"]),
+        "hydration": {
+            "daily_totals": hydration_per_day.astype(int).tolist(),
+            "rolling_average": np.round(rolling_mean(hydration_per_day, window), 1).tolist(),
+            "goal": hydration_goal,
+            "longest_streak": longest_hydration,
+            "current_streak": current_hydration,
+        },
+        "logging_streak": {"longest": longest_logging, "current": current_logging},
+        "category_mix": category_mix_by_month(food["category"], food_index, dates),
+    }
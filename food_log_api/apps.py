@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, pre_delete
 
 
 class FoodLogApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'food_log_api'
+
+    def ready(self):
+        from django.contrib.auth.models import User
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+        from .sharding import delete_sharded_user_data
+        from .tokens import track_blacklisted_token
+
+        post_save.connect(track_blacklisted_token, sender=BlacklistedToken, dispatch_uid="food_log_api.track_blacklisted_token")
+        pre_delete.connect(delete_sharded_user_data, sender=User, dispatch_uid="food_log_api.delete_sharded_user_data")
@@ -0,0 +1,249 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import F
+from django.db.models.expressions import Col
+
+from .models import FoodLog, HydrationLog, LogArchive
+from .sharding import shard_for
+
+ARCHIVED_MODELS = {
+    LogArchive.FOOD: FoodLog,
+    LogArchive.HYDRATION: HydrationLog,
+}
+ARCHIVED_IDS = {
+    LogArchive.FOOD: "user_food_id",
+    LogArchive.HYDRATION: "user_hydration_id",
+}
+
+
+def archive_table_name(kind, year):
+    return f"{ARCHIVED_MODELS[kind]._meta.db_table}_archive_{year}"
+
+
+def year_bounds(year):
+    return (
+        datetime(year, 1, 1, tzinfo=dt_timezone.utc),
+        datetime(year + 1, 1, 1, tzinfo=dt_timezone.utc),
+    )
+
+
+def _adapt(connection, value):
+    return connection.ops.adapt_datetimefield_value(value)
+
+
+def _columns(model):
+    return [field.column for field in model._meta.concrete_fields]
+
+
+def ensure_archive_table(kind, year, using=DEFAULT_DB_ALIAS):
+    model = ARCHIVED_MODELS[kind]
+    table = archive_table_name(kind, year)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            columns = ", ".join(quote(column) for column in _columns(model))
+            cursor.execute(f"CREATE TABLE {quote(table)} AS SELECT {columns} FROM {quote(model._meta.db_table)} WHERE 1 = 0")
+            cursor.execute(f"CREATE INDEX {quote(table + '_user_ts')} ON {quote(table)} ({quote('user_id')}, {quote('timestamp')})")
+        else:
+            existing = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+            for field in model._meta.concrete_fields:
+                if field.column not in existing:
+                    cursor.execute(f"ALTER TABLE {quote(table)} ADD COLUMN {quote(field.column)} {field.db_type(connection)}")
+
+    return table
+
+
+def archive_rows(kind, cutoff, using=DEFAULT_DB_ALIAS):
+    model = ARCHIVED_MODELS[kind]
+    oldest = model.objects.using(using).order_by("timestamp").values_list("timestamp", flat=True).first()
+    if oldest is None or oldest >= cutoff:
+        return {}
+
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    source = quote(model._meta.db_table)
+    columns = ", ".join(quote(column) for column in _columns(model))
+    moved = {}
+
+    for year in range(oldest.astimezone(dt_timezone.utc).year, cutoff.astimezone(dt_timezone.utc).year + 1):
+        start, end = year_bounds(year)
+        end = min(end, cutoff)
+        if start >= end:
+            continue
+
+        with transaction.atomic(using=using):
+            table = ensure_archive_table(kind, year, using)
+            where = f"{quote('timestamp')} >= %s AND {quote('timestamp')} < %s"
+            params = [_adapt(connection, start), _adapt(connection, end)]
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {quote(table)} ({columns}) SELECT {columns} FROM {source} WHERE {where}", params)
+                cursor.execute(f"DELETE FROM {source} WHERE {where}", params)
+                count = cursor.rowcount
+
+            if not count:
+                continue
+
+            archive, _ = LogArchive.objects.using(using).select_for_update().get_or_create(
+                kind=kind, year=year, defaults={"table_name": table, "archived_before": end}
+            )
+            archive.row_count += count
+            archive.archived_before = max(archive.archived_before, end)
+            archive.save(using=using)
+            moved[year] = count
+
+    return moved
+
+
+def archives_in_range(kind, start=None, end=None, using=DEFAULT_DB_ALIAS):
+    archives = LogArchive.objects.using(using).filter(kind=kind)
+    if start is not None:
+        archives = archives.filter(archived_before__gt=start, year__gte=start.astimezone(dt_timezone.utc).year)
+    if end is not None:
+        archives = archives.filter(year__lte=end.astimezone(dt_timezone.utc).year)
+    return list(archives.order_by("year"))
+
+
+def _archive_query(connection, archive, user, start, end, columns):
+    quote = connection.ops.quote_name
+    where = [f"{quote('user_id')} = %s"]
+    params = [user.pk]
+    if start is not None:
+        where.append(f"{quote('timestamp')} >= %s")
+        params.append(_adapt(connection, start))
+    if end is not None:
+        where.append(f"{quote('timestamp')} < %s")
+        params.append(_adapt(connection, end))
+    sql = f"SELECT {columns} FROM {quote(archive.table_name)} WHERE {' AND '.join(where)} ORDER BY {quote('timestamp')}"
+    return sql, params
+
+
+def archived_logs(kind, user, start=None, end=None):
+    model = ARCHIVED_MODELS[kind]
+    using = shard_for(user)
+    results = []
+
+    for archive in archives_in_range(kind, start, end, using):
+        results.extend(model.objects.using(using).raw(*_archive_query(connections[using], archive, user, start, end, "*")))
+
+    return results
+
+
+def _row_converters(connection, model, fields):
+    columns = [Col(None, model._meta.get_field(name)) for name in fields]
+    return [
+        (column, [*connection.ops.get_db_converters(column), *column.target.get_db_converters(connection)])
+        for column in columns
+    ]
+
+
+def _converted_rows(connection, sql, params, converters, chunk_size):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        while rows := cursor.fetchmany(chunk_size):
+            for row in rows:
+                values = []
+                for value, (column, column_converters) in zip(row, converters):
+                    for converter in column_converters:
+                        value = converter(value, column, connection)
+                    values.append(value)
+                yield tuple(values)
+
+
+def archived_logs_by_id(kind, user, ids):
+    model = ARCHIVED_MODELS[kind]
+    using = shard_for(user)
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    ids = list(ids)
+    found = {}
+    if not ids:
+        return found
+
+    placeholders = ", ".join(["%s"] * len(ids))
+    for archive in archives_in_range(kind, using=using):
+        sql = (
+            f"SELECT * FROM {quote(archive.table_name)} "
+            f"WHERE {quote('user_id')} = %s AND {quote(ARCHIVED_IDS[kind])} IN ({placeholders})"
+        )
+        for log in model.objects.using(using).raw(sql, [user.pk, *ids]):
+            found[getattr(log, ARCHIVED_IDS[kind])] = log
+    return found
+
+
+def archived_log(kind, user, log_id):
+    return archived_logs_by_id(kind, user, [log_id]).get(log_id)
+
+
+def archived_rows(kind, user, fields, start=None, end=None, chunk_size=2000):
+    model = ARCHIVED_MODELS[kind]
+    connection = connections[shard_for(user)]
+    converters = _row_converters(connection, model, fields)
+    selected = ", ".join(connection.ops.quote_name(column.target.column) for column, _ in converters)
+
+    for archive in archives_in_range(kind, start, end, connection.alias):
+        sql, params = _archive_query(connection, archive, user, start, end, selected)
+        yield from _converted_rows(connection, sql, params, converters, chunk_size)
+
+
+def archived_rows_for_users(kind, first_user_id, last_user_id, fields, using=DEFAULT_DB_ALIAS, chunk_size=2000):
+    model = ARCHIVED_MODELS[kind]
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    converters = _row_converters(connection, model, fields)
+    selected = ", ".join(quote(column.target.column) for column, _ in converters)
+
+    for archive in archives_in_range(kind, using=using):
+        sql = f"SELECT {selected} FROM {quote(archive.table_name)} WHERE {quote('user_id')} >= %s AND {quote('user_id')} <= %s"
+        yield from _converted_rows(connection, sql, [first_user_id, last_user_id], converters, chunk_size)
+
+
+def delete_archived(kind, user):
+    return _delete_archived(kind, user.pk, shard_for(user))
+
+
+def _delete_archived(kind, user_id, using):
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    deleted = 0
+    with connection.cursor() as cursor:
+        for archive in LogArchive.objects.using(using).filter(kind=kind):
+            cursor.execute(f"DELETE FROM {quote(archive.table_name)} WHERE {quote('user_id')} = %s", [user_id])
+            if cursor.rowcount:
+                deleted += cursor.rowcount
+                LogArchive.objects.using(using).filter(pk=archive.pk).update(row_count=F("row_count") - cursor.rowcount)
+    return deleted
+
+
+def delete_archived_for_id(user_id, using):
+    return sum(_delete_archived(kind, user_id, using) for kind in ARCHIVED_MODELS)
+
+
+def copy_archived(user_id, source, target):
+    source_connection, target_connection = connections[source], connections[target]
+    quote = source_connection.ops.quote_name
+    copied = 0
+    for kind, model in ARCHIVED_MODELS.items():
+        columns = ", ".join(quote(column) for column in _columns(model))
+        for archive in archives_in_range(kind, using=source):
+            with source_connection.cursor() as cursor:
+                cursor.execute(f"SELECT {columns} FROM {quote(archive.table_name)} WHERE {quote('user_id')} = %s", [user_id])
+                rows = cursor.fetchall()
+            if not rows:
+                continue
+
+            table = ensure_archive_table(kind, archive.year, target)
+            placeholders = ", ".join(["%s"] * len(rows[0]))
+            with target_connection.cursor() as cursor:
+                cursor.executemany(f"INSERT INTO {quote(table)} ({columns}) VALUES ({placeholders})", rows)
+
+            target_archive, _ = LogArchive.objects.using(target).select_for_update().get_or_create(
+                kind=kind, year=archive.year, defaults={"table_name": table, "archived_before": archive.archived_before}
+            )
+            target_archive.row_count += len(rows)
+            target_archive.archived_before = max(target_archive.archived_before, archive.archived_before)
+            target_archive.save(using=target)
+            copied += len(rows)
+    return copied
@@ -0,0 +1,93 @@
+import threading
+from bisect import bisect_left
+
+from .models import CatalogFood
+
+MACRO_FIELDS = ["protein_g", "carbs_g", "fat_g", "fiber_g"]
+
+_index = None
+_index_lock = threading.Lock()
+
+
+class CatalogIndex:
+    def __init__(self, rows):
+        self.entries = {}
+        for name, serving, calories, *macros in rows:
+            key = normalize(name)
+            self.entries[key] = {
+                "name": name,
+                "serving": serving,
+                "calories": calories,
+                **dict(zip(MACRO_FIELDS, macros)),
+            }
+        self.names = sorted(self.entries)
+
+    def lookup(self, ingredient):
+        key = normalize(ingredient)
+        entry = self.entries.get(key)
+        if entry is None and key.endswith("es"):
+            entry = self.entries.get(key[:-2])
+        if entry is None and key.endswith("s"):
+            entry = self.entries.get(key[:-1])
+        if entry is None:
+            entry = self.entries.get(key + "s")
+        return entry
+
+    def autocomplete(self, prefix, limit=10):
+        prefix = normalize(prefix)
+        results = []
+        position = bisect_left(self.names, prefix)
+        while position < len(self.names) and len(results) < limit:
+            name = self.names[position]
+            if not name.startswith(prefix):
+                break
+            results.append(self.entries[name])
+            position += 1
+        return results
+
+
+def normalize(name):
+    return " ".join(str(name).lower().split())
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CatalogIndex(
+                    CatalogFood.objects.values_list("name", "serving", "calories", *MACRO_FIELDS)
+                )
+    return _index
+
+
+def reset_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def estimate_nutrition(ingredients):
+    index = get_index()
+    totals = {"calories": 0, **{field: 0.0 for field in MACRO_FIELDS}}
+    matched = []
+    unmatched = []
+
+    for ingredient in ingredients or []:
+        entry = index.lookup(ingredient)
+        if entry is None:
+            unmatched.append(ingredient)
+            continue
+        matched.append(ingredient)
+        totals["calories"] += entry["calories"]
+        for field in MACRO_FIELDS:
+            totals[field] += entry[field]
+
+    if not matched:
+        return None
+
+    return {
+        **{key: round(value, 1) if key in MACRO_FIELDS else value for key, value in totals.items()},
+        "matched_ingredients": matched,
+        "unmatched_ingredients": unmatched,
+    }
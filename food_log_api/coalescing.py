@@ -0,0 +1,57 @@
+import threading
+from functools import wraps
+
+from django.db import connections
+from rest_framework.response import Response
+
+from .sharding import shard_for
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def request_key(request):
+    return (getattr(request.user, "pk", None), request.path, tuple(sorted((key, tuple(values)) for key, values in request.GET.lists())))
+
+
+def single_flight(view_func):
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        # Inside an atomic batch the view sees that batch's uncommitted writes, so it neither leads nor follows.
+        if request.user.is_authenticated and connections[shard_for(request.user)].in_atomic_block:
+            return view_func(request, *args, **kwargs)
+        key = (view_func.__name__, request_key(request), tuple(sorted(kwargs.items())))
+
+        with _in_flight_lock:
+            call = _in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _in_flight[key] = _Call()
+
+        if leader:
+            try:
+                call.result = view_func(request, *args, **kwargs)
+            except Exception as e:
+                call.error = e
+                raise
+            finally:
+                with _in_flight_lock:
+                    _in_flight.pop(key, None)
+                call.done.set()
+            return call.result
+
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        # Content-Type is left to each follower's own renderer; every other header the view set is shared.
+        headers = {name: value for name, value in call.result.items() if name.lower() != "content-type"}
+        return Response(call.result.data, status=call.result.status_code, headers=headers)
+
+    return wrapper
@@ -0,0 +1,141 @@
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .archive import archived_rows
+from .filters import local_day, user_timezone
+from .models import DailyCalorieTotal, FoodLog, LogArchive
+from .sharding import shard_for
+
+DEFAULT_COMPLIANCE_SETTINGS = {
+    "TOLERANCE_PERCENT": 10,
+    "MAX_DAYS": 366,
+}
+
+ON_TARGET = "on_target"
+OVER = "over"
+UNDER = "under"
+NO_LOGS = "no_logs"
+
+
+def compliance_settings():
+    return {**DEFAULT_COMPLIANCE_SETTINGS, **getattr(settings, "CALORIE_COMPLIANCE", {})}
+
+
+def apply_calorie_delta(user, day, calories, count):
+    calories = int(calories or 0)
+    if not calories and not count:
+        return
+
+    using = shard_for(user)
+    updated = DailyCalorieTotal.objects.using(using).filter(user=user, date=day).update(
+        total_calories=F("total_calories") + calories, log_count=F("log_count") + count
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic(using=using):
+            DailyCalorieTotal.objects.using(using).create(user=user, date=day, total_calories=calories, log_count=count)
+    except IntegrityError:
+        DailyCalorieTotal.objects.using(using).filter(user=user, date=day).update(
+            total_calories=F("total_calories") + calories, log_count=F("log_count") + count
+        )
+
+
+def apply_food_logs(user, food_logs, tz=None, sign=1):
+    tz = tz or user_timezone(user)
+    calories = Counter()
+    counts = Counter()
+    for food_log in food_logs:
+        day = local_day(food_log.timestamp, tz)
+        calories[day] += food_log.calories or 0
+        counts[day] += 1
+    for day, count in counts.items():
+        apply_calorie_delta(user, day, sign * calories[day], sign * count)
+
+
+def rebuild_calorie_totals(user, tz=None):
+    tz = tz or user_timezone(user)
+    using = shard_for(user)
+    totals = defaultdict(lambda: [0, 0])
+    live = FoodLog.objects.using(using).filter(user=user).values_list("timestamp", "calories").iterator()
+    archived = archived_rows(LogArchive.FOOD, user, ["timestamp", "calories"])
+    for rows in (archived, live):
+        for timestamp, calories in rows:
+            day = totals[local_day(timestamp, tz)]
+            day[0] += calories or 0
+            day[1] += 1
+
+    with transaction.atomic(using=using):
+        DailyCalorieTotal.objects.using(using).filter(user=user).delete()
+        DailyCalorieTotal.objects.using(using).bulk_create([
+            DailyCalorieTotal(user=user, date=day, total_calories=total_calories, log_count=log_count)
+            for day, (total_calories, log_count) in totals.items()
+        ])
+
+
+def day_status(total_calories, log_count, target, tolerance):
+    if not log_count:
+        return NO_LOGS
+    if total_calories > target * (1 + tolerance):
+        return OVER
+    if total_calories < target * (1 - tolerance):
+        return UNDER
+    return ON_TARGET
+
+
+def compliance_report(user, target, first_day, days):
+    tolerance = compliance_settings()["TOLERANCE_PERCENT"] / 100
+    last_day = first_day + timedelta(days=days - 1)
+    totals = {
+        day: (total_calories, log_count)
+        for day, total_calories, log_count in DailyCalorieTotal.objects.using(shard_for(user))
+        .filter(user=user, date__gte=first_day, date__lte=last_day)
+        .values_list("date", "total_calories", "log_count")
+    }
+
+    daily = []
+    for offset in range(days):
+        day = first_day + timedelta(days=offset)
+        total_calories, log_count = totals.get(day, (0, 0))
+        daily.append({
+            "date": day.isoformat(),
+            "total_calories": total_calories,
+            "log_count": log_count,
+            "difference": total_calories - target if log_count else None,
+            "status": day_status(total_calories, log_count, target, tolerance),
+        })
+
+    statuses = [entry["status"] for entry in daily]
+    longest = run = 0
+    for entry_status in statuses:
+        run = run + 1 if entry_status == ON_TARGET else 0
+        longest = max(longest, run)
+
+    # Today is still in progress, so being under target so far does not break the current streak.
+    current_days = statuses[:-1] if statuses[-1] in (UNDER, NO_LOGS) else statuses
+    current = 0
+    for entry_status in reversed(current_days):
+        if entry_status != ON_TARGET:
+            break
+        current += 1
+
+    logged = [entry["total_calories"] for entry in daily if entry["log_count"]]
+    return {
+        "date_from": first_day.isoformat(),
+        "date_to": last_day.isoformat(),
+        "calorie_target": target,
+        "tolerance_percent": round(tolerance * 100, 1),
+        "on_target_days": statuses.count(ON_TARGET),
+        "over_days": statuses.count(OVER),
+        "under_days": statuses.count(UNDER),
+        "days_without_logs": statuses.count(NO_LOGS),
+        "average_calories": round(sum(logged) / len(logged), 1) if logged else None,
+        "current_streak": current,
+        "longest_streak": longest,
+        "daily": daily,
+    }
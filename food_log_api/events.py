@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+import uuid
+from collections import defaultdict, deque
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .sharding import shard_for
+
+DEFAULT_EVENT_SETTINGS = {
+    "BACKEND": "food_log_api.events.InProcessBroker",
+    "HISTORY": 500,
+    "QUEUE_SIZE": 1000,
+    "HEARTBEAT_SECONDS": 15,
+}
+
+
+def event_settings():
+    return {**DEFAULT_EVENT_SETTINGS, **getattr(settings, "EVENT_STREAM", {})}
+
+
+class Subscription:
+    def __init__(self, user_id, loop, queue_size):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def deliver(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class InProcessBroker:
+    def __init__(self, history=500, queue_size=1000):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.history = defaultdict(lambda: deque(maxlen=history))
+        self.counters = defaultdict(int)
+        self.queue_size = queue_size
+        self.subscriptions = defaultdict(set)
+        self.lock = threading.Lock()
+
+    def publish(self, user_id, event_type, data):
+        with self.lock:
+            self.counters[user_id] += 1
+            event = {"id": f"{self.epoch}-{self.counters[user_id]}", "seq": self.counters[user_id], "type": event_type, "data": data}
+            self.history[user_id].append(event)
+            subscriptions = list(self.subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+        return event
+
+    def subscribe(self, user_id, last_event_id=None):
+        subscription = Subscription(user_id, asyncio.get_running_loop(), self.queue_size)
+        with self.lock:
+            self.subscriptions[user_id].add(subscription)
+            history = list(self.history.get(user_id, ()))
+            latest = self.counters.get(user_id, 0)
+
+        if not last_event_id:
+            return subscription, [], False
+
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > latest:
+            return subscription, [], True
+
+        seq = int(seq)
+        missed = [event for event in history if event["seq"] > seq]
+        # Events between the client's last id and the oldest one we still hold are gone; it has to refetch.
+        expired = bool(missed) and missed[0]["seq"] != seq + 1
+        return subscription, missed, expired
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscriptions[subscription.user_id]
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = event_settings()
+                _broker = import_string(config["BACKEND"])(history=config["HISTORY"], queue_size=config["QUEUE_SIZE"])
+    return _broker
+
+
+def reset_broker():
+    global _broker
+    with _broker_lock:
+        _broker = None
+
+
+def publish_event(user, event_type, data):
+    user_id = user.pk
+    transaction.on_commit(lambda: get_broker().publish(user_id, event_type, data), using=shard_for(user))
+
+
+def food_event_data(food_log):
+    return {
+        "user_food_id": food_log.user_food_id,
+        "food_name": food_log.food_name,
+        "category": food_log.category,
+        "calories": food_log.calories,
+        "timestamp": food_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+    }
+
+
+def hydration_event_data(hydration_log):
+    return {
+        "user_hydration_id": hydration_log.user_hydration_id,
+        "amount": hydration_log.amount,
+        "beverage_type": hydration_log.beverage_type,
+        "timestamp": hydration_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+    }
+
+
+def format_event(event):
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
@@ -0,0 +1,228 @@
+import base64
+import json
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .ingredients import decode_ingredients
+from .models import FoodLog
+from .preferences import get_preferences
+
+QUERY_FIELDS = [
+    "user_food_id", "timestamp", "food_name", "serving_size", "rating",
+    "review", "category", "cooking_time", "ingredients", "calories",
+]
+QUERY_ORDERINGS = {"user_food_id", "timestamp", "rating", "cooking_time", "calories"}
+NULLABLE_ORDERINGS = {"rating", "cooking_time", "calories"}
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class FilterError(ValueError):
+    pass
+
+
+def parse_date_range(params):
+    date_from = params.get('dateFrom', None)
+    date_to = params.get('dateTo', None)
+    single_date = params.get('date', None)
+
+    try:
+        if single_date:
+            date_from = date_to = datetime.strptime(single_date, "%Y-%m-%d").date()
+        elif date_from and date_to:
+            date_from = datetime.strptime(date_from, "%Y-%m-%d").date()
+            date_to = datetime.strptime(date_to, "%Y-%m-%d").date()
+
+            if date_from > date_to:
+                raise FilterError("'dateFrom' cannot be later than 'dateTo'.")
+        else:
+            raise FilterError("Provide either 'date' OR both 'dateFrom' and 'dateTo'.")
+    except FilterError:
+        raise
+    except ValueError:
+        raise FilterError("Invalid date format. Use YYYY-MM-DD.")
+
+    return date_from, date_to
+
+
+def parse_min_rating(min_rating):
+    if not min_rating:
+        raise FilterError("min_rating is required.")
+
+    try:
+        min_rating = int(min_rating)
+    except ValueError:
+        raise FilterError("min_rating must be a valid integer between 1 and 5.")
+
+    if not (1 <= min_rating <= 5):
+        raise FilterError("min_rating must be between 1 and 5.")
+
+    return min_rating
+
+
+def parse_cooking_time_range(min_time, max_time):
+    try:
+        min_time = int(min_time) if min_time is not None else None
+        max_time = int(max_time) if max_time is not None else None
+    except ValueError:
+        raise FilterError("min_time and max_time must be valid positive integers.")
+
+    if (min_time is not None and min_time < 0) or (max_time is not None and max_time < 0):
+        raise FilterError("Cooking time must be a positive integer.")
+    if min_time is not None and max_time is not None and min_time > max_time:
+        raise FilterError("min_time cannot be greater than max_time.")
+
+    return min_time, max_time
+
+
+def get_timezone(name):
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        return ZoneInfo(settings.TIME_ZONE)
+
+
+def user_timezone(user):
+    preferences = get_preferences(user)
+    return get_timezone(preferences.timezone if preferences else settings.TIME_ZONE)
+
+
+def local_today(tz):
+    return timezone.now().astimezone(tz).date()
+
+
+def local_day(timestamp, tz):
+    if isinstance(timestamp, str):
+        timestamp = parse_datetime(timestamp)
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    return timestamp.astimezone(tz).date()
+
+
+def day_bounds(date_from, date_to, tz):
+    start = datetime.combine(date_from, time.min, tzinfo=tz)
+    end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=tz)
+    return start, end
+
+
+def date_range_filter(date_from, date_to, tz, field="timestamp"):
+    start, end = day_bounds(date_from, date_to, tz)
+    return Q(**{f"{field}__gte": start, f"{field}__lt": end})
+
+
+def encode_cursor(values):
+    payload = json.dumps(values, default=str, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor, ordering):
+    try:
+        value, user_food_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        user_food_id = int(user_food_id)
+    except (ValueError, TypeError):
+        raise FilterError("Invalid cursor.")
+
+    if ordering == "timestamp":
+        value = parse_datetime(value) if isinstance(value, str) else None
+        if value is None:
+            raise FilterError("Invalid cursor.")
+    elif ordering != "user_food_id" and not isinstance(value, int):
+        if value is not None or ordering not in NULLABLE_ORDERINGS:
+            raise FilterError("Invalid cursor.")
+
+    return value, user_food_id
+
+
+def food_log_filter(user, params):
+    query = Q(user=user)
+
+    category = params.get('category', '').strip()
+    if category:
+        query &= Q(category__iexact=category)
+
+    if params.get('date') or params.get('dateFrom') or params.get('dateTo'):
+        date_from, date_to = parse_date_range(params)
+        query &= date_range_filter(date_from, date_to, user_timezone(user))
+
+    if params.get('min_rating') is not None:
+        query &= Q(rating__gte=parse_min_rating(params.get('min_rating')))
+
+    min_time, max_time = parse_cooking_time_range(params.get('min_time'), params.get('max_time'))
+    if min_time is not None:
+        query &= Q(cooking_time__gte=min_time)
+    if max_time is not None:
+        query &= Q(cooking_time__lte=max_time)
+
+    return query
+
+
+def keyset_filter(ordering, descending, value, last_id):
+    lookup = "lt" if descending else "gt"
+    if ordering == "user_food_id":
+        return Q(**{f"user_food_id__{lookup}": last_id})
+    # NULLs sort last in both directions, so a NULL cursor only continues through the remaining NULL rows.
+    if value is None:
+        return Q(**{f"{ordering}__isnull": True, f"user_food_id__{lookup}": last_id})
+    query = Q(**{f"{ordering}__{lookup}": value}) | Q(**{ordering: value, f"user_food_id__{lookup}": last_id})
+    if ordering in NULLABLE_ORDERINGS:
+        query |= Q(**{f"{ordering}__isnull": True})
+    return query
+
+
+def build_food_log_query(user, params):
+    query = food_log_filter(user, params)
+
+    ordering = params.get('ordering', 'user_food_id').strip()
+    descending = ordering.startswith('-')
+    ordering = ordering.lstrip('-')
+    if ordering not in QUERY_ORDERINGS:
+        raise FilterError(f"ordering must be one of: {', '.join(sorted(QUERY_ORDERINGS))} (prefix with '-' for descending).")
+
+    fields_param = params.get('fields', '').strip()
+    if fields_param:
+        fields = [field.strip() for field in fields_param.split(',') if field.strip()]
+        invalid_fields = [field for field in fields if field not in QUERY_FIELDS]
+        if invalid_fields:
+            raise FilterError(f"Invalid fields requested: {invalid_fields}")
+    else:
+        fields = list(QUERY_FIELDS)
+
+    try:
+        limit = int(params.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise FilterError("limit must be a valid positive integer.")
+    if not (1 <= limit <= MAX_PAGE_SIZE):
+        raise FilterError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+
+    cursor = params.get('cursor')
+    if cursor:
+        query &= keyset_filter(ordering, descending, *decode_cursor(cursor, ordering))
+
+    column = F(ordering).desc(nulls_last=True) if descending else F(ordering).asc(nulls_last=True)
+    order_by = [column, "-user_food_id" if descending else "user_food_id"]
+    columns = ["ingredient_ids" if field == "ingredients" else field for field in fields]
+    selected = list(dict.fromkeys(columns + [ordering, "user_food_id"]))
+    rows = list(FoodLog.objects.filter(query).order_by(*order_by).values(*selected)[:limit + 1])
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([last[ordering], last["user_food_id"]])
+
+    results = []
+    for row in rows:
+        item = {
+            field: decode_ingredients(row["ingredient_ids"]) if field == "ingredients" else row[field]
+            for field in fields
+        }
+        if "timestamp" in item:
+            item["timestamp"] = item["timestamp"].strftime("%Y-%m-%d %I:%M %p")
+        results.append(item)
+
+    return results, next_cursor
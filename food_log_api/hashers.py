@@ -0,0 +1,73 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+DEFAULT_PASSWORD_HASHING = {
+    "PROFILE": "pbkdf2",
+    "WORKERS": 4,
+    "PBKDF2_ITERATIONS": hashers.PBKDF2PasswordHasher.iterations,
+    "ARGON2_TIME_COST": hashers.Argon2PasswordHasher.time_cost,
+    "ARGON2_MEMORY_COST": hashers.Argon2PasswordHasher.memory_cost,
+    "ARGON2_PARALLELISM": hashers.Argon2PasswordHasher.parallelism,
+}
+THREAD_NAME_PREFIX = "password-hasher"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def hashing_settings():
+    return {**DEFAULT_PASSWORD_HASHING, **getattr(settings, "PASSWORD_HASHING", {})}
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=hashing_settings()["WORKERS"], thread_name_prefix=THREAD_NAME_PREFIX
+                )
+    return _executor
+
+
+def run_in_pool(func, *args, **kwargs):
+    # The caller blocks on the result: the pool bounds concurrent hashing CPU, it does not free request workers.
+    # Hashers call their own encode() from verify()/harden_runtime(); run those inline
+    # so a saturated pool cannot deadlock on itself.
+    if threading.current_thread().name.startswith(THREAD_NAME_PREFIX):
+        return func(*args, **kwargs)
+    return get_executor().submit(func, *args, **kwargs).result()
+
+
+class PooledHasherMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        return run_in_pool(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return run_in_pool(super().verify, password, encoded)
+
+    def harden_runtime(self, password, encoded):
+        return run_in_pool(super().harden_runtime, password, encoded)
+
+
+class PooledPBKDF2PasswordHasher(PooledHasherMixin, hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return hashing_settings()["PBKDF2_ITERATIONS"]
+
+
+class PooledArgon2PasswordHasher(PooledHasherMixin, hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return hashing_settings()["ARGON2_TIME_COST"]
+
+    @property
+    def memory_cost(self):
+        return hashing_settings()["ARGON2_MEMORY_COST"]
+
+    @property
+    def parallelism(self):
+        return hashing_settings()["ARGON2_PARALLELISM"]
@@ -0,0 +1,50 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .archive import archived_logs
+from .filters import local_day, user_timezone
+from .models import DailyHydrationTotal, HydrationLog, LogArchive
+from .sharding import shard_for
+
+
+def apply_hydration_delta(user, day, amount, count):
+    amount = int(amount)
+    if not amount and not count:
+        return
+
+    using = shard_for(user)
+    updated = DailyHydrationTotal.objects.using(using).filter(user=user, date=day).update(
+        total_ml=F("total_ml") + amount, log_count=F("log_count") + count
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic(using=using):
+            DailyHydrationTotal.objects.using(using).create(user=user, date=day, total_ml=amount, log_count=count)
+    except IntegrityError:
+        DailyHydrationTotal.objects.using(using).filter(user=user, date=day).update(
+            total_ml=F("total_ml") + amount, log_count=F("log_count") + count
+        )
+
+
+def rebuild_hydration_totals(user, tz=None):
+    tz = tz or user_timezone(user)
+    using = shard_for(user)
+    totals = defaultdict(lambda: [0, 0])
+    live = HydrationLog.objects.using(using).filter(user=user).values_list("timestamp", "amount").iterator()
+    archived = ((log.timestamp, log.amount) for log in archived_logs(LogArchive.HYDRATION, user))
+    for rows in (archived, live):
+        for timestamp, amount in rows:
+            day = totals[local_day(timestamp, tz)]
+            day[0] += amount
+            day[1] += 1
+
+    with transaction.atomic(using=using):
+        DailyHydrationTotal.objects.using(using).filter(user=user).delete()
+        DailyHydrationTotal.objects.using(using).bulk_create([
+            DailyHydrationTotal(user=user, date=day, total_ml=total_ml, log_count=log_count)
+            for day, (total_ml, log_count) in totals.items()
+        ])
@@ -0,0 +1,106 @@
+import threading
+
+from django.db import connections, router, transaction
+from django.db.models import Q
+
+_names_by_id = {}
+_ids_by_name = {}
+_lock = threading.Lock()
+
+
+def _remember(rows, pending=()):
+    with _lock:
+        for ingredient_id, name in rows:
+            if ingredient_id not in pending:
+                _names_by_id[ingredient_id] = name
+                _ids_by_name[name] = ingredient_id
+
+
+def _uncommitted(using):
+    connection = connections[using]
+    if not hasattr(connection, "uncommitted_ingredient_ids"):
+        connection.uncommitted_ingredient_ids = set()
+    return connection.uncommitted_ingredient_ids
+
+
+def _remember_created(rows, using):
+    # Ingredients created inside a transaction reach the process-wide caches only once it commits; if it
+    # rolls back, their ids are handed out again for other names.
+    pending = _uncommitted(using)
+    pending.update(ingredient_id for ingredient_id, _ in rows)
+
+    def commit():
+        pending.difference_update(ingredient_id for ingredient_id, _ in rows)
+        _remember(rows)
+
+    transaction.on_commit(commit, using=using)
+
+
+def intern_ingredients(names):
+    from .models import Ingredient
+
+    names = [str(name) for name in names]
+    missing = [name for name in dict.fromkeys(names) if name not in _ids_by_name]
+    found = {}
+    if missing:
+        using = router.db_for_write(Ingredient)
+        rows = list(Ingredient.objects.using(using).filter(name__in=missing).values_list("id", "name"))
+        _remember(rows, _uncommitted(using))
+        created = set(missing) - {name for _, name in rows}
+        if created:
+            Ingredient.objects.using(using).bulk_create([Ingredient(name=name) for name in created], ignore_conflicts=True)
+            created_rows = list(Ingredient.objects.using(using).filter(name__in=created).values_list("id", "name"))
+            _remember_created(created_rows, using)
+            rows += created_rows
+        found = {name: ingredient_id for ingredient_id, name in rows}
+    return [found[name] if name in found else _ids_by_name[name] for name in names]
+
+
+def ingredient_names(ingredient_ids):
+    from .models import Ingredient
+
+    missing = {ingredient_id for ingredient_id in ingredient_ids if ingredient_id not in _names_by_id}
+    found = {}
+    if missing:
+        using = router.db_for_read(Ingredient)
+        found = dict(Ingredient.objects.using(using).filter(id__in=missing).values_list("id", "name"))
+        _remember(found.items(), _uncommitted(using))
+    # Ids whose ingredient row no longer exists are skipped rather than failing the whole log.
+    return [
+        found[ingredient_id] if ingredient_id in found else _names_by_id[ingredient_id]
+        for ingredient_id in ingredient_ids
+        if ingredient_id in found or ingredient_id in _names_by_id
+    ]
+
+
+def encode_ingredients(names):
+    if names is None:
+        return None
+    ingredient_ids = intern_ingredients(names)
+    if not ingredient_ids:
+        return ""
+    return "," + ",".join(map(str, ingredient_ids)) + ","
+
+
+def decode_ingredients(packed):
+    if packed is None:
+        return None
+    if not packed.strip(","):
+        return []
+    return ingredient_names([int(value) for value in packed.strip(",").split(",")])
+
+
+def ingredient_filter(query):
+    from .models import Ingredient
+
+    matches = list(Ingredient.objects.filter(name__icontains=query).values_list("id", flat=True))
+    if not matches:
+        return Q(pk__in=[])
+    # One regex term however many ingredients match; an OR per id overflowed SQLite's expression depth limit.
+    return Q(ingredient_ids__regex=f",({'|'.join(map(str, matches))}),")
+
+
+def clear_cache():
+    with _lock:
+        _names_by_id.clear()
+        _ids_by_name.clear()
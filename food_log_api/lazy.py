@@ -0,0 +1,45 @@
+import threading
+from importlib import import_module
+
+from asgiref.sync import markcoroutinefunction
+
+
+class LazyView:
+    lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self.__module__, self.__name__ = path.rsplit(".", 1)
+        self.__qualname__ = self.__name__
+        self._view = None
+
+    def resolve(self):
+        if self._view is None:
+            with self.lock:
+                if self._view is None:
+                    view = getattr(import_module(self.__module__), self.__name__)
+                    self._view = view.as_view() if hasattr(view, "as_view") else view
+        return self._view
+
+    @property
+    def csrf_exempt(self):
+        return getattr(self.resolve(), "csrf_exempt", False)
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyView {self.path}>"
+
+
+class AsyncLazyView(LazyView):
+    def __init__(self, path):
+        super().__init__(path)
+        markcoroutinefunction(self)
+
+    async def __call__(self, request, *args, **kwargs):
+        return await self.resolve()(request, *args, **kwargs)
+
+
+def lazy_view(path, asynchronous=False):
+    return AsyncLazyView(path) if asynchronous else LazyView(path)
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from food_log_api.archive import ARCHIVED_MODELS, archive_rows
+from food_log_api.sharding import shard_aliases
+
+
+class Command(BaseCommand):
+    help = "Move food and hydration logs older than a cutoff into per-year archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, required=True, help="Archive logs older than this many days.")
+        parser.add_argument("--kind", choices=[*ARCHIVED_MODELS, "all"], default="all")
+
+    def handle(self, *args, **options):
+        if options["older_than"] < 1:
+            raise CommandError("--older-than must be at least 1 day.")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than"])
+        kinds = list(ARCHIVED_MODELS) if options["kind"] == "all" else [options["kind"]]
+
+        aliases = shard_aliases()
+        for alias in aliases:
+            where = f" on {alias}" if len(aliases) > 1 else ""
+            for kind in kinds:
+                moved = archive_rows(kind, cutoff, alias)
+                if not moved:
+                    self.stdout.write(f"No {kind} logs older than {cutoff:%Y-%m-%d} to archive{where}.")
+                    continue
+                for year, count in sorted(moved.items()):
+                    self.stdout.write(self.style.SUCCESS(f"Archived {count} {kind} log(s) from {year}{where}."))
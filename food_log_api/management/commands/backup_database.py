@@ -0,0 +1,76 @@
+import gzip
+import shutil
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from food_log_api.sharding import shard_aliases
+
+
+class Command(BaseCommand):
+    help = (
+        "Take an online snapshot of each SQLite database with the backup API. Pages are copied in small "
+        "steps with a pause between them, so writers only wait for one step at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", required=True, help="Directory to write the snapshots to.")
+        parser.add_argument("--database", action="append", help="Alias to back up (repeatable). Defaults to every shard.")
+        parser.add_argument("--pages", type=int, default=256, help="Pages copied per step.")
+        parser.add_argument("--sleep", type=float, default=0.005, help="Seconds to pause between steps.")
+        parser.add_argument("--no-compress", action="store_true", help="Keep the raw .sqlite3 snapshot instead of gzipping it.")
+
+    def handle(self, *args, **options):
+        aliases = options["database"] or shard_aliases()
+        unknown = [alias for alias in aliases if alias not in connections]
+        if unknown:
+            raise CommandError(f"Unknown database alias(es): {', '.join(unknown)}")
+        if options["pages"] < 1:
+            raise CommandError("--pages must be at least 1.")
+
+        output = Path(options["output"])
+        output.mkdir(parents=True, exist_ok=True)
+        stamp = timezone.now().strftime("%Y%m%d-%H%M%S")
+
+        for alias in aliases:
+            connection = connections[alias]
+            if connection.vendor != "sqlite":
+                raise CommandError(f"{alias} is not a SQLite database.")
+            target = output / f"{alias}-{stamp}.sqlite3"
+
+            started = time.perf_counter()
+            self.backup(connection.settings_dict["NAME"], target, options["pages"], options["sleep"], options["verbosity"] > 1)
+            copied = time.perf_counter() - started
+
+            if not options["no_compress"]:
+                compressed = target.with_name(target.name + ".gz")
+                with open(target, "rb") as source, gzip.open(compressed, "wb", compresslevel=6) as destination:
+                    shutil.copyfileobj(source, destination, length=1024 * 1024)
+                target.unlink()
+                target = compressed
+
+            self.stdout.write(self.style.SUCCESS(
+                f"{alias}: {target} ({target.stat().st_size / 2**20:.1f} MB, copied in {copied:.2f}s, "
+                f"total {time.perf_counter() - started:.2f}s)"
+            ))
+
+    def backup(self, source_path, target_path, pages, sleep, verbose=False):
+        def progress(status, remaining, total):
+            self.stdout.write(f"  {total - remaining}/{total} pages")
+
+        # A write from another connection between steps makes SQLite restart the copy, so the
+        # snapshot is always a consistent point in time.
+        try:
+            with closing(sqlite3.connect(source_path)) as source, closing(sqlite3.connect(target_path)) as target:
+                source.backup(target, pages=pages, progress=progress if verbose else None, sleep=sleep)
+                result = target.execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                raise CommandError(f"Snapshot {target_path} failed its integrity check: {result}")
+        except BaseException:
+            target_path.unlink(missing_ok=True)
+            raise
@@ -0,0 +1,49 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from food_log_api.views.auth import register_user
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Measure registration and token issue throughput on a single core with the configured password hasher."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options["requests"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, count):
+        factory = APIRequestFactory()
+        obtain_token = TokenObtainPairView.as_view()
+        prefix = f"__benchmark_auth_{uuid.uuid4().hex[:8]}"
+        credentials = [(f"{prefix}_{i}", f"bench-{uuid.uuid4().hex}") for i in range(count)]
+
+        started = time.perf_counter()
+        for username, password in credentials:
+            response = register_user(factory.post("/api/register/", {"username": username, "password": password}, format="json"))
+            assert response.status_code == 200, response.data
+        register_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for username, password in credentials:
+            response = obtain_token(factory.post("/api/token/", {"username": username, "password": password}, format="json"))
+            assert response.status_code == 200, response.data
+        login_elapsed = time.perf_counter() - started
+
+        self.stdout.write(f"register: {count / register_elapsed:.1f} req/s per core ({register_elapsed / count * 1000:.1f} ms/req)")
+        self.stdout.write(f"token:    {count / login_elapsed:.1f} req/s per core ({login_elapsed / count * 1000:.1f} ms/req)")
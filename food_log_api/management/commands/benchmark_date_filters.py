@@ -0,0 +1,77 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from food_log_api.filters import date_range_filter, get_timezone
+from food_log_api.models import FoodLog
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compare the query plan and timing of date-cast vs. half-open range filtering on FoodLog.timestamp."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--timezone", default="America/New_York")
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, options):
+        rows, days, repeat = options["rows"], options["days"], options["repeat"]
+        tz = get_timezone(options["timezone"])
+        user = User.objects.create(username="__benchmark_date_filters__")
+        other = User.objects.create(username="__benchmark_date_filters_other__")
+
+        start = timezone.now() - timedelta(days=days)
+        step = timedelta(days=days) / rows
+        for owner in (user, other):
+            batch = [
+                FoodLog(
+                    user=owner, user_food_id=i + 1, food_name="food", serving_size="1",
+                    category="lunch", calories=random.randint(50, 900), timestamp=start + step * i,
+                )
+                for i in range(rows)
+            ]
+            FoodLog.objects.bulk_create(batch, batch_size=5000)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        day = timezone.now().astimezone(tz).date() - timedelta(days=days // 2)
+        week_start = day - timedelta(days=6)
+        cases = [
+            ("date cast, single day", FoodLog.objects.filter(user=user, timestamp__date=day)),
+            ("range, single day", FoodLog.objects.filter(date_range_filter(day, day, tz), user=user)),
+            ("date cast, 7 days", FoodLog.objects.filter(user=user, timestamp__date__range=[week_start, day])),
+            ("range, 7 days", FoodLog.objects.filter(date_range_filter(week_start, day, tz), user=user)),
+        ]
+
+        for label, queryset in cases:
+            queryset = queryset.values_list("calories", flat=True)
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = "; ".join(row[-1] for row in cursor.fetchall())
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                count = len(list(queryset.all()))
+            elapsed = (time.perf_counter() - started) / repeat * 1000
+
+            self.stdout.write(f"{label}: {count} rows, {elapsed:.2f} ms/query")
+            self.stdout.write(f"    plan: {plan}")
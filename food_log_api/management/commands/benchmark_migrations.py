@@ -0,0 +1,126 @@
+import json
+import shutil
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+APP_LABEL = "food_log_api"
+COUNTED_TABLES = ["auth_user", "food_log_api_foodlog", "food_log_api_hydrationlog", "food_log_api_foodpreference"]
+
+
+def copy_database(source, target):
+    with sqlite3.connect(source) as source_db, sqlite3.connect(target) as target_db:
+        source_db.backup(target_db)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time each food_log_api migration against a generated (or copied) dataset and record its peak Python memory. "
+        "Runs on a temporary copy; the configured database is never touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--logs-per-user", type=int, default=100)
+        parser.add_argument("--hydration-per-user", type=int)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--database", help="Copy this SQLite file (e.g. a production snapshot) instead of generating data.")
+        parser.add_argument("--from", dest="start", default="0001_initial", help="Migrate back to this migration before timing.")
+        parser.add_argument("--output", help="Write the results as JSON to this path.")
+        parser.add_argument("--keep", help="Copy the migrated working database to this path when done.")
+        parser.add_argument("--skip-memory", action="store_true", help="Time without tracemalloc, which slows Python-heavy migrations.")
+        parser.add_argument("--max-seconds", type=float, help="Fail if any migration takes longer than this.")
+        parser.add_argument("--max-memory-mb", type=float, help="Fail if any migration's peak memory exceeds this.")
+
+    def handle(self, *args, **options):
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor != "sqlite":
+            raise CommandError("The migration benchmark only supports SQLite databases.")
+        if options["database"] and not Path(options["database"]).exists():
+            raise CommandError(f"Database file not found: {options['database']}")
+
+        original_name = connection.settings_dict["NAME"]
+        workdir = Path(tempfile.mkdtemp(prefix="migration-benchmark-"))
+        path = workdir / "benchmark.sqlite3"
+        try:
+            if options["database"]:
+                copy_database(options["database"], path)
+            self.use_database(connection, path)
+
+            if not options["database"]:
+                call_command("migrate", verbosity=0)
+                call_command(
+                    "generate_fixture", users=options["users"], logs_per_user=options["logs_per_user"],
+                    hydration_per_user=options["hydration_per_user"], seed=options["seed"], stdout=self.stdout,
+                )
+            call_command("migrate", APP_LABEL, options["start"], verbosity=0)
+
+            rows = self.count_rows(connection)
+            self.stdout.write("Dataset: " + ", ".join(f"{table}={count}" for table, count in rows.items()))
+            results = self.run_migrations(connection, trace_memory=not options["skip_memory"])
+
+            if options["keep"]:
+                connection.close()
+                copy_database(path, options["keep"])
+        finally:
+            self.use_database(connection, original_name)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        total = sum(result["seconds"] for result in results)
+        self.stdout.write(f"Total: {total:.2f}s for {len(results)} migration(s).")
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps({"rows": rows, "total_seconds": round(total, 3), "migrations": results}, indent=2))
+
+        failures = [
+            result["migration"] for result in results
+            if (options["max_seconds"] is not None and result["seconds"] > options["max_seconds"])
+            or (options["max_memory_mb"] is not None and (result["peak_memory_mb"] or 0) > options["max_memory_mb"])
+        ]
+        if failures:
+            raise CommandError(f"Migrations over budget: {', '.join(failures)}")
+
+    def use_database(self, connection, name):
+        connection.close()
+        connection.settings_dict["NAME"] = str(name)
+
+    def count_rows(self, connection):
+        counts = {}
+        with connection.cursor() as cursor:
+            tables = set(connection.introspection.table_names(cursor))
+            for table in COUNTED_TABLES:
+                if table in tables:
+                    cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+                    counts[table] = cursor.fetchone()[0]
+        return counts
+
+    def run_migrations(self, connection, trace_memory=True):
+        loader = MigrationExecutor(connection).loader
+        plan = [
+            key for leaf in loader.graph.leaf_nodes(APP_LABEL) for key in loader.graph.forwards_plan(leaf)
+            if key[0] == APP_LABEL and key not in loader.applied_migrations
+        ]
+
+        results = []
+        for key in plan:
+            executor = MigrationExecutor(connection)
+            if trace_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            executor.migrate([key])
+            seconds = time.perf_counter() - started
+            peak = None
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+
+            results.append({"migration": key[1], "seconds": round(seconds, 3), "peak_memory_mb": None if peak is None else round(peak, 1)})
+            memory = "" if peak is None else f"  peak {peak:8.1f} MB"
+            self.stdout.write(f"{key[1]:<55} {seconds:8.2f}s{memory}")
+        return results
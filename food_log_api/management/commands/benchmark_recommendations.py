@@ -0,0 +1,93 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from food_log_api.models import FoodLog, FoodPreference
+from food_log_api.recommendations import log_features, reset_vectors, user_vectors
+from food_log_api.views.recommendations import recommendations
+
+INGREDIENTS = ["chicken", "rice", "broccoli", "egg", "cheese", "tofu", "beans", "oats", "milk", "peanut", "bread", "spinach"]
+CATEGORIES = ["breakfast", "lunch", "dinner", "snack"]
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Measure /api/recommendations/ latency against per-user feature vectors and fail if it exceeds the budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logs", type=int, default=20_000)
+        parser.add_argument("--foods", type=int, default=500)
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--budget-ms", type=float, default=10.0)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                p95 = self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+        reset_vectors()
+
+        if p95 > options["budget_ms"]:
+            raise CommandError(f"p95 ranking latency {p95:.2f} ms exceeds the {options['budget_ms']:.1f} ms budget.")
+
+    def run(self, options):
+        user = User.objects.create(username="__benchmark_recommendations__")
+        FoodPreference.objects.create(user=user, vegetarian=True, calorie_target=4000, excluded_ingredients=["peanut"])
+
+        # Four meals a day, ending now, so today's intake stays under the calorie target.
+        step = timedelta(hours=6)
+        start = timezone.now() - step * options["logs"]
+        foods = [
+            (f"food {i}", random.choice(CATEGORIES), random.sample(INGREDIENTS, 3), random.randint(5, 90), random.randint(1, 5))
+            for i in range(max(1, options["foods"]))
+        ]
+        logs = []
+        for i in range(options["logs"]):
+            name, category, ingredients, cooking_time, rating = random.choice(foods)
+            food_log = FoodLog(
+                user=user, user_food_id=i + 1, food_name=name, serving_size="1", category=category,
+                calories=random.randint(100, 900), cooking_time=cooking_time, rating=rating,
+                timestamp=start + step * i,
+            )
+            food_log.ingredients = ingredients
+            logs.append(food_log)
+        FoodLog.objects.bulk_create(logs, batch_size=5000)
+        user = User.objects.get(pk=user.pk)
+
+        reset_vectors()
+        started = time.perf_counter()
+        vectors = user_vectors(user, timezone.get_current_timezone())
+        self.stdout.write(f"build from {options['logs']} logs: {(time.perf_counter() - started) * 1000:.1f} ms ({len(vectors.names)} foods)")
+
+        started = time.perf_counter()
+        for food_log in logs[:1000]:
+            vectors.apply(log_features(food_log), 1)
+        self.stdout.write(f"incremental update: {(time.perf_counter() - started) / min(1000, len(logs)) * 1e6:.1f} us/write")
+
+        factory = APIRequestFactory()
+        timings = []
+        for _ in range(options["requests"]):
+            request = factory.get("/api/recommendations/", {"max_cooking_time": 45, "include_catalog": "true"})
+            force_authenticate(request, user=user)
+            user._state.fields_cache.clear()
+            started = time.perf_counter()
+            response = recommendations(request)
+            timings.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.data
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(f"ranking request: p50 {statistics.median(timings):.2f} ms, p95 {p95:.2f} ms, {len(response.data['recommendations'])} results")
+        return p95
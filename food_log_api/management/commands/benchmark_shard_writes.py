@@ -0,0 +1,72 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from food_log_api.models import FoodLog, UserShard
+from food_log_api.sharding import shard_aliases, user_context
+from food_log_api.stats import init_worker
+
+USERNAME_PREFIX = "__benchmark_shard_writes_"
+
+
+def write_logs(task):
+    user_id, writes = task
+    user = User.objects.get(pk=user_id)
+    started = time.perf_counter()
+    with user_context(user) as using:
+        for i in range(writes):
+            # One transaction per write, like the create-log endpoints.
+            with transaction.atomic(using=using):
+                FoodLog.objects.create(
+                    user=user, food_name=f"Benchmark meal {i % 20}", serving_size="1 plate", category="lunch",
+                    calories=500, cooking_time=15, rating=4,
+                )
+    connections.close_all()
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure concurrent food-log write throughput with all writers on one database versus spread "
+        "across every alias in USER_SHARDS. Each SQLite file has its own writer lock."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8, help="Concurrent writer processes, one user each.")
+        parser.add_argument("--writes", type=int, default=200, help="Food logs written per worker.")
+
+    def handle(self, *args, **options):
+        aliases = shard_aliases()
+        if len(aliases) < 2:
+            raise CommandError("Configure at least two databases in USER_SHARDS to compare write throughput.")
+        workers = max(1, options["workers"])
+
+        results = {}
+        for label, targets in (("1 database", aliases[:1]), (f"{len(aliases)} databases", aliases)):
+            users = self.create_users(workers, targets)
+            try:
+                connections.close_all()
+                with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                    # Timed inside the workers so process start-up and django.setup() are not counted.
+                    elapsed = max(pool.map(write_logs, [(user.pk, options["writes"]) for user in users]))
+            finally:
+                for user in users:
+                    user.delete()
+
+            results[label] = workers * options["writes"] / elapsed
+            self.stdout.write(f"{label:<14} {results[label]:10,.0f} writes/s ({workers} writers, {elapsed:.2f}s)")
+
+        single, spread = results.values()
+        self.stdout.write(f"Speed-up from sharding: {spread / single:.2f}x")
+
+    def create_users(self, count, aliases):
+        for user in User.objects.filter(username__startswith=USERNAME_PREFIX):
+            user.delete()
+        users = User.objects.bulk_create([User(username=f"{USERNAME_PREFIX}{i}") for i in range(count)])
+        UserShard.objects.bulk_create([
+            UserShard(user=user, alias=aliases[i % len(aliases)]) for i, user in enumerate(users)
+        ])
+        return users
@@ -0,0 +1,56 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.test import APIRequestFactory
+
+from food_log_api.serializers import FoodLogCreateSerializer, HydrationLogCreateSerializer
+
+FOOD_ITEM = {
+    "food_name": "Chicken salad",
+    "category": "lunch",
+    "calories": 450,
+    "ingredients": ["chicken", "lettuce", "tomato", "olive oil", "cheese"],
+    "serving_size": "1 plate",
+    "cooking_time": 15,
+    "rating": 4,
+    "review": "Fresh",
+}
+HYDRATION_ITEM = {"amount": 250, "beverage_type": "water", "timestamp": "2024-05-01T08:30:00Z"}
+
+
+class Command(BaseCommand):
+    help = "Measure per-item validation cost of the food and hydration create serializers, one at a time and in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=2000)
+        parser.add_argument("--username", help="User whose preferences drive the warning checks. Defaults to the first user.")
+
+    def handle(self, *args, **options):
+        users = User.objects.order_by("id")
+        user = users.filter(username=options["username"]).first() if options["username"] else users.first()
+        if user is None:
+            raise CommandError("No user found to validate against.")
+
+        request = APIRequestFactory().post("/")
+        request.user = user
+        count = max(1, options["items"])
+
+        for name, serializer_class, item in (
+            ("food", FoodLogCreateSerializer, FOOD_ITEM),
+            ("hydration", HydrationLogCreateSerializer, HYDRATION_ITEM),
+        ):
+            items = [dict(item) for _ in range(count)]
+
+            started = time.perf_counter()
+            for data in items:
+                serializer = serializer_class(data=data, context={"request": request})
+                assert serializer.is_valid(), serializer.errors
+            single = (time.perf_counter() - started) / count
+
+            started = time.perf_counter()
+            serializer = serializer_class(data=items, many=True, context={"request": request})
+            assert serializer.is_valid(), serializer.errors
+            bulk = (time.perf_counter() - started) / count
+
+            self.stdout.write(f"{name:<10} single: {single * 1e6:8.1f} us/item   bulk: {bulk * 1e6:8.1f} us/item")
@@ -0,0 +1,196 @@
+import json
+import re
+import sqlite3
+from collections import Counter
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from food_log_api.filters import local_today, user_timezone
+from food_log_api.models import MealTemplate
+
+SNAPSHOT = Path(__file__).resolve().parents[2] / "data" / "query_plans.json"
+FIXTURE_USERS = 40
+FIXTURE_LOGS = 500
+FIXTURE_PREFIX = "query_plans_"
+
+FOOD = {
+    "food_name": "Chicken salad", "serving_size": "1 plate", "calories": 450, "category": "lunch",
+    "cooking_time": 15, "rating": 4, "review": "Fresh", "ingredients": ["chicken", "lettuce", "tomato"],
+}
+
+# Writes run after the reads that depend on the same rows, and the clears run last.
+CASES = [
+    ("list_food_logs", "GET", "/api/list-food-logs/", {}),
+    ("query_food_logs", "GET", "/api/food-logs/query/", {"category": "lunch", "min_rating": 3, "ordering": "-timestamp"}),
+    ("food_log_details", "GET", "/api/food-log-details/1/", {}),
+    ("food_log_details_bulk", "GET", "/api/food-log-details/", {"ids": "1,2,3,250"}),
+    ("filter_food_category", "GET", "/api/filter-food-category/", {"category": "dinner"}),
+    ("filter_food_date", "GET", "/api/filter-food-date/", {"dateFrom": "{week_ago}", "dateTo": "{today}"}),
+    ("filter_food_by_rating", "GET", "/api/filter-food-by-rating/", {"min_rating": 4}),
+    ("food_cooking_time", "GET", "/api/food-cooking-time/", {"min_time": 5, "max_time": 30}),
+    ("search_food", "GET", "/api/search-food/", {"query": "chicken"}),
+    ("autocomplete_foods", "GET", "/api/foods/autocomplete/", {"q": "chi"}),
+    ("daily_summary", "GET", "/api/daily-summary/", {}),
+    ("nutritional_insights", "GET", "/api/nutritional-insights/", {}),
+    ("trends", "GET", "/api/trends/", {}),
+    ("recommendations", "GET", "/api/recommendations/", {"include_catalog": "true"}),
+    ("calorie_compliance", "GET", "/api/calorie-compliance/", {"days": 30}),
+    ("hydration_today", "GET", "/api/hydration/today/", {}),
+    ("list_hydration_logs", "GET", "/api/list-hydration-logs/", {}),
+    ("list_food_preferences", "GET", "/api/list-food-preferences/", {}),
+    ("meal_templates", "GET", "/api/templates/", {}),
+    ("population_stats", "GET", "/api/admin/stats/", {}),
+    ("log_food", "POST", "/api/log-food/", FOOD),
+    ("edit_food", "PUT", "/api/edit-food/2/", {"calories": 500, "rating": 5}),
+    ("remove_food", "DELETE", "/api/remove-food/3/", {}),
+    ("log_hydration", "POST", "/api/log-hydration/", {"amount": 300, "beverage_type": "water"}),
+    ("edit_hydration", "PUT", "/api/edit-hydration/2/", {"amount": 400}),
+    ("remove_hydration", "DELETE", "/api/remove-hydration/3/", {}),
+    ("set_food_preferences", "POST", "/api/set-food-preferences/", {"calorie_target": 2200, "excluded_ingredients": ["onion"]}),
+    ("log_meal_template", "POST", "/api/templates/{template_id}/log/", {}),
+    ("remove_meal_template", "DELETE", "/api/templates/{template_id}/", {}),
+    ("clear_food_logs", "DELETE", "/api/clear-food-logs/", {}),
+    ("clear_hydration_logs", "DELETE", "/api/clear-hydration-logs/", {}),
+]
+
+EXPLAINED = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW|SUBQUERY|\()")
+LITERALS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\((?:\?, )+\?\)"), "(?...)"),
+    (re.compile(r"^SELECT (DISTINCT )?.*? FROM ", re.S), r"SELECT \1... FROM "),
+]
+
+
+def normalize_sql(sql):
+    for pattern, replacement in LITERALS:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        rows = cursor.fetchall()
+
+    depth = {0: -1}
+    lines = []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return lines
+
+
+def full_scans(queries):
+    return Counter(line.strip() for query in queries for line in query["plan"] if FULL_SCAN.match(line.strip()))
+
+
+def read_snapshot():
+    return json.loads(SNAPSHOT.read_text())
+
+
+def write_snapshot(plans):
+    SNAPSHOT.write_text(json.dumps({"sqlite_version": sqlite3.sqlite_version, "endpoints": plans}, indent=2) + "\n")
+
+
+def format_plans(name, queries):
+    lines = [name]
+    for query in queries:
+        lines.append(f"  {query['sql']} (x{query['count']})")
+        lines.extend(f"    {line}" for line in query["plan"])
+    return lines
+
+
+def compare_plans(plans, snapshot):
+    report = []
+    for name, queries in plans.items():
+        expected = snapshot["endpoints"].get(name)
+        if expected is None:
+            report.append(f"{name}: not in the snapshot")
+            continue
+
+        added = full_scans(queries) - full_scans(expected)
+        removed = full_scans(expected) - full_scans(queries)
+        if added or removed:
+            report.extend(f"{name}: new full scan: {detail}" for detail in added.elements())
+            report.extend(f"{name}: full scan no longer used: {detail}" for detail in removed.elements())
+            report.extend(format_plans(name, queries))
+    return report
+
+
+def capture_plans():
+    call_command("load_food_catalog", stdout=StringIO())
+    call_command(
+        "generate_fixture", users=FIXTURE_USERS, logs_per_user=FIXTURE_LOGS, days=365, seed=50,
+        prefix=FIXTURE_PREFIX, stdout=StringIO(),
+    )
+    call_command("compute_stats", stdout=StringIO())
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    user = User.objects.get(username=f"{FIXTURE_PREFIX}1")
+    user.is_staff = True
+    user.save(update_fields=["is_staff"])
+    template = MealTemplate.objects.create(
+        user=user, name="Lunch salad", food_name="Chicken salad", serving_size="1 plate", calories=450, repeat_days="01234",
+    )
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    today = local_today(user_timezone(user))
+    context = {"template_id": template.pk, "today": today.isoformat(), "week_ago": (today - timedelta(days=6)).isoformat()}
+
+    plans = {}
+    for name, method, path, data in CASES:
+        path = path.format(**context)
+        data = {key: value.format(**context) if isinstance(value, str) else value for key, value in data.items()}
+        with CaptureQueriesContext(connection) as captured:
+            if method == "GET":
+                response = client.get(path, data)
+            else:
+                response = getattr(client, method.lower())(path, data, format="json")
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name} returned {response.status_code}: {getattr(response, 'data', None)}")
+
+        # Repeated statements (N+1 lookups) are stored once with a count, so the snapshot does not track row counts.
+        shapes = {}
+        for query in captured.captured_queries:
+            if not query["sql"].lstrip().upper().startswith(EXPLAINED):
+                continue
+            sql = normalize_sql(query["sql"])
+            if sql not in shapes:
+                shapes[sql] = {"sql": sql, "plan": explain(query["sql"]), "count": 0}
+            shapes[sql]["count"] += 1
+        plans[name] = [shape for shape in shapes.values() if shape["plan"]]
+    return plans
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite the query plan snapshot checked by QueryPlanTests. The plans are captured by running that test "
+        "against the test database with QUERY_PLANS_UPDATE set."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--update", action="store_true", help="Rewrite the snapshot with the current plans.")
+
+    def handle(self, *args, **options):
+        if not options["update"]:
+            raise CommandError(
+                "Query plans are checked by `manage.py test food_log_api.tests.QueryPlanTests`; "
+                "pass --update to rewrite the snapshot."
+            )
+        with override_settings(QUERY_PLANS_UPDATE=True):
+            call_command("test", "food_log_api.tests.QueryPlanTests", verbosity=0)
+        snapshot = read_snapshot()
+        scans = sum(sum(full_scans(queries).values()) for queries in snapshot["endpoints"].values())
+        self.stdout.write(f"Wrote plans for {len(snapshot['endpoints'])} endpoint(s) with {scans} accepted full scan(s) to {SNAPSHOT}.")
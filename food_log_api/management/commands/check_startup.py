@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_STARTUP_BUDGET = {
+    "IMPORT_MS": 600,
+    "FIRST_REQUEST_MS": 1000,
+    "FIRST_REQUEST_PATH": "/api/list-hydration-logs/",
+    "DEFERRED_MODULES": [],
+}
+
+PROBE = """
+import io, json, sys, time
+started = time.perf_counter()
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "", "SERVER_NAME": "localhost",
+    "SERVER_PORT": "80", "SERVER_PROTOCOL": "HTTP/1.1", "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(),
+    "wsgi.errors": io.StringIO(),
+}
+application(environ, lambda status, headers, exc_info=None: None)
+done = time.perf_counter()
+print(json.dumps({
+    "setup_ms": (ready - started) * 1000,
+    "first_request_ms": (done - started) * 1000,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def startup_budget():
+    return {**DEFAULT_STARTUP_BUDGET, **getattr(settings, "STARTUP_BUDGET", {})}
+
+
+def parse_importtime(stderr):
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_startup(budget, runs=3):
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "food_log.settings")}
+    samples = []
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE, budget["FIRST_REQUEST_PATH"]],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise RuntimeError(f"Startup probe failed:\n{result.stderr[-2000:]}")
+        samples.append((json.loads(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)))
+
+    # The fastest cold start is the least disturbed by whatever else the machine is doing.
+    probe, modules = min(samples, key=lambda sample: sample[0]["first_request_ms"])
+    import_ms = sum(self_us for self_us, _ in modules.values()) / 1000
+    return probe, modules, import_ms
+
+
+def startup_failures(budget, probe, import_ms):
+    failures = []
+    if import_ms > budget["IMPORT_MS"]:
+        failures.append(f"import time {import_ms:.1f} ms exceeds {budget['IMPORT_MS']} ms")
+    if probe["first_request_ms"] > budget["FIRST_REQUEST_MS"]:
+        failures.append(f"time to first request {probe['first_request_ms']:.1f} ms exceeds {budget['FIRST_REQUEST_MS']} ms")
+    loaded = set(probe["modules"])
+    failures.extend(f"{module} is imported at startup" for module in budget["DEFERRED_MODULES"] if module in loaded)
+    return failures
+
+
+class Command(BaseCommand):
+    help = "Measure cold-start import time and time to first request with -X importtime, and fail if over budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=3, help="Cold starts to sample; the fastest run is reported.")
+        parser.add_argument("--top", type=int, default=15, help="Slowest project-level imports to list.")
+
+    def handle(self, *args, **options):
+        budget = startup_budget()
+        try:
+            probe, modules, import_ms = measure_startup(budget, options["runs"])
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f"imports:        {import_ms:8.1f} ms ({len(modules)} modules, budget {budget['IMPORT_MS']} ms)")
+        self.stdout.write(f"setup:          {probe['setup_ms']:8.1f} ms")
+        self.stdout.write(
+            f"first request:  {probe['first_request_ms']:8.1f} ms (budget {budget['FIRST_REQUEST_MS']} ms, "
+            f"{budget['FIRST_REQUEST_PATH']})"
+        )
+
+        roots = sorted(
+            ((name, cumulative) for name, (_, cumulative) in modules.items() if "." not in name),
+            key=lambda item: item[1], reverse=True,
+        )[:options["top"]]
+        for name, cumulative_us in roots:
+            self.stdout.write(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+        failures = startup_failures(budget, probe, import_ms)
+        if failures:
+            raise CommandError("Startup budget exceeded: " + "; ".join(failures))
+        self.stdout.write(self.style.SUCCESS("Startup is within budget."))
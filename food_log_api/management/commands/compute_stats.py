@@ -0,0 +1,46 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from food_log_api.models import PopulationStats
+from food_log_api.sharding import shard_aliases
+from food_log_api.stats import compute_shard, init_worker, merge_partials, shard_ranges, summarize
+
+
+class Command(BaseCommand):
+    help = "Compute population-level food and hydration statistics across all users."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--shard-size", type=int, default=1000, help="Users per shard.")
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows fetched per database round trip.")
+        parser.add_argument("--top", type=int, default=20, help="Number of top foods to keep.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        user_ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        # Each user's rows live on exactly one database, so ranges are scanned once per database.
+        shards = shard_ranges(user_ids, max(1, options["shard_size"]), shard_aliases())
+        worker = partial(compute_shard, chunk_size=options["chunk_size"])
+        workers = max(1, min(options["workers"], len(shards)))
+
+        if workers == 1:
+            partials = [worker(shard) for shard in shards]
+        else:
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                partials = list(pool.map(worker, shards))
+
+        summary = summarize(merge_partials(partials), top=options["top"])
+        stats = PopulationStats.objects.create(user_count=len(user_ids), **summary)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Computed stats for {stats.user_count} users, {stats.food_log_count} food logs and "
+            f"{stats.hydration_log_count} hydration logs across {len(shards)} shard(s) with {workers} worker(s) "
+            f"in {time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,27 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from food_log_api.user_export import export_user
+
+
+class Command(BaseCommand):
+    help = "Export one user's food, hydration and preference rows (including archived logs) to a compressed file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument("path", help="File to write, e.g. alice.flux.gz")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"No user named {options['username']!r}.")
+
+        started = time.perf_counter()
+        with open(options["path"], "wb") as fileobj:
+            counts = export_user(user, fileobj)
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {counts['food']} food log(s), {counts['hydration']} hydration log(s) and "
+            f"{counts['preferences']} preference row(s) for {user.username} in {time.perf_counter() - started:.2f}s."
+        ))
@@ -0,0 +1,194 @@
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from food_log_api.filters import get_timezone, local_day
+from food_log_api.ingredients import encode_ingredients
+from food_log_api.models import DailyCalorieTotal, DailyHydrationTotal, FoodLog, FoodPreference, HydrationLog
+from food_log_api.sharding import assign_shards
+
+MEALS = [
+    ("Oatmeal with berries", "breakfast", "1 bowl", 320, ["oats", "milk", "blueberries"], 10),
+    ("Scrambled eggs on toast", "breakfast", "2 eggs", 390, ["egg", "bread", "butter"], 10),
+    ("Greek yogurt parfait", "breakfast", "1 cup", 280, ["yogurt", "granola", "honey"], 5),
+    ("Avocado toast", "breakfast", "2 slices", 350, ["bread", "avocado", "olive oil"], 5),
+    ("Banana smoothie", "breakfast", "1 glass", 250, ["banana", "milk", "peanut butter"], 5),
+    ("Chicken salad", "lunch", "1 plate", 450, ["chicken", "lettuce", "tomato", "olive oil"], 15),
+    ("Turkey sandwich", "lunch", "1 sandwich", 480, ["turkey", "bread", "cheese", "lettuce"], 5),
+    ("Lentil soup", "lunch", "1 bowl", 360, ["lentils", "carrots", "onion"], 40),
+    ("Tuna rice bowl", "lunch", "1 bowl", 540, ["tuna", "rice", "cucumber", "soy sauce"], 20),
+    ("Quinoa salad", "lunch", "1 bowl", 420, ["quinoa", "chickpeas", "spinach", "feta"], 20),
+    ("Spaghetti bolognese", "dinner", "1 plate", 680, ["pasta", "beef", "tomato", "onion"], 35),
+    ("Salmon with potatoes", "dinner", "1 fillet", 620, ["salmon", "potatoes", "butter"], 30),
+    ("Tofu stir fry", "dinner", "1 plate", 510, ["tofu", "broccoli", "rice", "soy sauce"], 20),
+    ("Chicken curry", "dinner", "1 bowl", 640, ["chicken", "rice", "cream", "onion"], 45),
+    ("Bean chili", "dinner", "1 bowl", 470, ["beans", "tomato", "corn", "onion"], 50),
+    ("Apple", "snack", "1 medium", 95, ["apple"], 0),
+    ("Almonds", "snack", "1 handful", 164, ["almonds"], 0),
+    ("Cheese and crackers", "snack", "1 plate", 230, ["cheese", "crackers"], 0),
+    ("Protein bar", "snack", "1 bar", 210, ["whey", "oats", "peanut"], 0),
+]
+MEAL_HOURS = {"breakfast": (6, 10), "lunch": (11, 14), "dinner": (17, 21), "snack": (9, 22)}
+BEVERAGES = [("water", 200, 750), ("water", 200, 750), ("coffee", 150, 350), ("tea", 200, 400), ("juice", 150, 300)]
+TIMEZONES = ["UTC", "America/New_York", "America/Los_Angeles", "Europe/London", "Europe/Berlin", "Asia/Tokyo", "Australia/Sydney"]
+REVIEWS = ["Tasty", "Too salty", "Would eat again", "A bit bland", "Quick and easy"]
+
+
+class Command(BaseCommand):
+    help = "Generate realistic users with food logs, hydration logs and preferences for scale and migration testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, required=True)
+        parser.add_argument("--logs-per-user", type=int, required=True)
+        parser.add_argument("--hydration-per-user", type=int, help="Defaults to --logs-per-user.")
+        parser.add_argument("--days", type=int, default=365, help="Spread logs over this many days before now.")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="Rows per bulk_create batch.")
+        parser.add_argument("--prefix", default="fixture_user_")
+        parser.add_argument("--password", default="fixture-password")
+        parser.add_argument("--seed", type=int)
+
+    def handle(self, *args, **options):
+        users, logs_per_user = options["users"], options["logs_per_user"]
+        hydration_per_user = options["hydration_per_user"]
+        if hydration_per_user is None:
+            hydration_per_user = logs_per_user
+        if users < 1 or logs_per_user < 0 or hydration_per_user < 0 or options["days"] < 1:
+            raise CommandError("--users and --days must be positive and log counts cannot be negative.")
+
+        self.random = random.Random(options["seed"])
+        self.now = timezone.now()
+        self.days = options["days"]
+        self.meals = [(*meal, encode_ingredients(meal[4])) for meal in MEALS]
+        password = make_password(options["password"])
+
+        prefix = options["prefix"]
+        offset = User.objects.filter(username__startswith=prefix).count()
+        chunk_size = max(1, options["chunk_size"])
+        users_per_chunk = max(1, chunk_size // max(1, logs_per_user + hydration_per_user))
+
+        started = time.perf_counter()
+        totals = Counter()
+        for first in range(0, users, users_per_chunk):
+            count = min(users_per_chunk, users - first)
+            with transaction.atomic():
+                created = User.objects.bulk_create([
+                    User(username=f"{prefix}{offset + first + i + 1}", password=password)
+                    for i in range(count)
+                ])
+                for alias, shard_users in assign_shards(created).items():
+                    with transaction.atomic(using=alias):
+                        totals += self.populate(shard_users, logs_per_user, hydration_per_user, chunk_size, alias)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{first + count}/{users} users")
+
+        elapsed = time.perf_counter() - started
+        rows = sum(totals.values())
+        self.stdout.write(
+            f"Generated {users} users, {totals['food']} food logs, {totals['hydration']} hydration logs and "
+            f"{totals['preferences']} preferences in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)."
+        )
+
+    def populate(self, users, logs_per_user, hydration_per_user, chunk_size, using):
+        preferences = [self.preference(user) for user in users]
+        FoodPreference.objects.using(using).bulk_create(preferences, batch_size=chunk_size)
+
+        food_logs = []
+        hydration_logs = []
+        daily_ml = Counter()
+        daily_count = Counter()
+        daily_calories = Counter()
+        daily_meals = Counter()
+        for user, preference in zip(users, preferences):
+            tz = get_timezone(preference.timezone)
+            for food_log in self.food_logs(user, tz, logs_per_user):
+                food_logs.append(food_log)
+                key = (user.pk, local_day(food_log.timestamp, tz))
+                daily_calories[key] += food_log.calories
+                daily_meals[key] += 1
+            for hydration_log in self.hydration_logs(user, tz, hydration_per_user):
+                hydration_logs.append(hydration_log)
+                key = (user.pk, local_day(hydration_log.timestamp, tz))
+                daily_ml[key] += hydration_log.amount
+                daily_count[key] += 1
+
+        FoodLog.objects.using(using).bulk_create(food_logs, batch_size=chunk_size)
+        HydrationLog.objects.using(using).bulk_create(hydration_logs, batch_size=chunk_size)
+        DailyHydrationTotal.objects.using(using).bulk_create([
+            DailyHydrationTotal(user_id=user_id, date=day, total_ml=daily_ml[user_id, day], log_count=count)
+            for (user_id, day), count in daily_count.items()
+        ], batch_size=chunk_size)
+        DailyCalorieTotal.objects.using(using).bulk_create([
+            DailyCalorieTotal(user_id=user_id, date=day, total_calories=daily_calories[user_id, day], log_count=count)
+            for (user_id, day), count in daily_meals.items()
+        ], batch_size=chunk_size)
+
+        return Counter(food=len(food_logs), hydration=len(hydration_logs), preferences=len(preferences))
+
+    def preference(self, user):
+        rng = self.random
+        vegetarian = rng.random() < 0.15
+        return FoodPreference(
+            user=user,
+            vegetarian=vegetarian,
+            vegan=vegetarian and rng.random() < 0.3,
+            gluten_free=rng.random() < 0.05,
+            dairy_free=rng.random() < 0.05,
+            nut_free=rng.random() < 0.03,
+            calorie_target=rng.randrange(1600, 3000, 100) if rng.random() < 0.6 else None,
+            excluded_ingredients=rng.sample(["onion", "cream", "tuna", "honey", "soy sauce"], rng.randint(0, 2)),
+            timezone=rng.choice(TIMEZONES),
+            hydration_goal_ml=rng.randrange(1500, 3500, 250) if rng.random() < 0.5 else None,
+        )
+
+    def local_time(self, tz, hours):
+        rng = self.random
+        day = (self.now - timedelta(days=rng.randrange(self.days))).astimezone(tz).date()
+        moment = datetime(day.year, day.month, day.day, rng.randint(*hours), rng.randrange(60), tzinfo=tz)
+        return min(moment, self.now)
+
+    def food_logs(self, user, tz, count):
+        rng = self.random
+        meals = sorted(
+            ((self.local_time(tz, MEAL_HOURS[meal[1]]), meal) for meal in (rng.choice(self.meals) for _ in range(count))),
+            key=lambda item: item[0],
+        )
+        logs = []
+        for user_food_id, (timestamp, meal) in enumerate(meals, start=1):
+            name, category, serving, calories, _, cooking_time, ingredient_ids = meal
+            rated = rng.random() < 0.6
+            logs.append(FoodLog(
+                user=user,
+                user_food_id=user_food_id,
+                food_name=name,
+                serving_size=serving,
+                category=category,
+                calories=round(calories * rng.uniform(0.85, 1.15)),
+                ingredient_ids=ingredient_ids,
+                cooking_time=cooking_time or None,
+                rating=rng.randint(1, 5) if rated else None,
+                review=rng.choice(REVIEWS) if rated and rng.random() < 0.3 else None,
+                timestamp=timestamp,
+            ))
+        return logs
+
+    def hydration_logs(self, user, tz, count):
+        rng = self.random
+        timestamps = sorted(self.local_time(tz, (7, 22)) for _ in range(count))
+        logs = []
+        for user_hydration_id, timestamp in enumerate(timestamps, start=1):
+            beverage, low, high = rng.choice(BEVERAGES)
+            logs.append(HydrationLog(
+                user=user,
+                user_hydration_id=user_hydration_id,
+                amount=rng.randrange(low, high + 1, 50),
+                beverage_type=beverage,
+                timestamp=timestamp,
+            ))
+        return logs
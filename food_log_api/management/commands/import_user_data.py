@@ -0,0 +1,35 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from food_log_api.sharding import UserShardMoving
+from food_log_api.user_export import UserExportError, import_user
+
+
+class Command(BaseCommand):
+    help = (
+        "Restore a user's food, hydration and preference rows from an export_user_data file. By default only "
+        "logs missing from the account are added; --replace wipes the user's current rows first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("username", help="Account to restore into; it must already exist.")
+        parser.add_argument("--replace", action="store_true")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"No user named {options['username']!r}.")
+
+        started = time.perf_counter()
+        try:
+            with open(options["path"], "rb") as fileobj:
+                counts = import_user(fileobj, user, replace=options["replace"])
+        except (OSError, UserExportError, UserShardMoving) as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS(
+            f"Restored {counts['food']} food log(s), {counts['hydration']} hydration log(s) and "
+            f"{counts['preferences']} preference row(s) for {user.username} in {time.perf_counter() - started:.2f}s."
+        ))
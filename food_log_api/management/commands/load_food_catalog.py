@@ -0,0 +1,50 @@
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from food_log_api.catalog import MACRO_FIELDS, normalize, reset_index
+from food_log_api.models import CatalogFood
+
+DEFAULT_CATALOG = Path(__file__).resolve().parents[2] / "data" / "food_catalog.csv"
+
+
+class Command(BaseCommand):
+    help = "Load the food calorie/macro catalog from a CSV file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=str(DEFAULT_CATALOG))
+        parser.add_argument("--replace", action="store_true", help="Delete catalog entries missing from the file.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"Catalog file not found: {path}")
+
+        foods = []
+        with path.open(newline="", encoding="utf-8") as handle:
+            for line, row in enumerate(csv.DictReader(handle), start=2):
+                try:
+                    foods.append(CatalogFood(
+                        name=normalize(row["name"]),
+                        serving=row.get("serving", "").strip(),
+                        calories=int(row["calories"]),
+                        **{field: float(row.get(field) or 0) for field in MACRO_FIELDS},
+                    ))
+                except (KeyError, ValueError) as e:
+                    raise CommandError(f"Invalid catalog row on line {line}: {e}")
+
+        with transaction.atomic():
+            if options["replace"]:
+                CatalogFood.objects.exclude(name__in=[food.name for food in foods]).delete()
+            CatalogFood.objects.bulk_create(
+                foods,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=["name"],
+                update_fields=["serving", "calories", *MACRO_FIELDS],
+            )
+
+        reset_index()
+        self.stdout.write(self.style.SUCCESS(f"Loaded {len(foods)} catalog foods from {path}."))
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from food_log_api.meal_templates import materialize_templates
+
+
+class Command(BaseCommand):
+    help = "Create food logs for recurring meal templates up to today (in each user's time zone) or --through."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--through", help="Last date to materialize, YYYY-MM-DD.")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        through = None
+        if options["through"]:
+            through = parse_date(options["through"])
+            if through is None:
+                raise CommandError("Invalid --through date. Use YYYY-MM-DD.")
+
+        started = time.perf_counter()
+        created = materialize_templates(through=through, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Materialized {created} food log(s) from recurring templates in {time.perf_counter() - started:.2f}s."
+        ))
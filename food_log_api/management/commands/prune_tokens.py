@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted JWT refresh tokens in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now()
+        batch_size = max(1, options["batch_size"])
+        outstanding_deleted = blacklisted_deleted = batches = 0
+
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            ids = list(
+                OutstandingToken.objects.filter(expires_at__lt=cutoff)
+                .order_by("expires_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            with transaction.atomic():
+                blacklisted_deleted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+                outstanding_deleted += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+
+            batches += 1
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Pruned {outstanding_deleted} outstanding and {blacklisted_deleted} blacklisted token(s) "
+            f"in {batches} batch(es)."
+        ))
@@ -0,0 +1,62 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from food_log_api.models import UserShard
+from food_log_api.sharding import block_writes, get_ring, move_user, shard_aliases, unblock_writes
+
+
+class Command(BaseCommand):
+    help = (
+        "Move users whose data is not on the shard the consistent hash assigns them to, e.g. after adding a "
+        "database to USER_SHARDS. Writes for a user are refused while that user is being copied."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many users would move.")
+        parser.add_argument("--grace-seconds", type=float, default=2.0, help="Wait after blocking writes before copying.")
+        parser.add_argument("--users-per-pass", type=int, default=100, help="Users whose writes are blocked together.")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows copied per bulk insert.")
+        parser.add_argument("--limit", type=int, help="Move at most this many users in this run.")
+
+    def handle(self, *args, **options):
+        aliases = shard_aliases()
+        stale = UserShard.objects.exclude(alias__in=aliases).values_list("alias", flat=True).distinct()
+        if stale:
+            raise CommandError(f"Users are placed on databases missing from USER_SHARDS: {', '.join(sorted(stale))}")
+
+        ring = get_ring()
+        placements = dict(UserShard.objects.values_list("user_id", "alias"))
+        moves = [
+            (user_id, placements.get(user_id, DEFAULT_DB_ALIAS), ring.alias_for(user_id))
+            for user_id in User.objects.order_by("id").values_list("id", flat=True).iterator()
+        ]
+        moves = [move for move in moves if move[1] != move[2]][:options["limit"]]
+
+        self.stdout.write(f"{len(moves)} user(s) to move across {len(aliases)} database(s).")
+        if options["dry_run"] or not moves:
+            return
+
+        started = time.perf_counter()
+        rows = 0
+        per_pass = max(1, options["users_per_pass"])
+        for first in range(0, len(moves), per_pass):
+            batch = moves[first:first + per_pass]
+            user_ids = [user_id for user_id, _, _ in batch]
+            # One grace period per pass lets in-flight requests drain for the whole batch at once.
+            block_writes(user_ids)
+            try:
+                time.sleep(options["grace_seconds"])
+                for user_id, source, target in batch:
+                    rows += move_user(user_id, target, batch_size=options["batch_size"])
+                    if options["verbosity"] > 1:
+                        self.stdout.write(f"user {user_id}: {source} -> {target}")
+            finally:
+                unblock_writes(user_ids)
+            self.stdout.write(f"{first + len(batch)}/{len(moves)} users moved")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Moved {len(moves)} user(s) and {rows} row(s) in {time.perf_counter() - started:.1f}s."
+        ))
@@ -0,0 +1,117 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .compliance import apply_food_logs
+from .events import food_event_data, publish_event
+from .filters import get_timezone, local_today
+from .models import FoodLog, FoodPreference, MealTemplate
+from .preferences import PreferenceChecker
+from .recommendations import log_features, record_food_change
+from .sharding import UserShardMoving, shard_aliases, shard_for
+
+WEEKDAYS = "0123456"
+
+
+def template_warnings(template, checker=None):
+    if template.warnings is None:
+        checker = checker or PreferenceChecker.for_user(template.user)
+        template.warnings = checker.warnings(template.ingredients, template.calories)
+        MealTemplate.objects.using(template._state.db).filter(pk=template.pk).update(warnings=template.warnings)
+    return template.warnings
+
+
+def template_timestamp(template, day, tz):
+    clock = template.log_time or timezone.now().astimezone(tz).time()
+    return datetime.combine(day, clock, tz)
+
+
+def build_logs(template, days, tz, first_id):
+    return [
+        FoodLog(
+            user_id=template.user_id,
+            user_food_id=first_id + offset,
+            food_name=template.food_name,
+            serving_size=template.serving_size,
+            category=template.category,
+            calories=template.calories,
+            ingredient_ids=template.ingredient_ids,
+            cooking_time=template.cooking_time,
+            rating=template.rating,
+            review=template.review,
+            timestamp=template_timestamp(template, day, tz),
+        )
+        for offset, day in enumerate(days)
+    ]
+
+
+def announce_logs(user, logs):
+    for food_log in logs:
+        publish_event(user, "food.created", food_event_data(food_log))
+        record_food_change(user, new=log_features(food_log))
+
+
+def log_template(template, days, tz):
+    using = shard_for(template.user, for_write=True)
+    with transaction.atomic(using=using):
+        logs = build_logs(template, days, tz, FoodLog.next_user_food_id(template.user))
+        FoodLog.objects.using(using).bulk_create(logs)
+        apply_food_logs(template.user, logs, tz)
+        announce_logs(template.user, logs)
+    return logs
+
+
+def scheduled_days(template, through, tz):
+    if template.materialized_through:
+        start = template.materialized_through + timedelta(days=1)
+    else:
+        start = template.starts_on or template.created_at.astimezone(tz).date()
+    return [
+        start + timedelta(days=offset)
+        for offset in range((through - start).days + 1)
+        if str((start + timedelta(days=offset)).weekday()) in template.repeat_days
+    ]
+
+
+def materialize_templates(through=None, batch_size=500):
+    return sum(materialize_shard_templates(using, through, batch_size) for using in shard_aliases())
+
+
+def materialize_shard_templates(using, through=None, batch_size=500):
+    templates = defaultdict(list)
+    for template in MealTemplate.objects.using(using).exclude(repeat_days="").order_by("user_id", "id"):
+        templates[template.user_id].append(template)
+
+    users = User.objects.in_bulk(templates)
+    zones = dict(FoodPreference.objects.using(using).filter(user_id__in=templates).values_list("user_id", "timezone"))
+    created = 0
+
+    for user_id, user_templates in templates.items():
+        # Users being moved between shards, and rows a move left behind, are picked up by the next run.
+        try:
+            if user_id not in users or shard_for(users[user_id], for_write=True) != using:
+                continue
+        except UserShardMoving:
+            continue
+        tz = get_timezone(zones.get(user_id))
+        end = through or local_today(tz)
+
+        with transaction.atomic(using=using):
+            next_id = FoodLog.next_user_food_id(users[user_id])
+            logs = []
+            for template in user_templates:
+                days = scheduled_days(template, end, tz)
+                logs.extend(build_logs(template, days, tz, next_id))
+                next_id += len(days)
+                template.materialized_through = max(end, template.materialized_through or end)
+
+            FoodLog.objects.using(using).bulk_create(logs, batch_size=batch_size)
+            apply_food_logs(users[user_id], logs, tz)
+            announce_logs(users[user_id], logs)
+            MealTemplate.objects.using(using).bulk_update(user_templates, ["materialized_through"])
+        created += len(logs)
+
+    return created
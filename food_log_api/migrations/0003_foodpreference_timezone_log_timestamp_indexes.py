@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0002_foodlog_user_food_id_hydrationlog_user_hydration_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foodpreference',
+            name='timezone',
+            field=models.CharField(default='UTC', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='foodlog',
+            index=models.Index(fields=['user', 'timestamp'], name='foodlog_user_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hydrationlog',
+            index=models.Index(fields=['user', 'timestamp'], name='hydration_user_timestamp_idx'),
+        ),
+    ]
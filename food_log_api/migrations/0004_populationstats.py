@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0003_foodpreference_timezone_log_timestamp_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PopulationStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('computed_at', models.DateTimeField(auto_now_add=True)),
+                ('user_count', models.PositiveIntegerField(default=0)),
+                ('food_log_count', models.PositiveIntegerField(default=0)),
+                ('hydration_log_count', models.PositiveIntegerField(default=0)),
+                ('top_foods', models.JSONField(default=list)),
+                ('calories_by_category', models.JSONField(default=dict)),
+                ('hydration_by_beverage', models.JSONField(default=dict)),
+            ],
+            options={
+                'get_latest_by': 'computed_at',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0004_populationstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogFood',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('serving', models.CharField(blank=True, max_length=100)),
+                ('calories', models.PositiveIntegerField()),
+                ('protein_g', models.FloatField(default=0)),
+                ('carbs_g', models.FloatField(default=0)),
+                ('fat_g', models.FloatField(default=0)),
+                ('fiber_g', models.FloatField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0005_catalogfood'),
+        ('token_blacklist', '0013_alter_blacklistedtoken_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS token_blacklist_outstanding_expires_at_idx "
+                "ON token_blacklist_outstandingtoken (expires_at)",
+            reverse_sql="DROP INDEX IF EXISTS token_blacklist_outstanding_expires_at_idx",
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:10
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def pack(ingredient_ids):
+    return "," + ",".join(map(str, ingredient_ids)) + "," if ingredient_ids else ""
+
+
+def intern_existing_ingredients(apps, schema_editor):
+    FoodLog = apps.get_model('food_log_api', 'FoodLog')
+    Ingredient = apps.get_model('food_log_api', 'Ingredient')
+    ids_by_name = dict(Ingredient.objects.values_list('name', 'id'))
+
+    last_id = 0
+    while True:
+        rows = list(
+            FoodLog.objects.filter(id__gt=last_id).order_by('id').values_list('id', 'ingredients')[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        new_names = {
+            str(name)
+            for _, names in rows if isinstance(names, list)
+            for name in names
+            if str(name) not in ids_by_name
+        }
+        if new_names:
+            Ingredient.objects.bulk_create([Ingredient(name=name) for name in new_names], ignore_conflicts=True)
+            ids_by_name.update(Ingredient.objects.filter(name__in=new_names).values_list('name', 'id'))
+
+        updates = []
+        for food_log_id, names in rows:
+            if names is None:
+                continue
+            if not isinstance(names, list):
+                names = [names]
+            updates.append(FoodLog(id=food_log_id, ingredient_ids=pack([ids_by_name[str(name)] for name in names])))
+        FoodLog.objects.bulk_update(updates, ['ingredient_ids'], batch_size=500)
+
+
+def restore_ingredient_lists(apps, schema_editor):
+    FoodLog = apps.get_model('food_log_api', 'FoodLog')
+    Ingredient = apps.get_model('food_log_api', 'Ingredient')
+    names_by_id = dict(Ingredient.objects.values_list('id', 'name'))
+
+    last_id = 0
+    while True:
+        rows = list(
+            FoodLog.objects.filter(id__gt=last_id).order_by('id').values_list('id', 'ingredient_ids')[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        updates = [
+            FoodLog(id=food_log_id, ingredients=[names_by_id[int(value)] for value in packed.strip(',').split(',') if value])
+            for food_log_id, packed in rows
+            if packed is not None
+        ]
+        FoodLog.objects.bulk_update(updates, ['ingredients'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0006_outstandingtoken_expires_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Ingredient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='foodlog',
+            name='ingredient_ids',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.RunPython(intern_existing_ingredients, restore_ingredient_lists),
+        migrations.RemoveField(
+            model_name='foodlog',
+            name='ingredients',
+        ),
+    ]
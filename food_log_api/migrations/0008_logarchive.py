@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0007_ingredient_interning'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('food', 'Food'), ('hydration', 'Hydration')], max_length=20)),
+                ('year', models.PositiveIntegerField()),
+                ('table_name', models.CharField(max_length=100, unique=True)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('archived_before', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'year')},
+            },
+        ),
+    ]
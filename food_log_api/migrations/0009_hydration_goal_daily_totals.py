@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:13
+
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+def archived_hydration_rows(connection, table_names):
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for table_name in table_names:
+            cursor.execute(f"SELECT user_id, timestamp, amount FROM {quote(table_name)}")
+            for user_id, timestamp, amount in cursor.fetchall():
+                if not isinstance(timestamp, datetime):
+                    timestamp = parse_datetime(timestamp)
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=dt_timezone.utc)
+                yield user_id, timestamp, amount
+
+
+def backfill_daily_hydration_totals(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    HydrationLog = apps.get_model('food_log_api', 'HydrationLog')
+    FoodPreference = apps.get_model('food_log_api', 'FoodPreference')
+    LogArchive = apps.get_model('food_log_api', 'LogArchive')
+    DailyHydrationTotal = apps.get_model('food_log_api', 'DailyHydrationTotal')
+
+    zones = {}
+    for user_id, name in FoodPreference.objects.using(alias).values_list('user_id', 'timezone'):
+        try:
+            zones[user_id] = ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    default_zone = ZoneInfo(settings.TIME_ZONE)
+
+    totals = defaultdict(lambda: [0, 0])
+    archives = LogArchive.objects.using(alias).filter(kind='hydration').values_list('table_name', flat=True)
+    live = HydrationLog.objects.using(alias).order_by().values_list('user_id', 'timestamp', 'amount').iterator(chunk_size=2000)
+    for rows in (archived_hydration_rows(schema_editor.connection, list(archives)), live):
+        for user_id, timestamp, amount in rows:
+            day = timestamp.astimezone(zones.get(user_id, default_zone)).date()
+            total = totals[(user_id, day)]
+            total[0] += amount
+            total[1] += 1
+
+    DailyHydrationTotal.objects.using(alias).bulk_create(
+        [
+            DailyHydrationTotal(user_id=user_id, date=day, total_ml=total_ml, log_count=log_count)
+            for (user_id, day), (total_ml, log_count) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0008_logarchive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foodpreference',
+            name='hydration_goal_ml',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='DailyHydrationTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('total_ml', models.IntegerField(default=0)),
+                ('log_count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'date')},
+            },
+        ),
+        # The hint lets the shard router run the backfill on every database that holds hydration logs.
+        migrations.RunPython(
+            backfill_daily_hydration_totals, migrations.RunPython.noop, hints={'model_name': 'dailyhydrationtotal'}
+        ),
+    ]
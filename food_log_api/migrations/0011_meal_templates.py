@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:25
+
+import django.db.models.deletion
+import django.utils.timezone
+import food_log_api.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0010_requestprofile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='foodlog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.CreateModel(
+            name='MealTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('food_name', models.CharField(max_length=255)),
+                ('serving_size', models.CharField(max_length=100)),
+                ('category', models.CharField(blank=True, max_length=50, null=True)),
+                ('calories', models.IntegerField(blank=True, null=True)),
+                ('ingredient_ids', models.TextField(blank=True, null=True)),
+                ('cooking_time', models.IntegerField(blank=True, null=True)),
+                ('rating', models.IntegerField(blank=True, null=True)),
+                ('review', models.TextField(blank=True, null=True)),
+                ('log_time', models.TimeField(blank=True, null=True)),
+                ('repeat_days', models.CharField(blank=True, default='', max_length=7)),
+                ('starts_on', models.DateField(blank=True, null=True)),
+                ('materialized_through', models.DateField(blank=True, null=True)),
+                ('warnings', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'name')},
+            },
+            bases=(food_log_api.models.InternedIngredientsMixin, models.Model),
+        ),
+    ]
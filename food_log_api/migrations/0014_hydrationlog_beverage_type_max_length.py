@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_log_api', '0013_daily_calorie_totals'),
+    ]
+
+    # 0001 still records beverage_type with max_length=20, choices and a default, while the model declares a
+    # plain max_length=50; this catches the migration state up. Databases that ran this operation inside an
+    # earlier 0003 rebuild the table once more with the same shape.
+    operations = [
+        migrations.AlterField(
+            model_name='hydrationlog',
+            name='beverage_type',
+            field=models.CharField(max_length=50),
+        ),
+    ]
@@ -1,29 +1,61 @@
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, connections, models
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+from .ingredients import decode_ingredients, encode_ingredients
+from .sharding import shard_for
 
-class FoodLog(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+class InternedIngredientsMixin:
+    @property
+    def ingredients(self):
+        cached = getattr(self, "_ingredients", None)
+        if cached is None or cached[0] != self.ingredient_ids:
+            cached = self._ingredients = (self.ingredient_ids, decode_ingredients(self.ingredient_ids))
+        return cached[1]
+
+    @ingredients.setter
+    def ingredients(self, names):
+        names = list(names) if names is not None else None
+        self.ingredient_ids = encode_ingredients(names)
+        self._ingredients = (self.ingredient_ids, names)
+
+
+class FoodLog(InternedIngredientsMixin, models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
     user_food_id = models.PositiveIntegerField(editable=False, null=True)
     food_name = models.CharField(max_length=255)
     serving_size = models.CharField(max_length=100)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     rating = models.IntegerField(blank=True, null=True)
     review = models.TextField(blank=True, null=True)
     category = models.CharField(max_length=50, blank=True, null=True)
     cooking_time = models.IntegerField(blank=True, null=True)
-    ingredients = models.JSONField(blank=True, null=True)
+    ingredient_ids = models.TextField(blank=True, null=True)
     calories = models.IntegerField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "timestamp"], name="foodlog_user_timestamp_idx"),
+        ]
+
+    @classmethod
+    def next_user_food_id(cls, user):
+        last_log = cls.objects.using(shard_for(user)).filter(user=user).order_by('-user_food_id').first()
+        # A backdated log can be archived while newer ones stay live, so the archive may hold the highest id.
+        highest = max(last_log.user_food_id if last_log else 0, LogArchive.max_archived_value(LogArchive.FOOD, user, "user_food_id"))
+        return highest + 1
+
     def save(self, *args, **kwargs):
+        cached = getattr(self, "_ingredients", None)
+        if cached is not None and cached[1] is not None:
+            self.ingredients = cached[1]
         if not self.user_food_id:
-            last_log = FoodLog.objects.filter(user=self.user).order_by('-user_food_id').first()
-            self.user_food_id = (last_log.user_food_id + 1) if last_log else 1
+            self.user_food_id = FoodLog.next_user_food_id(self.user)
         super().save(*args, **kwargs)
 
 class HydrationLog(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
     user_hydration_id = models.PositiveIntegerField(editable=False, null=True)
     amount = models.PositiveIntegerField()
     timestamp = models.DateTimeField(default=timezone.now)
@@ -34,10 +66,18 @@ class HydrationLog(models.Model):
         "soda", "sports drink", "other"
     ]
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "timestamp"], name="hydration_user_timestamp_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.user_hydration_id:
-            last_log = HydrationLog.objects.filter(user=self.user).order_by('-user_hydration_id').first()
-            self.user_hydration_id = (last_log.user_hydration_id + 1) if last_log else 1
+            last_log = HydrationLog.objects.using(shard_for(self.user)).filter(user=self.user).order_by('-user_hydration_id').first()
+            self.user_hydration_id = max(
+                last_log.user_hydration_id if last_log else 0,
+                LogArchive.max_archived_value(LogArchive.HYDRATION, self.user, "user_hydration_id"),
+            ) + 1
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -45,7 +85,7 @@ class HydrationLog(models.Model):
 
 
 class FoodPreference(models.Model):
-    user = models.OneToOneField(User, on_delete=models.CASCADE)
+    user = models.OneToOneField(User, on_delete=models.CASCADE, db_constraint=False)
     vegetarian = models.BooleanField(default=False)
     vegan = models.BooleanField(default=False)
     gluten_free = models.BooleanField(default=False)
@@ -53,6 +93,154 @@ class FoodPreference(models.Model):
     nut_free = models.BooleanField(default=False)
     calorie_target = models.IntegerField(null=True, blank=True)
     excluded_ingredients = models.JSONField(default=list)
+    timezone = models.CharField(max_length=64, default="UTC")
+    hydration_goal_ml = models.PositiveIntegerField(null=True, blank=True)
 
     def __str__(self):
         return f"{self.user.username}'s Preferences"
+
+
+class DailyHydrationTotal(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
+    date = models.DateField()
+    total_ml = models.IntegerField(default=0)
+    log_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "date")
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date} ({self.total_ml}ml)"
+
+
+class DailyCalorieTotal(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
+    date = models.DateField()
+    total_calories = models.IntegerField(default=0)
+    log_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "date")
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date} ({self.total_calories} kcal)"
+
+
+class PopulationStats(models.Model):
+    computed_at = models.DateTimeField(auto_now_add=True)
+    user_count = models.PositiveIntegerField(default=0)
+    food_log_count = models.PositiveIntegerField(default=0)
+    hydration_log_count = models.PositiveIntegerField(default=0)
+    top_foods = models.JSONField(default=list)
+    calories_by_category = models.JSONField(default=dict)
+    hydration_by_beverage = models.JSONField(default=dict)
+
+    class Meta:
+        get_latest_by = "computed_at"
+
+    def __str__(self):
+        return f"Population stats ({self.computed_at:%Y-%m-%d %H:%M})"
+
+
+class Ingredient(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class CatalogFood(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+    serving = models.CharField(max_length=100, blank=True)
+    calories = models.PositiveIntegerField()
+    protein_g = models.FloatField(default=0)
+    carbs_g = models.FloatField(default=0)
+    fat_g = models.FloatField(default=0)
+    fiber_g = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.name} ({self.calories} kcal per {self.serving})"
+
+
+class MealTemplate(InternedIngredientsMixin, models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False)
+    name = models.CharField(max_length=100)
+    food_name = models.CharField(max_length=255)
+    serving_size = models.CharField(max_length=100)
+    category = models.CharField(max_length=50, blank=True, null=True)
+    calories = models.IntegerField(null=True, blank=True)
+    ingredient_ids = models.TextField(blank=True, null=True)
+    cooking_time = models.IntegerField(blank=True, null=True)
+    rating = models.IntegerField(blank=True, null=True)
+    review = models.TextField(blank=True, null=True)
+    log_time = models.TimeField(null=True, blank=True)
+    repeat_days = models.CharField(max_length=7, blank=True, default="")
+    starts_on = models.DateField(null=True, blank=True)
+    materialized_through = models.DateField(null=True, blank=True)
+    warnings = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("user", "name")
+
+    def __str__(self):
+        return f"{self.user.username} - {self.name}"
+
+
+class LogArchive(models.Model):
+    FOOD = "food"
+    HYDRATION = "hydration"
+    KIND_CHOICES = [(FOOD, "Food"), (HYDRATION, "Hydration")]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    year = models.PositiveIntegerField()
+    table_name = models.CharField(max_length=100, unique=True)
+    row_count = models.PositiveIntegerField(default=0)
+    archived_before = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("kind", "year")
+
+    @classmethod
+    def max_archived_value(cls, kind, user, column):
+        using = shard_for(user)
+        quote = connections[using].ops.quote_name
+        highest = 0
+        with connections[using].cursor() as cursor:
+            for table_name in cls.objects.using(using).filter(kind=kind).values_list("table_name", flat=True):
+                cursor.execute(f"SELECT MAX({quote(column)}) FROM {quote(table_name)} WHERE {quote('user_id')} = %s", [user.pk])
+                highest = max(highest, cursor.fetchone()[0] or 0)
+        return highest
+
+    def __str__(self):
+        return f"{self.kind} archive {self.year} ({self.row_count} rows)"
+
+
+class UserShard(models.Model):
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="shard")
+    alias = models.CharField(max_length=100, default=DEFAULT_DB_ALIAS)
+    moving = models.BooleanField(default=False)
+
+    def __str__(self):
+        return f"{self.user.username} on {self.alias}{' (moving)' if self.moving else ''}"
+
+
+class RequestProfile(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True)
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=500)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    sql_time_ms = models.FloatField(default=0)
+    queries = models.JSONField(default=list)
+    functions = models.JSONField(default=list)
+    profile = models.BinaryField()
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f}ms)"
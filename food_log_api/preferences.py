@@ -0,0 +1,78 @@
+from .models import FoodPreference
+
+RESTRICTED_INGREDIENTS = {
+    "vegetarian": frozenset([
+        "chicken", "beef", "pork", "fish", "seafood", "lamb", "turkey", "duck",
+        "bacon", "sausage", "ham", "gelatin", "anchovies", "oyster sauce"
+    ]),
+
+    "vegan": frozenset([
+        "chicken", "beef", "pork", "fish", "seafood", "lamb", "turkey", "duck",
+        "milk", "cheese", "egg", "butter", "yogurt", "cream", "honey", "whey",
+        "casein", "lard", "gelatin", "mayonnaise"
+    ]),
+
+    "nut_free": frozenset([
+        "peanut", "almond", "cashew", "hazelnut", "walnut", "pecan", "pistachio",
+        "macadamia", "brazil nut", "chestnut", "nut butter", "praline", "marzipan"
+    ]),
+
+    "gluten_free": frozenset([
+        "wheat", "barley", "rye", "pasta", "bread", "flour tortillas", "crackers",
+        "croissants", "beer", "couscous", "semolina", "farro", "bulgur",
+        "wheat-based soy sauce"
+    ]),
+
+    "dairy_free": frozenset([
+        "milk", "cheese", "butter", "cream", "yogurt", "ice cream", "whey",
+        "casein", "ghee", "sour cream", "condensed milk", "buttermilk",
+        "milk chocolate"
+    ]),
+}
+
+
+def get_preferences(user):
+    try:
+        return user.foodpreference
+    except FoodPreference.DoesNotExist:
+        return None
+
+
+class PreferenceChecker:
+    def __init__(self, preferences):
+        self.calorie_target = preferences.calorie_target if preferences else None
+        self.excluded = {item.lower() for item in (preferences.excluded_ingredients or [])} if preferences else set()
+        self.restricted = {}
+        for pref, items in RESTRICTED_INGREDIENTS.items():
+            if preferences and getattr(preferences, pref, False):
+                for item in items:
+                    self.restricted.setdefault(item, set()).add(pref)
+
+    @classmethod
+    def for_user(cls, user):
+        return cls(get_preferences(user))
+
+    def __bool__(self):
+        return bool(self.calorie_target or self.excluded or self.restricted)
+
+    def warnings(self, ingredients, calories):
+        if not self:
+            return []
+
+        violated = set()
+        found_exclusions = []
+        for item in ingredients or []:
+            lowered = item.lower()
+            violated.update(self.restricted.get(lowered, ()))
+            if lowered in self.excluded:
+                found_exclusions.append(item)
+
+        warnings = [
+            f"This food contains ingredients that violate your {pref.replace('_', '-')} preference."
+            for pref in RESTRICTED_INGREDIENTS if pref in violated
+        ]
+        if found_exclusions:
+            warnings.append(f"This food contains ingredients you want to avoid: {', '.join(found_exclusions)}.")
+        if self.calorie_target and calories is not None and calories > self.calorie_target:
+            warnings.append(f"This food exceeds your calorie target of {self.calorie_target} kcal.")
+        return warnings
@@ -0,0 +1,145 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from .models import RequestProfile
+
+DEFAULT_PROFILING_SETTINGS = {
+    "HEADER": "X-Profile",
+    "QUERY_PARAM": "_profile",
+    "MAX_QUERIES": 1000,
+    "TOP_FUNCTIONS": 50,
+}
+
+
+def profiling_settings():
+    return {**DEFAULT_PROFILING_SETTINGS, **getattr(settings, "REQUEST_PROFILING", {})}
+
+
+class QueryRecorder:
+    def __init__(self, limit):
+        self.limit = limit
+        self.queries = []
+        self.count = 0
+        self.total = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.total += elapsed
+            if len(self.queries) < self.limit:
+                self.queries.append({
+                    "alias": context["connection"].alias,
+                    "sql": sql,
+                    "many": many,
+                    "time_ms": round(elapsed * 1000, 3),
+                })
+
+
+def top_functions(stats, limit):
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_time_ms": round(total_time * 1000, 3),
+            "cumulative_time_ms": round(cumulative_time * 1000, 3),
+        }
+        for (filename, line, name), (primitive_calls, calls, total_time, cumulative_time, _) in rows
+    ]
+
+
+def profiling_user(request):
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        try:
+            authenticated = JWTAuthentication().authenticate(request)
+        except (AuthenticationFailed, InvalidToken, TokenError):
+            return None
+        user = authenticated[0] if authenticated else None
+    return user if user is not None and user.is_active and user.is_staff else None
+
+
+def profile_report(profile):
+    return {
+        "id": profile.pk,
+        "created_at": profile.created_at.isoformat(),
+        "user": profile.user.username if profile.user else None,
+        "method": profile.method,
+        "path": profile.path,
+        "status_code": profile.status_code,
+        "duration_ms": profile.duration_ms,
+        "query_count": profile.query_count,
+        "sql_time_ms": profile.sql_time_ms,
+        "queries": profile.queries,
+        "functions": profile.functions,
+    }
+
+
+class RequestProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = profiling_settings()
+        self.meta_key = "HTTP_" + self.config["HEADER"].upper().replace("-", "_")
+        self.query_param = self.config["QUERY_PARAM"]
+
+    def __call__(self, request):
+        if not self.triggered(request):
+            return self.get_response(request)
+
+        user = profiling_user(request)
+        if user is None:
+            return self.get_response(request)
+
+        return self.profile(request, user)
+
+    def triggered(self, request):
+        if self.meta_key in request.META:
+            return True
+        return self.query_param in request.META.get("QUERY_STRING", "") and self.query_param in request.GET
+
+    def profile(self, request, user):
+        import cProfile
+        import marshal
+        import pstats
+
+        recorder = QueryRecorder(self.config["MAX_QUERIES"])
+        profiler = cProfile.Profile()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            duration = time.perf_counter() - started
+
+        stats = pstats.Stats(profiler)
+        profile = RequestProfile.objects.create(
+            user=user,
+            method=request.method,
+            path=request.get_full_path()[:500],
+            status_code=response.status_code,
+            duration_ms=round(duration * 1000, 3),
+            query_count=recorder.count,
+            sql_time_ms=round(recorder.total * 1000, 3),
+            queries=recorder.queries,
+            functions=top_functions(stats, self.config["TOP_FUNCTIONS"]),
+            profile=marshal.dumps(stats.stats),
+        )
+        response["X-Profile-Id"] = str(profile.pk)
+        return response
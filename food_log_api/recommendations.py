@@ -0,0 +1,102 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.db import transaction
+
+from .catalog import normalize
+from .sharding import shard_for
+
+DEFAULT_RECOMMENDATION_SETTINGS = {
+    "MAX_USERS": 1000,
+    "MAX_AGE_SECONDS": 300,
+}
+
+FoodFeatures = namedtuple(
+    "FoodFeatures", ["key", "name", "category", "calories", "cooking_time", "rating", "ingredients", "timestamp"]
+)
+
+_vectors = OrderedDict()
+_vectors_lock = threading.Lock()
+
+
+def recommendation_settings():
+    return {**DEFAULT_RECOMMENDATION_SETTINGS, **getattr(settings, "RECOMMENDATIONS", {})}
+
+
+def food_features(food_name, category, calories, cooking_time, rating, ingredients, timestamp):
+    return FoodFeatures(
+        normalize(food_name),
+        food_name.strip(),
+        category,
+        calories,
+        cooking_time,
+        rating,
+        frozenset(ingredient.lower() for ingredient in ingredients or ()),
+        timestamp,
+    )
+
+
+def log_features(food_log):
+    return food_features(
+        food_log.food_name, food_log.category, food_log.calories, food_log.cooking_time, food_log.rating,
+        food_log.ingredients, food_log.timestamp,
+    )
+
+
+def record_food_change(user, old=None, new=None):
+    user_id = user.pk
+
+    def apply():
+        with _vectors_lock:
+            vectors = _vectors.get(user_id)
+        # Only users whose vectors are already built need updating; everyone else is built fresh on first use.
+        if vectors is None:
+            return
+        if old is not None:
+            vectors.apply(old, -1)
+        if new is not None:
+            vectors.apply(new, 1)
+
+    transaction.on_commit(apply, using=shard_for(user))
+
+
+def invalidate_user_vectors(user):
+    user_id = user.pk
+
+    def drop():
+        with _vectors_lock:
+            _vectors.pop(user_id, None)
+
+    transaction.on_commit(drop, using=shard_for(user))
+
+
+def user_vectors(user, tz):
+    from .vectors import build_user_vectors
+
+    config = recommendation_settings()
+    with _vectors_lock:
+        vectors = _vectors.get(user.pk)
+        if vectors is not None and vectors.tz_name == str(tz) and time.monotonic() - vectors.built_at < config["MAX_AGE_SECONDS"]:
+            _vectors.move_to_end(user.pk)
+            return vectors
+
+    vectors = build_user_vectors(user, tz)
+    user_id = user.pk
+
+    def store():
+        with _vectors_lock:
+            _vectors[user_id] = vectors
+            _vectors.move_to_end(user_id)
+            while len(_vectors) > config["MAX_USERS"]:
+                _vectors.popitem(last=False)
+
+    # Inside a transaction the vectors may include uncommitted logs, whose own changes are applied on commit.
+    transaction.on_commit(store, using=shard_for(user))
+    return vectors
+
+
+def reset_vectors():
+    with _vectors_lock:
+        _vectors.clear()
@@ -0,0 +1,16 @@
+from itertools import chain
+
+from .archive import archived_rows
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def stream_rows(queryset, fields, chunk_size=DEFAULT_CHUNK_SIZE):
+    return queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+
+
+def stream_log_rows(kind, user, queryset, fields, start=None, end=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    return chain(
+        archived_rows(kind, user, fields, start, end, chunk_size=chunk_size),
+        stream_rows(queryset, fields, chunk_size=chunk_size),
+    )
@@ -1,9 +1,41 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db import transaction
 from rest_framework import serializers
-from .models import FoodLog, HydrationLog, FoodPreference
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from .catalog import estimate_nutrition
+from .compliance import apply_calorie_delta
+from .events import food_event_data, hydration_event_data, publish_event
+from .recommendations import log_features, record_food_change
+from .filters import local_day, user_timezone
+from .hydration import apply_hydration_delta
+from .models import FoodLog, HydrationLog, FoodPreference, MealTemplate
+from .preferences import PreferenceChecker
+from .sharding import shard_for
+from .tokens import FilteredRefreshToken
+
+
+def required_messages(name, **messages):
+    return {"required": f"{name} is required.", "blank": f"{name} is required.", "null": f"{name} is required.", **messages}
+
+
+def first_error(errors):
+    if isinstance(errors, dict):
+        errors = list(errors.values())
+    for error in errors:
+        if isinstance(error, (dict, list)):
+            message = first_error(error)
+            if message:
+                return message
+        else:
+            return str(error)
+    return None
+
 
 class FoodLogSerializer(serializers.ModelSerializer):
     user = serializers.ReadOnlyField(source='user.username')
     timestamp = serializers.SerializerMethodField()
+    ingredients = serializers.ListField(child=serializers.CharField(), allow_null=True, required=False)
 
     class Meta:
         model = FoodLog
@@ -41,4 +73,149 @@ class FoodPreferenceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = FoodPreference
-        fields = ['user', 'vegetarian', 'vegan', 'gluten_free', 'dairy_free', 'nut_free', 'calorie_target', 'excluded_ingredients']
+        fields = ['user', 'vegetarian', 'vegan', 'gluten_free', 'dairy_free', 'nut_free', 'calorie_target', 'excluded_ingredients', 'timezone', 'hydration_goal_ml']
+
+    def validate_timezone(self, value):
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError(f"Unknown time zone: {value}")
+        return value
+
+
+NUMERIC_ERROR = "Invalid data type for numeric fields (calories, cooking_time, rating)."
+
+
+class UserContextMixin:
+    def preference_checker(self):
+        checker = self.context.get("preference_checker")
+        if checker is None:
+            checker = self.context["preference_checker"] = PreferenceChecker.for_user(self.context["request"].user)
+        return checker
+
+    def user_timezone(self):
+        tz = self.context.get("timezone")
+        if tz is None:
+            tz = self.context["timezone"] = user_timezone(self.context["request"].user)
+        return tz
+
+
+class FoodLogCreateSerializer(UserContextMixin, serializers.Serializer):
+    food_name = serializers.CharField(max_length=255, error_messages=required_messages("food_name"))
+    category = serializers.CharField(max_length=50, error_messages=required_messages("category"))
+    calories = serializers.IntegerField(min_value=0, required=False, allow_null=True, error_messages={"invalid": NUMERIC_ERROR})
+    ingredients = serializers.ListField(
+        child=serializers.CharField(), allow_empty=False, error_messages=required_messages("ingredients", empty="ingredients is required.")
+    )
+    serving_size = serializers.CharField(max_length=100, error_messages=required_messages("serving_size"))
+    cooking_time = serializers.IntegerField(min_value=0, error_messages=required_messages("cooking_time", invalid=NUMERIC_ERROR))
+    rating = serializers.IntegerField(error_messages=required_messages("rating", invalid=NUMERIC_ERROR))
+    review = serializers.CharField(error_messages=required_messages("review"))
+
+    def validate(self, attrs):
+        estimated_nutrition = None
+        if attrs.get("calories") is None:
+            estimated_nutrition = estimate_nutrition(attrs["ingredients"])
+            if not estimated_nutrition:
+                raise serializers.ValidationError({"calories": "calories is required."})
+            attrs["calories"] = estimated_nutrition["calories"]
+
+        attrs["estimated_nutrition"] = estimated_nutrition
+        attrs["warnings"] = self.preference_checker().warnings(attrs["ingredients"], attrs["calories"])
+        return attrs
+
+    def create(self, validated_data):
+        estimated_nutrition = validated_data.pop("estimated_nutrition")
+        warnings = validated_data.pop("warnings")
+        user = self.context["request"].user
+        with transaction.atomic(using=shard_for(user, for_write=True)):
+            food_log = FoodLog.objects.create(user=user, **validated_data)
+            apply_calorie_delta(user, local_day(food_log.timestamp, self.user_timezone()), food_log.calories, 1)
+            publish_event(user, "food.created", food_event_data(food_log))
+            record_food_change(user, new=log_features(food_log))
+        food_log.estimated_nutrition = estimated_nutrition
+        food_log.warnings = warnings
+        return food_log
+
+
+class HydrationLogCreateSerializer(UserContextMixin, serializers.Serializer):
+    amount = serializers.IntegerField(
+        min_value=1,
+        error_messages={
+            "required": "Amount is required.",
+            "null": "Amount is required.",
+            "invalid": "Amount must be a valid whole number of millilitres.",
+            "min_value": "Invalid amount. Please enter a positive value.",
+        },
+    )
+    beverage_type = serializers.CharField(max_length=50, error_messages={
+        "required": "Beverage type cannot be empty.", "blank": "Beverage type cannot be empty."
+    })
+    timestamp = serializers.DateTimeField(required=False, error_messages={
+        "invalid": "Invalid timestamp format. Use ISO format (YYYY-MM-DDTHH:MM:SS)."
+    })
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+        with transaction.atomic(using=shard_for(user, for_write=True)):
+            hydration_log = HydrationLog.objects.create(user=user, **validated_data)
+            apply_hydration_delta(user, local_day(hydration_log.timestamp, self.user_timezone()), hydration_log.amount, 1)
+            publish_event(user, "hydration.created", hydration_event_data(hydration_log))
+        return hydration_log
+
+    def update(self, instance, validated_data):
+        user = self.context["request"].user
+        tz = self.user_timezone()
+        previous_day, previous_amount = local_day(instance.timestamp, tz), instance.amount
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        with transaction.atomic(using=shard_for(user, for_write=True)):
+            instance.save()
+            apply_hydration_delta(user, previous_day, -previous_amount, -1)
+            apply_hydration_delta(user, local_day(instance.timestamp, tz), instance.amount, 1)
+            publish_event(user, "hydration.updated", hydration_event_data(instance))
+        return instance
+
+
+class MealTemplateSerializer(serializers.ModelSerializer):
+    ingredients = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+    class Meta:
+        model = MealTemplate
+        fields = [
+            "id",
+            "name",
+            "food_name",
+            "serving_size",
+            "category",
+            "calories",
+            "ingredients",
+            "cooking_time",
+            "rating",
+            "review",
+            "log_time",
+            "repeat_days",
+            "starts_on",
+            "materialized_through",
+            "warnings",
+        ]
+        read_only_fields = ["materialized_through", "warnings"]
+
+    def validate_repeat_days(self, value):
+        days = sorted(set(value))
+        if any(day not in "0123456" for day in days):
+            raise serializers.ValidationError("Use weekday numbers 0 (Monday) to 6 (Sunday), e.g. '01234'.")
+        return "".join(days)
+
+    def validate(self, attrs):
+        ingredients = attrs.get("ingredients", getattr(self.instance, "ingredients", None))
+        if attrs.get("calories", getattr(self.instance, "calories", None)) is None:
+            estimated_nutrition = estimate_nutrition(ingredients)
+            if estimated_nutrition:
+                attrs["calories"] = estimated_nutrition["calories"]
+        attrs["warnings"] = None
+        return attrs
+
+
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = FilteredRefreshToken
@@ -0,0 +1,235 @@
+import hashlib
+import time
+from bisect import bisect
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+USER_MODELS = ["FoodLog", "HydrationLog", "FoodPreference", "DailyHydrationTotal", "DailyCalorieTotal", "MealTemplate"]
+SHARDED_MODELS = {name.lower() for name in USER_MODELS} | {"logarchive"}
+VIRTUAL_NODES = 64
+
+_current_user = ContextVar("food_log_current_user", default=None)
+
+
+class UserShardMoving(Exception):
+    pass
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    def __init__(self, aliases, virtual_nodes=VIRTUAL_NODES):
+        points = sorted((_hash(f"{alias}#{replica}"), alias) for alias in aliases for replica in range(virtual_nodes))
+        self.keys = [key for key, _ in points]
+        self.aliases = [alias for _, alias in points]
+
+    def alias_for(self, user_id):
+        return self.aliases[bisect(self.keys, _hash(str(user_id))) % len(self.keys)]
+
+
+def shard_aliases():
+    return list(getattr(settings, "USER_SHARDS", [DEFAULT_DB_ALIAS]))
+
+
+@lru_cache(maxsize=8)
+def _ring(aliases):
+    return HashRing(aliases)
+
+
+def get_ring():
+    return _ring(tuple(shard_aliases()))
+
+
+def user_models():
+    return [apps.get_model("food_log_api", name) for name in USER_MODELS]
+
+
+def lookup_placement(user_id):
+    from .models import UserShard
+
+    # Users without a placement predate sharding, so their data is still on the default database.
+    return UserShard.objects.filter(user_id=user_id).values_list("alias", "moving").first() or (DEFAULT_DB_ALIAS, False)
+
+
+def _checked(placement, for_write):
+    alias, moving = placement
+    if for_write and moving:
+        raise UserShardMoving("This account is being moved to another database; retry in a few seconds.")
+    return alias
+
+
+def shard_for(user, for_write=False):
+    if len(shard_aliases()) == 1:
+        return DEFAULT_DB_ALIAS
+    placement = getattr(user, "_shard_placement", None)
+    if placement is None:
+        placement = user._shard_placement = lookup_placement(user.pk)
+    return _checked(placement, for_write)
+
+
+def shard_for_id(user_id, for_write=False):
+    if len(shard_aliases()) == 1:
+        return DEFAULT_DB_ALIAS
+    user = current_user()
+    if user is not None and user.pk == user_id:
+        return shard_for(user, for_write)
+    return _checked(lookup_placement(user_id), for_write)
+
+
+def current_user():
+    source = _current_user.get()
+    user = source() if source is not None else None
+    return user if getattr(user, "is_authenticated", False) else None
+
+
+@contextmanager
+def user_context(user):
+    token = _current_user.set(lambda: user)
+    try:
+        yield shard_for(user)
+    finally:
+        _current_user.reset(token)
+
+
+def assign_shards(users):
+    from .models import UserShard
+
+    placed = defaultdict(list)
+    if len(shard_aliases()) == 1:
+        placed[DEFAULT_DB_ALIAS] = list(users)
+        return placed
+
+    ring = get_ring()
+    for user in users:
+        user._shard_placement = (ring.alias_for(user.pk), False)
+        placed[user._shard_placement[0]].append(user)
+    UserShard.objects.bulk_create([UserShard(user=user, alias=user._shard_placement[0]) for user in users])
+    return placed
+
+
+def assign_shard(user):
+    return next(iter(assign_shards([user])))
+
+
+class UserShardMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # DRF copies the authenticated user onto the Django request, so JWT users are visible here lazily.
+        token = _current_user.set(lambda: getattr(request, "user", None))
+        try:
+            return self.get_response(request)
+        finally:
+            _current_user.reset(token)
+
+
+class UserShardRouter:
+    def _alias(self, model, hints, for_write):
+        if model._meta.app_label != "food_log_api" or model._meta.model_name not in SHARDED_MODELS:
+            return DEFAULT_DB_ALIAS
+
+        instance = hints.get("instance")
+        if instance is not None:
+            if instance._meta.label_lower == settings.AUTH_USER_MODEL.lower():
+                return shard_for(instance, for_write)
+            user_id = getattr(instance, "user_id", None)
+            if user_id is not None:
+                return shard_for_id(user_id, for_write)
+
+        user = current_user()
+        if user is not None:
+            return shard_for(user, for_write)
+        return None
+
+    def db_for_read(self, model, **hints):
+        return self._alias(model, hints, for_write=False)
+
+    def db_for_write(self, model, **hints):
+        return self._alias(model, hints, for_write=True)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == DEFAULT_DB_ALIAS:
+            return True
+        if db not in shard_aliases():
+            return None
+        return app_label == "food_log_api" and model_name in SHARDED_MODELS
+
+
+def delete_sharded_user_data(sender, instance, **kwargs):
+    from .archive import delete_archived_for_id
+
+    alias = shard_for(instance)
+    with transaction.atomic(using=alias):
+        # The delete cascade only reaches the user's rows on 'default', and never the raw archive tables.
+        if alias != DEFAULT_DB_ALIAS:
+            for model in user_models():
+                model.objects.using(alias).filter(user_id=instance.pk).delete()
+        delete_archived_for_id(instance.pk, alias)
+
+
+def block_writes(user_ids):
+    from .models import UserShard
+
+    placed = set(UserShard.objects.filter(user_id__in=user_ids).values_list("user_id", flat=True))
+    UserShard.objects.bulk_create([UserShard(user_id=user_id) for user_id in user_ids if user_id not in placed])
+    UserShard.objects.filter(user_id__in=user_ids).update(moving=True)
+
+
+def unblock_writes(user_ids):
+    from .models import UserShard
+
+    UserShard.objects.filter(user_id__in=user_ids).update(moving=False)
+
+
+def move_user(user_id, target, grace_seconds=0, batch_size=2000):
+    from .archive import copy_archived, delete_archived_for_id
+    from .models import UserShard
+
+    source = lookup_placement(user_id)[0]
+    if source == target:
+        return 0
+
+    block_writes([user_id])
+    try:
+        # Let requests that resolved the old placement before the flag was set finish their writes.
+        time.sleep(grace_seconds)
+        moved = 0
+        with transaction.atomic(using=target):
+            for model in user_models():
+                rows = model.objects.using(source).filter(user_id=user_id).order_by("pk").iterator(chunk_size=batch_size)
+                batch = []
+                for row in rows:
+                    # Primary keys come from each database's own sequence; user-facing ids such as user_food_id are kept.
+                    row.pk = None
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        model.objects.using(target).bulk_create(batch)
+                        moved += len(batch)
+                        batch = []
+                model.objects.using(target).bulk_create(batch)
+                moved += len(batch)
+            moved += copy_archived(user_id, source, target)
+    except Exception:
+        unblock_writes([user_id])
+        raise
+
+    UserShard.objects.filter(user_id=user_id).update(alias=target, moving=False)
+
+    # The copy is committed and live before the source rows go, so a failure here leaves duplicates, never gaps.
+    with transaction.atomic(using=source):
+        for model in user_models():
+            model.objects.using(source).filter(user_id=user_id).delete()
+        delete_archived_for_id(user_id, source)
+    return moved
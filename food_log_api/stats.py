@@ -0,0 +1,146 @@
+from collections import Counter, defaultdict
+from itertools import chain
+
+import django
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .archive import archived_rows_for_users
+from .filters import get_timezone, local_day
+from .models import FoodLog, FoodPreference, HydrationLog, LogArchive
+
+HYDRATION_BINS = [250, 500, 750, 1000]
+HYDRATION_BIN_LABELS = [f"<{upper}" for upper in HYDRATION_BINS] + [f">={HYDRATION_BINS[-1]}"]
+
+
+def shard_ranges(user_ids, shard_size, aliases=(DEFAULT_DB_ALIAS,)):
+    return [
+        (alias, user_ids[i], user_ids[min(i + shard_size, len(user_ids)) - 1])
+        for alias in aliases
+        for i in range(0, len(user_ids), shard_size)
+    ]
+
+
+def hydration_bin(amount):
+    for upper in HYDRATION_BINS:
+        if amount < upper:
+            return f"<{upper}"
+    return f">={HYDRATION_BINS[-1]}"
+
+
+def user_timezones(using, first_user, last_user):
+    zones = {}
+    preferences = FoodPreference.objects.using(using).filter(user_id__gte=first_user, user_id__lte=last_user)
+    timezones = {
+        user_id: zones.setdefault(name, get_timezone(name))
+        for user_id, name in preferences.values_list("user_id", "timezone")
+    }
+    return defaultdict(lambda: get_timezone(None), timezones)
+
+
+def user_range_rows(kind, model, using, first_user, last_user, fields, chunk_size):
+    live = (
+        model.objects.using(using).filter(user_id__gte=first_user, user_id__lte=last_user)
+        .order_by()
+        .values_list(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    return chain(archived_rows_for_users(kind, first_user, last_user, fields, using, chunk_size), live)
+
+
+def init_worker():
+    django.setup()
+    connections.close_all()
+
+
+def compute_shard(user_range, chunk_size=2000):
+    using, first_user, last_user = user_range
+    food_counts = Counter()
+    category_calories = Counter()
+    category_days = defaultdict(set)
+    food_log_count = 0
+    timezones = user_timezones(using, first_user, last_user)
+
+    food_rows = user_range_rows(
+        LogArchive.FOOD, FoodLog, using, first_user, last_user,
+        ["user_id", "food_name", "category", "calories", "timestamp"], chunk_size,
+    )
+    for user_id, food_name, category, calories, timestamp in food_rows:
+        food_log_count += 1
+        food_counts[food_name.strip().lower()] += 1
+        category = category or "Uncategorized"
+        category_calories[category] += calories or 0
+        category_days[category].add((user_id, local_day(timestamp, timezones[user_id])))
+
+    beverage_counts = Counter()
+    beverage_amounts = Counter()
+    beverage_bins = defaultdict(Counter)
+    hydration_log_count = 0
+
+    hydration_rows = user_range_rows(
+        LogArchive.HYDRATION, HydrationLog, using, first_user, last_user, ["beverage_type", "amount"], chunk_size
+    )
+    for beverage_type, amount in hydration_rows:
+        hydration_log_count += 1
+        beverage_counts[beverage_type] += 1
+        beverage_amounts[beverage_type] += amount
+        beverage_bins[beverage_type][hydration_bin(amount)] += 1
+
+    return {
+        "food_log_count": food_log_count,
+        "hydration_log_count": hydration_log_count,
+        "food_counts": food_counts,
+        "category_calories": category_calories,
+        "category_day_counts": Counter({category: len(days) for category, days in category_days.items()}),
+        "beverage_counts": beverage_counts,
+        "beverage_amounts": beverage_amounts,
+        "beverage_bins": {beverage: dict(bins) for beverage, bins in beverage_bins.items()},
+    }
+
+
+def merge_partials(partials):
+    merged = {
+        "food_log_count": 0,
+        "hydration_log_count": 0,
+        "food_counts": Counter(),
+        "category_calories": Counter(),
+        "category_day_counts": Counter(),
+        "beverage_counts": Counter(),
+        "beverage_amounts": Counter(),
+        "beverage_bins": defaultdict(Counter),
+    }
+    for partial in partials:
+        merged["food_log_count"] += partial["food_log_count"]
+        merged["hydration_log_count"] += partial["hydration_log_count"]
+        for key in ("food_counts", "category_calories", "category_day_counts", "beverage_counts", "beverage_amounts"):
+            merged[key].update(partial[key])
+        for beverage, bins in partial["beverage_bins"].items():
+            merged["beverage_bins"][beverage].update(bins)
+    return merged
+
+
+def summarize(merged, top=20):
+    return {
+        "food_log_count": merged["food_log_count"],
+        "hydration_log_count": merged["hydration_log_count"],
+        "top_foods": [
+            {"food_name": food_name, "count": count}
+            for food_name, count in merged["food_counts"].most_common(top)
+        ],
+        "calories_by_category": {
+            category: round(merged["category_calories"][category] / days, 1)
+            for category, days in sorted(merged["category_day_counts"].items())
+            if days
+        },
+        "hydration_by_beverage": {
+            beverage: {
+                "count": count,
+                "average_amount": round(merged["beverage_amounts"][beverage] / count, 1),
+                "distribution": {
+                    label: merged["beverage_bins"][beverage][label]
+                    for label in HYDRATION_BIN_LABELS
+                    if merged["beverage_bins"][beverage][label]
+                },
+            }
+            for beverage, count in sorted(merged["beverage_counts"].items())
+        },
+    }
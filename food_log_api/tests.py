@@ -1,3 +1,222 @@
-from django.test import TestCase
+import sqlite3
+import tracemalloc
+from datetime import timedelta
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import DEFAULT_DB_ALIAS
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from . import views
+from . import recommendations
+from .archive import archive_rows
+from .ingredients import clear_cache, encode_ingredients, ingredient_names
+from .management.commands.check_query_plans import capture_plans, compare_plans, read_snapshot, write_snapshot
+from .management.commands.check_startup import measure_startup, startup_budget, startup_failures
+from .models import FoodLog, FoodPreference, HydrationLog, LogArchive, MealTemplate
+
+FOOD = {
+    "food_name": "Chicken salad", "serving_size": "1 plate", "calories": 450, "category": "lunch",
+    "cooking_time": 15, "rating": 4, "review": "Fresh", "ingredients": ["chicken", "lettuce"],
+}
+
+
+class APITestCase(TestCase):
+    def setUp(self):
+        # Interned ingredient ids are cached per process, and each test's rows are rolled back.
+        clear_cache()
+        self.addCleanup(clear_cache)
+        self.user = User.objects.create(username="api_tests")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+
+class IngredientInterningTests(APITestCase):
+    def log_food(self, ingredients):
+        response = self.client.post("/api/log-food/", {**FOOD, "ingredients": ingredients}, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data["user_food_id"]
+
+    def test_rolled_back_ingredients_are_not_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/api/batch/", {"atomic": True, "requests": [
+                {"method": "POST", "path": "/api/log-food/", "body": {**FOOD, "ingredients": ["zzqunique"]}},
+                {"method": "DELETE", "path": "/api/remove-food/999/"},
+            ]}, format="json")
+            self.assertEqual(response.status_code, 400)
+            other_id = self.log_food(["other"])
+            unique_id = self.log_food(["zzqunique"])
+
+        # A fresh cache reads what was stored, as any other process would.
+        clear_cache()
+        self.assertEqual(self.client.get(f"/api/food-log-details/{other_id}/").data["ingredients"], ["other"])
+        self.assertEqual(self.client.get(f"/api/food-log-details/{unique_id}/").data["ingredients"], ["zzqunique"])
+        response = self.client.get("/api/search-food/", {"query": "zzqunique"})
+        self.assertEqual([result["ingredients"] for result in response.data], [["zzqunique"]])
+
+    def test_unknown_ingredient_ids_are_skipped(self):
+        self.assertEqual(ingredient_names([999999]), [])
+
+
+class AtomicBatchTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        recommendations.reset_vectors()
+        self.addCleanup(recommendations.reset_vectors)
+
+    def batch(self, *requests):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/api/batch/", {"atomic": True, "requests": list(requests)}, format="json")
+
+    def test_rolled_back_batch_leaves_no_cached_vectors(self):
+        response = self.batch(
+            {"method": "POST", "path": "/api/log-food/", "body": FOOD},
+            {"method": "GET", "path": "/api/recommendations/"},
+            {"method": "DELETE", "path": "/api/remove-food/999/"},
+        )
+        self.assertTrue(response.data["rolled_back"])
+        self.assertNotIn(self.user.pk, recommendations._vectors)
+
+    def test_committed_batch_counts_each_log_once(self):
+        response = self.batch(
+            {"method": "POST", "path": "/api/log-food/", "body": FOOD},
+            {"method": "GET", "path": "/api/recommendations/"},
+        )
+        self.assertFalse(response.data["rolled_back"], response.data)
+        self.assertEqual(recommendations._vectors[self.user.pk].count.sum(), 1)
+
+
+class FoodLogCreateTests(APITestCase):
+    def test_zero_calories_are_kept(self):
+        response = self.client.post("/api/log-food/", {**FOOD, "calories": 0, "ingredients": ["sparkling water"]}, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(FoodLog.objects.get(user=self.user).calories, 0)
+
+
+class MealTemplateTests(APITestCase):
+    def test_logged_timestamps_use_the_user_timezone(self):
+        FoodPreference.objects.create(user=self.user, timezone="Asia/Tokyo")
+        template = MealTemplate.objects.create(
+            user=self.user, name="Breakfast", food_name="Rice", serving_size="1 bowl", calories=300,
+            ingredients=["rice"], log_time="08:00",
+        )
+
+        response = self.client.post(f"/api/templates/{template.pk}/log/", {"dates": ["2026-01-02"]}, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data["logged"][0]["timestamp"], "2026-01-02 08:00 AM")
+
+
+class HydrationEditTests(APITestCase):
+    def test_duplicate_ids_are_a_conflict(self):
+        for amount in (250, 500):
+            HydrationLog.objects.create(user=self.user, user_hydration_id=7, amount=amount, beverage_type="water")
+
+        self.assertEqual(self.client.put("/api/edit-hydration/7/", {"amount": 300}, format="json").status_code, 409)
+        self.assertEqual(self.client.delete("/api/remove-hydration/7/").status_code, 409)
+        self.assertEqual(self.client.put("/api/edit-hydration/8/", {"amount": 300}, format="json").status_code, 404)
+
+
+class ArchivedIdTests(APITestCase):
+    def archive_backdated(self, model, **fields):
+        model.objects.create(user=self.user, timestamp=timezone.now() - timedelta(days=800), **fields)
+        cutoff = timezone.now() - timedelta(days=400)
+        archive_rows(LogArchive.FOOD if model is FoodLog else LogArchive.HYDRATION, cutoff)
+
+    def test_food_ids_skip_archived_highest_id(self):
+        first = self.client.post("/api/log-food/", FOOD, format="json").data["user_food_id"]
+        self.archive_backdated(FoodLog, food_name="Old soup", serving_size="1 bowl", calories=200)
+
+        response = self.client.post("/api/log-food/", FOOD, format="json")
+        self.assertEqual(response.data["user_food_id"], first + 2)
+        self.assertEqual(self.client.get(f"/api/food-log-details/{first + 1}/").data["food_name"], "Old soup")
+
+    def test_hydration_ids_skip_archived_highest_id(self):
+        first = self.client.post("/api/log-hydration/", {"amount": 250, "beverage_type": "water"}, format="json").data
+        self.archive_backdated(HydrationLog, amount=500, beverage_type="tea")
+
+        response = self.client.post("/api/log-hydration/", {"amount": 300, "beverage_type": "water"}, format="json")
+        self.assertEqual(response.data["user_hydration_id"], first["user_hydration_id"] + 2)
+
+
+class StartupBudgetTests(SimpleTestCase):
+    def test_cold_start_is_within_budget(self):
+        budget = startup_budget()
+        probe, _, import_ms = measure_startup(budget)
+        self.assertEqual(startup_failures(budget, probe, import_ms), [])
+
+
+class MemoryBudgetTests(TestCase):
+    cases = [
+        ("daily_summary", {}),
+        ("nutritional_insights", {}),
+        ("filter_food_date", {"date": None}),
+        ("filter_food_by_rating", {"min_rating": 4}),
+        ("food_cooking_time", {"min_time": 5, "max_time": 30}),
+        ("search_food", {"query": "chicken"}),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        rows = settings.MEMORY_BUDGET["ROWS"]
+        cls.user = User.objects.create(username="memory_budget")
+        cls.now = timezone.now()
+        day_start = cls.now.replace(hour=0, minute=0, second=0, microsecond=0)
+        step = max(cls.now - day_start, timedelta(minutes=1)) / rows
+        # The ingredient cache only takes committed rows, and the class transaction never commits.
+        cls.addClassCleanup(clear_cache)
+        with cls.captureOnCommitCallbacks(execute=True):
+            ingredient_ids = encode_ingredients(["chicken", "rice", "broccoli", "olive oil"])
+
+        FoodLog.objects.bulk_create([
+            FoodLog(
+                user=cls.user, user_food_id=i + 1, food_name=f"Chicken rice bowl {i % 50}", serving_size="1 bowl",
+                category="lunch", calories=550, ingredient_ids=ingredient_ids, cooking_time=20, rating=5,
+                review="Good", timestamp=day_start + step * i,
+            )
+            for i in range(rows)
+        ], batch_size=5000)
+        HydrationLog.objects.bulk_create([
+            HydrationLog(user=cls.user, user_hydration_id=i + 1, amount=250, beverage_type="water", timestamp=day_start + step * i)
+            for i in range(rows)
+        ], batch_size=5000)
+
+    def test_per_row_views_stay_within_budget(self):
+        factory = APIRequestFactory()
+        for name, params in self.cases:
+            with self.subTest(view=name):
+                params = {key: value if value is not None else self.now.date().isoformat() for key, value in params.items()}
+                request = factory.get("/", params)
+                force_authenticate(request, user=User.objects.get(pk=self.user.pk))
+
+                tracemalloc.start()
+                try:
+                    response = getattr(views, name)(request)
+                    response.render()
+                    peak = tracemalloc.get_traced_memory()[1] / 2**20
+                finally:
+                    tracemalloc.stop()
+
+                self.assertEqual(response.status_code, 200, response.data)
+                budget = settings.MEMORY_BUDGET["PEAK_MB"][name]
+                self.assertLessEqual(peak, budget, f"{name} peaked at {peak:.1f} MB, over its {budget} MB budget")
+
+
+# Plans are per table and identical on every shard, so the default test database covers them all.
+@override_settings(USER_SHARDS=[DEFAULT_DB_ALIAS])
+class QueryPlanTests(TransactionTestCase):
+    def test_full_scans_match_snapshot(self):
+        plans = capture_plans()
+        if getattr(settings, "QUERY_PLANS_UPDATE", False):
+            write_snapshot(plans)
+            return
+
+        snapshot = read_snapshot()
+        report = compare_plans(plans, snapshot)
+        if report and snapshot.get("sqlite_version") != sqlite3.sqlite_version:
+            report.insert(0, f"Snapshot was taken with SQLite {snapshot.get('sqlite_version')}, running {sqlite3.sqlite_version}.")
+        if report:
+            self.fail("\n".join([
+                *report, "If the change is intended, refresh the snapshot with `manage.py check_query_plans --update`.",
+            ]))
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+DEFAULT_BUCKET_SETTINGS = {
+    "CACHE": "throttle",
+    "CAPACITY": 60,
+    "REFILL_PER_SECOND": 1.0,
+    "COSTS": {},
+    "DEFAULT_COST": 1,
+}
+
+
+def bucket_settings():
+    return {**DEFAULT_BUCKET_SETTINGS, **getattr(settings, "TOKEN_BUCKET_THROTTLE", {})}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.config = bucket_settings()
+        self.cache = caches[self.config["CACHE"]]
+        self.wait_seconds = None
+
+    def get_cost(self, view):
+        name = getattr(view, "throttle_name", None) or type(view).__name__
+        return self.config["COSTS"].get(name, self.config["DEFAULT_COST"])
+
+    def get_cache_key(self, request):
+        if request.user and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        return f"throttle:bucket:{ident}"
+
+    def allow_request(self, request, view):
+        capacity = self.config["CAPACITY"]
+        refill = self.config["REFILL_PER_SECOND"]
+        cost = self.get_cost(view)
+        key = self.get_cache_key(request)
+
+        with self.lock:
+            now = time.monotonic()
+            tokens, updated_at = self.cache.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill)
+
+            if tokens < cost:
+                self.wait_seconds = (cost - tokens) / refill if refill else None
+                self.cache.set(key, (tokens, now), timeout=None)
+                return False
+
+            self.cache.set(key, (tokens - cost, now), timeout=None)
+            return True
+
+    def wait(self):
+        return self.wait_seconds
@@ -0,0 +1,111 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = max(capacity, 1024)
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = m / n ln 2.
+        self.size = int(-self.capacity * math.log(error_rate) / 0.4805) + 1
+        self.hash_count = max(1, round(self.size / self.capacity * 0.6931))
+        self.bits = bytearray(self.size // 8 + 1)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        if value in self:
+            return
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class BlacklistFilter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.high_water_mark = 0
+        self.synced_at = 0.0
+
+    def refresh_seconds(self):
+        return getattr(settings, "TOKEN_BLACKLIST_FILTER", {}).get("REFRESH_SECONDS", 0.0)
+
+    def rebuild(self):
+        rows = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+            .values_list("id", "token__jti")
+        )
+        bloom = BloomFilter(capacity=len(rows) * 2)
+        for _, jti in rows:
+            bloom.add(jti)
+        self.bloom = bloom
+        self.high_water_mark = BlacklistedToken.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        self.synced_at = time.monotonic()
+
+    def sync(self):
+        rows = list(
+            BlacklistedToken.objects.filter(id__gt=self.high_water_mark)
+            .order_by("id")
+            .values_list("id", "token__jti")
+        )
+        for blacklisted_id, jti in rows:
+            self.add(jti)
+            self.high_water_mark = blacklisted_id
+        self.synced_at = time.monotonic()
+
+    def add(self, jti):
+        if self.bloom is None:
+            return
+        if self.bloom.count >= self.bloom.capacity:
+            self.bloom = None
+            return
+        self.bloom.add(jti)
+
+    def might_be_blacklisted(self, jti):
+        with self.lock:
+            if self.bloom is not None and jti in self.bloom:
+                return True
+            # Other processes blacklist tokens too, so a miss only counts once the filter has caught up with
+            # every row written more than REFRESH_SECONDS ago. With the default of 0 every miss runs the
+            # incremental primary-key sync, which is cheaper than the token join it replaces.
+            if self.bloom is not None and time.monotonic() - self.synced_at >= self.refresh_seconds():
+                self.sync()
+            if self.bloom is None:
+                self.rebuild()
+            return jti in self.bloom
+
+    def reset(self):
+        with self.lock:
+            self.bloom = None
+
+
+blacklist_filter = BlacklistFilter()
+
+
+def track_blacklisted_token(sender, instance, created, **kwargs):
+    if created:
+        with blacklist_filter.lock:
+            blacklist_filter.add(instance.token.jti)
+
+
+class FilteredRefreshToken(RefreshToken):
+    def check_blacklist(self):
+        if not blacklist_filter.might_be_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            return
+        super().check_blacklist()
@@ -1,27 +1,47 @@
 from django.urls import path
-from . import views
+
+from .lazy import lazy_view
+from .views import view_path
+
+
+def view(name, asynchronous=False):
+    return lazy_view(view_path(name), asynchronous=asynchronous)
+
 
 urlpatterns = [
-    path('log-food/', views.log_food, name='log-food'),
-    path('list-food-logs/', views.list_food_logs, name='list-food-logs'),
-    path('log-hydration/', views.log_hydration, name='log-hydration'),
-    path('food-log-details/<int:user_food_id>/', views.food_log_details, name='food-log-details'),
-    path('edit-food/<int:user_food_id>/', views.edit_food, name='edit-food'),
-    path('remove-food/<int:user_food_id>/', views.remove_food, name='remove-food'),
-    path('set-food-preferences/', views.set_food_preferences, name='set-food-preferences'),
-    path('list-food-preferences/', views.list_food_preferences, name='list-food-preferences'),
-    path('search-food/', views.search_food, name='search-food'),
-    path('daily-summary/', views.daily_summary, name='daily-summary'),
-    path('nutritional-insights/', views.nutritional_insights, name='nutritional-insights'),
-    path('filter-food-category/', views.filter_food_category, name='filter-food-category'),
-    path('filter-food-date/', views.filter_food_date, name='filter-food-date'),
-    path('filter-food-by-rating/', views.filter_food_by_rating, name='filter-food-by-rating'),
-    path('food-cooking-time/', views.food_cooking_time, name='food-cooking-time'),
-    path('edit-hydration/<int:user_hydration_id>/', views.edit_hydration, name='edit-hydration'),
-    path('list-hydration-logs/', views.list_hydration_logs, name='list-hydration-logs'),
-    path('clear-hydration-logs/', views.clear_hydration_logs, name='clear-hydration-logs'),
-    path('clear-food-logs/', views.clear_food_logs, name='clear-food-logs'),
-    path('remove-hydration/<int:user_hydration_id>/', views.remove_hydration, name='remove-hydration'),
-    path('register/', views.register_user, name='register_user'),
+    path('log-food/', view('log_food'), name='log-food'),
+    path('list-food-logs/', view('list_food_logs'), name='list-food-logs'),
+    path('food-logs/query/', view('query_food_logs'), name='query-food-logs'),
+    path('log-hydration/', view('log_hydration'), name='log-hydration'),
+    path('food-log-details/', view('food_log_details_bulk'), name='food-log-details-bulk'),
+    path('food-log-details/<int:user_food_id>/', view('food_log_details'), name='food-log-details'),
+    path('edit-food/<int:user_food_id>/', view('edit_food'), name='edit-food'),
+    path('remove-food/<int:user_food_id>/', view('remove_food'), name='remove-food'),
+    path('set-food-preferences/', view('set_food_preferences'), name='set-food-preferences'),
+    path('list-food-preferences/', view('list_food_preferences'), name='list-food-preferences'),
+    path('templates/', view('meal_templates'), name='meal-templates'),
+    path('templates/<int:template_id>/', view('remove_meal_template'), name='remove-meal-template'),
+    path('templates/<int:template_id>/log/', view('log_meal_template'), name='log-meal-template'),
+    path('recommendations/', view('recommendations'), name='recommendations'),
+    path('search-food/', view('search_food'), name='search-food'),
+    path('foods/autocomplete/', view('autocomplete_foods'), name='autocomplete-foods'),
+    path('daily-summary/', view('daily_summary'), name='daily-summary'),
+    path('nutritional-insights/', view('nutritional_insights'), name='nutritional-insights'),
+    path('trends/', view('trends'), name='trends'),
+    path('filter-food-category/', view('filter_food_category'), name='filter-food-category'),
+    path('filter-food-date/', view('filter_food_date'), name='filter-food-date'),
+    path('filter-food-by-rating/', view('filter_food_by_rating'), name='filter-food-by-rating'),
+    path('food-cooking-time/', view('food_cooking_time'), name='food-cooking-time'),
+    path('edit-hydration/<int:user_hydration_id>/', view('edit_hydration'), name='edit-hydration'),
+    path('hydration/today/', view('hydration_today'), name='hydration-today'),
+    path('calorie-compliance/', view('calorie_compliance'), name='calorie-compliance'),
+    path('list-hydration-logs/', view('list_hydration_logs'), name='list-hydration-logs'),
+    path('clear-hydration-logs/', view('clear_hydration_logs'), name='clear-hydration-logs'),
+    path('clear-food-logs/', view('clear_food_logs'), name='clear-food-logs'),
+    path('remove-hydration/<int:user_hydration_id>/', view('remove_hydration'), name='remove-hydration'),
+    path('batch/', view('batch'), name='batch'),
+    path('events/', view('events', asynchronous=True), name='events'),
+    path('register/', view('register_user'), name='register_user'),
+    path('admin/stats/', view('population_stats'), name='population-stats'),
 
 ]
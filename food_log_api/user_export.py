@@ -0,0 +1,173 @@
+import gzip
+import json
+import struct
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .archive import delete_archived
+from .compliance import rebuild_calorie_totals
+from .hydration import rebuild_hydration_totals
+from .ingredients import ingredient_names, intern_ingredients
+from .models import FoodLog, FoodPreference, HydrationLog, LogArchive
+from .rows import stream_log_rows
+from .sharding import shard_for
+
+MAGIC = b"FLUX"
+VERSION = 1
+FRAME_ROWS = 5000
+LENGTH = struct.Struct(">I")
+
+FOOD_FIELDS = [
+    "user_food_id", "food_name", "serving_size", "timestamp", "rating", "review", "category",
+    "cooking_time", "ingredient_ids", "calories",
+]
+HYDRATION_FIELDS = ["user_hydration_id", "amount", "timestamp", "beverage_type"]
+PREFERENCE_FIELDS = [
+    "vegetarian", "vegan", "gluten_free", "dairy_free", "nut_free", "calorie_target",
+    "excluded_ingredients", "timezone", "hydration_goal_ml",
+]
+
+
+class UserExportError(ValueError):
+    pass
+
+
+def _encode(value):
+    # Full isoformat keeps microseconds, so restored timestamps sort exactly as the originals did.
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot export {type(value).__name__} values.")
+
+
+def _write_frame(stream, payload):
+    data = json.dumps(payload, default=_encode, separators=(",", ":")).encode()
+    stream.write(LENGTH.pack(len(data)))
+    stream.write(data)
+
+
+def _read_frames(stream):
+    while header := stream.read(LENGTH.size):
+        if len(header) < LENGTH.size:
+            raise UserExportError("Export file is truncated.")
+        (size,) = LENGTH.unpack(header)
+        data = stream.read(size)
+        if len(data) < size:
+            raise UserExportError("Export file is truncated.")
+        yield json.loads(data)
+
+
+def _sections(user):
+    using = shard_for(user)
+    yield "food", FOOD_FIELDS, stream_log_rows(
+        LogArchive.FOOD, user, FoodLog.objects.using(using).filter(user=user).order_by("timestamp"), FOOD_FIELDS
+    )
+    yield "hydration", HYDRATION_FIELDS, stream_log_rows(
+        LogArchive.HYDRATION, user, HydrationLog.objects.using(using).filter(user=user).order_by("timestamp"), HYDRATION_FIELDS
+    )
+    yield "preferences", PREFERENCE_FIELDS, FoodPreference.objects.using(using).filter(user=user).values_list(*PREFERENCE_FIELDS)
+
+
+def export_user(user, fileobj):
+    counts = {}
+    ingredient = FOOD_FIELDS.index("ingredient_ids")
+    ingredient_ids = set()
+
+    with gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6) as stream:
+        stream.write(MAGIC + bytes([VERSION]))
+        _write_frame(stream, {"username": user.username, "exported_at": timezone.now()})
+        for section, fields, rows in _sections(user):
+            counts[section] = 0
+            batch = []
+            for row in rows:
+                if section == "food" and row[ingredient]:
+                    ingredient_ids.update(int(value) for value in row[ingredient].strip(",").split(",") if value)
+                batch.append(row)
+                if len(batch) == FRAME_ROWS:
+                    _write_frame(stream, {"section": section, "fields": fields, "rows": batch})
+                    counts[section] += len(batch)
+                    batch = []
+            if batch:
+                _write_frame(stream, {"section": section, "fields": fields, "rows": batch})
+                counts[section] += len(batch)
+
+        # Ingredient ids are local to this database, so the names travel with the export.
+        ids = sorted(ingredient_ids)
+        _write_frame(stream, {"section": "ingredients", "fields": ["id", "name"], "rows": list(zip(ids, ingredient_names(ids)))})
+    return counts
+
+
+def read_export(fileobj):
+    sections = {"food": [], "hydration": [], "preferences": [], "ingredients": []}
+    try:
+        with gzip.GzipFile(fileobj=fileobj, mode="rb") as stream:
+            prefix = stream.read(len(MAGIC) + 1)
+            if prefix[:len(MAGIC)] != MAGIC:
+                raise UserExportError("Not a user export file.")
+            if prefix[len(MAGIC):] != bytes([VERSION]):
+                raise UserExportError(f"Unsupported user export version {prefix[len(MAGIC):].hex()}.")
+
+            frames = _read_frames(stream)
+            header = next(frames, None)
+            if header is None:
+                raise UserExportError("Export file is truncated.")
+            for frame in frames:
+                if frame.get("section") not in sections:
+                    raise UserExportError(f"Unknown section in export file: {frame.get('section')}")
+                sections[frame["section"]].extend(dict(zip(frame["fields"], row)) for row in frame["rows"])
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        raise UserExportError(f"Could not read export file: {e}")
+    return header, sections
+
+
+def _remap_ingredients(packed, mapping):
+    if not packed or not packed.strip(","):
+        return packed
+    return "," + ",".join(str(mapping[value]) for value in packed.strip(",").split(",")) + ","
+
+
+def import_user(fileobj, user, replace=False, batch_size=FRAME_ROWS):
+    _, sections = read_export(fileobj)
+    old_ids = [str(row["id"]) for row in sections["ingredients"]]
+    mapping = dict(zip(old_ids, intern_ingredients([row["name"] for row in sections["ingredients"]])))
+    using = shard_for(user, for_write=True)
+
+    with transaction.atomic(using=using):
+        if replace:
+            FoodLog.objects.using(using).filter(user=user).delete()
+            HydrationLog.objects.using(using).filter(user=user).delete()
+            FoodPreference.objects.using(using).filter(user=user).delete()
+            delete_archived(LogArchive.FOOD, user)
+            delete_archived(LogArchive.HYDRATION, user)
+
+        # Rows the user still has (live or archived) are kept, so a merge only fills in what is missing.
+        food_ids = {value for value, in stream_log_rows(
+            LogArchive.FOOD, user, FoodLog.objects.using(using).filter(user=user), ["user_food_id"]
+        )}
+        hydration_ids = {value for value, in stream_log_rows(
+            LogArchive.HYDRATION, user, HydrationLog.objects.using(using).filter(user=user), ["user_hydration_id"]
+        )}
+
+        food_logs = [
+            FoodLog(user=user, **{**row, "timestamp": parse_datetime(row["timestamp"]),
+                                  "ingredient_ids": _remap_ingredients(row["ingredient_ids"], mapping)})
+            for row in sections["food"] if row["user_food_id"] not in food_ids
+        ]
+        hydration_logs = [
+            HydrationLog(user=user, **{**row, "timestamp": parse_datetime(row["timestamp"])})
+            for row in sections["hydration"] if row["user_hydration_id"] not in hydration_ids
+        ]
+        FoodLog.objects.using(using).bulk_create(food_logs, batch_size=batch_size)
+        HydrationLog.objects.using(using).bulk_create(hydration_logs, batch_size=batch_size)
+
+        preferences = 0
+        if sections["preferences"] and not FoodPreference.objects.using(using).filter(user=user).exists():
+            FoodPreference.objects.using(using).create(user=user, **sections["preferences"][0])
+            preferences = 1
+
+        rebuild_hydration_totals(user)
+        rebuild_calorie_totals(user)
+
+    return {"food": len(food_logs), "hydration": len(hydration_logs), "preferences": preferences}
@@ -0,0 +1,233 @@
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+from django.utils import timezone
+
+from .archive import archived_logs
+from .catalog import normalize
+from .ingredients import decode_ingredients
+from .models import CatalogFood, FoodLog, LogArchive
+from .preferences import RESTRICTED_INGREDIENTS
+from .recommendations import food_features, log_features
+
+RESTRICTION_BITS = {pref: 1 << position for position, pref in enumerate(RESTRICTED_INGREDIENTS)}
+ARRAY_FIELDS = {
+    "count": (0, np.float64),
+    "rating_sum": (0, np.float64),
+    "rated": (0, np.float64),
+    "calories": (np.nan, np.float64),
+    "cooking_time": (np.nan, np.float64),
+    "last_logged": (-np.inf, np.float64),
+    "flags": (0, np.int64),
+}
+INITIAL_CAPACITY = 32
+DAY_SECONDS = 86400
+COUNT_WEIGHT = 0.5
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def restriction_flags(ingredients):
+    flags = 0
+    for pref, items in RESTRICTED_INGREDIENTS.items():
+        if not items.isdisjoint(ingredients):
+            flags |= RESTRICTION_BITS[pref]
+    return flags
+
+
+def blocked_flags(preferences):
+    if preferences is None:
+        return 0
+    return sum(bit for pref, bit in RESTRICTION_BITS.items() if getattr(preferences, pref, False))
+
+
+def excluded_ingredients(preferences):
+    if preferences is None:
+        return frozenset()
+    return frozenset(item.lower() for item in preferences.excluded_ingredients or [])
+
+
+def name_terms(name):
+    return frozenset(name.split()) | {name}
+
+
+def _number(value):
+    return None if np.isnan(value) else int(value)
+
+
+class UserVectors:
+    def __init__(self, tz, capacity=INITIAL_CAPACITY):
+        self.tz = tz
+        self.tz_name = str(tz)
+        self.built_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.rows = {}
+        self.names = []
+        self.categories = []
+        self.ingredients = []
+        self.day_calories = {}
+        for field, (fill, dtype) in ARRAY_FIELDS.items():
+            setattr(self, field, np.full(capacity, fill, dtype=dtype))
+
+    def _grow(self):
+        for field, (fill, dtype) in ARRAY_FIELDS.items():
+            array = getattr(self, field)
+            setattr(self, field, np.concatenate([array, np.full(len(array), fill, dtype=dtype)]))
+
+    def _row(self, features):
+        row = self.rows.get(features.key)
+        if row is None:
+            row = self.rows[features.key] = len(self.names)
+            if row == len(self.count):
+                self._grow()
+            self.names.append(features.name)
+            self.categories.append(features.category)
+            self.ingredients.append(features.ingredients)
+        return row
+
+    def apply(self, features, sign):
+        with self.lock:
+            if sign < 0 and features.key not in self.rows:
+                return
+            row = self._row(features)
+            self.count[row] += sign
+            if features.rating is not None:
+                self.rating_sum[row] += sign * features.rating
+                self.rated[row] += sign
+
+            # A food's descriptive columns follow its most recent log; removals only adjust the counters.
+            logged = features.timestamp.timestamp()
+            if sign > 0 and logged >= self.last_logged[row]:
+                self.names[row] = features.name
+                self.categories[row] = features.category
+                self.ingredients[row] = features.ingredients
+                self.flags[row] = restriction_flags(features.ingredients)
+                self.calories[row] = np.nan if features.calories is None else features.calories
+                self.cooking_time[row] = np.nan if features.cooking_time is None else features.cooking_time
+                self.last_logged[row] = logged
+
+            day = timezone.localtime(features.timestamp, self.tz).date()
+            self.day_calories[day] = self.day_calories.get(day, 0) + sign * (features.calories or 0)
+
+    def consumed_on(self, day):
+        return self.day_calories.get(day, 0)
+
+    def rank(self, preferences, now, min_rating, max_cooking_time=None, max_calories=None, category=None, limit=10):
+        blocked = blocked_flags(preferences)
+        excluded = excluded_ingredients(preferences)
+
+        with self.lock:
+            size = len(self.names)
+            count = self.count[:size]
+            rated = self.rated[:size]
+            rating = np.divide(self.rating_sum[:size], rated, out=np.zeros(size), where=rated > 0)
+
+            mask = (count > 0) & (rating >= min_rating) & ((self.flags[:size] & blocked) == 0)
+            if max_cooking_time is not None:
+                mask &= ~(self.cooking_time[:size] > max_cooking_time)
+            if max_calories is not None:
+                mask &= self.calories[:size] <= max_calories
+
+            days_since = np.maximum(now - self.last_logged[:size], 0) / DAY_SECONDS
+            score = rating + COUNT_WEIGHT * np.log1p(count) - np.exp(-days_since)
+
+            candidates = np.flatnonzero(mask)
+            results = []
+            for row in candidates[np.argsort(-score[candidates], kind="stable")]:
+                if excluded and not excluded.isdisjoint(self.ingredients[row]):
+                    continue
+                if category and (self.categories[row] or "").lower() != category:
+                    continue
+                results.append({
+                    "source": "history",
+                    "food_name": self.names[row],
+                    "category": self.categories[row],
+                    "calories": _number(self.calories[row]),
+                    "cooking_time": _number(self.cooking_time[row]),
+                    "average_rating": round(float(rating[row]), 1),
+                    "times_logged": int(count[row]),
+                    "last_logged": datetime.fromtimestamp(self.last_logged[row], self.tz).strftime("%Y-%m-%d %I:%M %p"),
+                    "score": round(float(score[row]), 3),
+                })
+                if len(results) == limit:
+                    break
+        return results
+
+
+class CatalogVectors:
+    def __init__(self, rows):
+        self.names = []
+        self.servings = []
+        self.terms = []
+        calories = []
+        protein = []
+        for name, serving, food_calories, protein_g in rows:
+            self.names.append(name)
+            self.servings.append(serving)
+            self.terms.append(name_terms(normalize(name)))
+            calories.append(food_calories)
+            protein.append(protein_g)
+
+        self.calories = np.array(calories, dtype=np.float64)
+        protein_calories = np.array(protein, dtype=np.float64) * 4
+        self.protein_share = np.clip(
+            np.divide(protein_calories, self.calories, out=np.zeros(len(calories)), where=self.calories > 0), 0, 1
+        )
+        self.flags = np.array([restriction_flags(terms) for terms in self.terms], dtype=np.int64)
+
+    def rank(self, preferences, max_calories=None, skip_names=frozenset(), limit=10):
+        excluded = excluded_ingredients(preferences)
+        mask = (self.flags & blocked_flags(preferences)) == 0
+        if max_calories is not None:
+            mask &= self.calories <= max_calories
+
+        candidates = np.flatnonzero(mask)
+        results = []
+        for row in candidates[np.argsort(-self.protein_share[candidates], kind="stable")]:
+            if excluded and not excluded.isdisjoint(self.terms[row]):
+                continue
+            if normalize(self.names[row]) in skip_names:
+                continue
+            results.append({
+                "source": "catalog",
+                "food_name": self.names[row],
+                "serving": self.servings[row],
+                "calories": int(self.calories[row]),
+                "score": round(float(self.protein_share[row]), 3),
+            })
+            if len(results) == limit:
+                break
+        return results
+
+
+def build_user_vectors(user, tz):
+    vectors = UserVectors(tz)
+    for food_log in archived_logs(LogArchive.FOOD, user):
+        vectors.apply(log_features(food_log), 1)
+
+    rows = FoodLog.objects.filter(user=user).values_list(
+        "food_name", "category", "calories", "cooking_time", "rating", "ingredient_ids", "timestamp"
+    )
+    for food_name, category, calories, cooking_time, rating, ingredient_ids, timestamp in rows.iterator():
+        vectors.apply(
+            food_features(food_name, category, calories, cooking_time, rating, decode_ingredients(ingredient_ids), timestamp), 1
+        )
+    return vectors
+
+
+def get_catalog_vectors():
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = CatalogVectors(CatalogFood.objects.values_list("name", "serving", "calories", "protein_g"))
+    return _catalog
+
+
+def reset_catalog_vectors():
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
@@ -0,0 +1,32 @@
+from importlib import import_module
+
+VIEW_MODULES = {
+    "auth": ["register_user"],
+    "batch": ["batch"],
+    "compliance": ["calorie_compliance"],
+    "events": ["events"],
+    "food": [
+        "log_food", "list_food_logs", "food_log_details", "food_log_details_bulk", "edit_food", "remove_food",
+        "filter_food_category", "filter_food_date", "filter_food_by_rating", "food_cooking_time", "query_food_logs",
+        "clear_food_logs",
+    ],
+    "hydration": [
+        "log_hydration", "hydration_today", "edit_hydration", "remove_hydration", "list_hydration_logs",
+        "clear_hydration_logs",
+    ],
+    "preferences": ["set_food_preferences", "list_food_preferences"],
+    "recommendations": ["recommendations"],
+    "templates": ["meal_templates", "remove_meal_template", "log_meal_template"],
+    "analytics": ["search_food", "autocomplete_foods", "daily_summary", "nutritional_insights", "trends", "population_stats"],
+}
+VIEWS = {name: module for module, names in VIEW_MODULES.items() for name in names}
+
+
+def view_path(name):
+    return f"{__name__}.{VIEWS[name]}.{name}"
+
+
+def __getattr__(name):
+    if name not in VIEWS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{VIEWS[name]}"), name)
@@ -0,0 +1,274 @@
+from rest_framework import status
+from datetime import datetime
+from django.utils.timezone import now, timedelta
+from django.db.models import Q
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from ..models import FoodLog, HydrationLog, LogArchive, PopulationStats
+from ..preferences import get_preferences
+from ..catalog import get_index
+from ..coalescing import single_flight
+from ..ingredients import decode_ingredients, ingredient_filter
+from ..rows import stream_log_rows, stream_rows
+from ..throttling import TokenBucketThrottle
+from ..filters import date_range_filter, day_bounds, local_today, user_timezone
+
+PROTEIN_RICH = {
+    "chicken", "beef", "fish", "tofu", "eggs", "beans", "lentils", "turkey",
+    "pork", "shrimp", "salmon", "tuna", "cottage cheese", "Greek yogurt",
+    "cheese", "milk", "quinoa", "seitan", "edamame", "chickpeas", "almonds",
+    "walnuts", "peanut butter", "pumpkin seeds", "sunflower seeds"
+}
+CARBS_RICH = {
+    "rice", "pasta", "bread", "potatoes", "noodles", "cereal", "oats",
+    "corn", "quinoa", "tortilla", "sweet potatoes", "bagels", "croissants",
+    "crackers", "granola", "pancakes", "waffles", "muffins", "barley",
+    "couscous", "pretzels", "popcorn"
+}
+FIBER_RICH = {
+    "broccoli", "carrots", "spinach", "beans", "whole grains", "nuts",
+    "kale", "brussels sprouts", "avocado", "chia seeds", "flaxseeds",
+    "raspberries", "blackberries", "pears", "apples", "oranges",
+    "bananas", "oatmeal", "lentils", "peas", "quinoa", "beets",
+    "sweet potatoes", "almonds", "cashews", "walnuts"
+}
+DEFAULT_HYDRATION_GOAL_ML = 2000
+SEARCH_FIELDS = ["food_name", "serving_size", "category", "cooking_time", "rating", "review", "ingredient_ids", "calories"]
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@throttle_classes([TokenBucketThrottle])
+@single_flight
+def search_food(request):
+    try:
+        user = request.user
+        query = request.GET.get('query', '').strip().lower()
+        preferences = get_preferences(user)
+
+        if not query:
+            return Response({"error": "Please provide a search query."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if query == "food":
+            food_logs = FoodLog.objects.filter(user=user)
+        else:
+            food_logs = FoodLog.objects.filter(
+                Q(food_name__icontains=query) | ingredient_filter(query),
+                user=user
+            )
+
+        results = []
+        excluded_ingredients = getattr(preferences, "excluded_ingredients", [])
+        rows = stream_rows(food_logs, SEARCH_FIELDS)
+
+        for food_name, serving_size, category, cooking_time, rating, review, ingredient_ids, calories in rows:
+            ingredients = decode_ingredients(ingredient_ids)
+            food_data = {
+                "food_name": food_name,
+                "serving_size": serving_size,
+                "category": category,
+                "cooking_time": cooking_time,
+                "rating": rating,
+                "review": review,
+                "ingredients": ingredients,
+                "calories": calories,
+            }
+
+            if excluded_ingredients:
+                for ingredient in ingredients or []:
+                    if ingredient in excluded_ingredients:
+                        food_data["warning"] = f"This food contains an ingredient you want to avoid: {ingredient}"
+                        break
+
+            results.append(food_data)
+
+        if not results:
+            return Response({"message": "No matching food logs found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(results, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def autocomplete_foods(request):
+    prefix = request.GET.get('q', '').strip()
+
+    if not prefix:
+        return Response({"error": "Please provide a search prefix 'q'."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        limit = int(request.GET.get('limit', 10))
+    except ValueError:
+        return Response({"error": "limit must be a valid integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not (1 <= limit <= 50):
+        return Response({"error": "limit must be between 1 and 50."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        return Response(get_index().autocomplete(prefix, limit), status=status.HTTP_200_OK)
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@throttle_classes([TokenBucketThrottle])
+@single_flight
+def daily_summary(request):
+    try:
+        user = request.user
+        tz = user_timezone(user)
+        date_str = request.GET.get('date', local_today(tz).strftime('%Y-%m-%d'))
+
+        try:
+            date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        except ValueError:
+            return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+
+        day_filter = date_range_filter(date, date, tz)
+        day_start, day_end = day_bounds(date, date, tz)
+        food_rows = stream_log_rows(
+            LogArchive.FOOD, user, FoodLog.objects.filter(day_filter, user=user),
+            ["food_name", "calories", "category"], day_start, day_end,
+        )
+        total_calories = 0
+        food_items = []
+        for food_name, calories, category in food_rows:
+            total_calories += calories or 0
+            food_items.append({"name": food_name, "calories": calories, "category": category})
+
+        hydration_rows = stream_log_rows(
+            LogArchive.HYDRATION, user, HydrationLog.objects.filter(day_filter, user=user),
+            ["beverage_type", "amount"], day_start, day_end,
+        )
+        total_hydration = 0
+        hydration_items = []
+        for beverage_type, amount in hydration_rows:
+            total_hydration += amount
+            hydration_items.append({"beverage": beverage_type, "amount": amount})
+
+        total_food_logs = len(food_items)
+        total_hydration_logs = len(hydration_items)
+
+        if total_food_logs == 0 and total_hydration_logs == 0:
+            return Response({"message": "No food or hydration logs found for this date."}, status=status.HTTP_200_OK)
+
+        summary = {
+            "date": date_str,
+            "total_calories": total_calories,
+            "total_hydration": total_hydration,
+            "total_food_logs": total_food_logs,
+            "total_hydration_logs": total_hydration_logs,
+            "food_items_logged": food_items,
+            "hydration_items_logged": hydration_items,
+        }
+
+        return Response(summary, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@throttle_classes([TokenBucketThrottle])
+@single_flight
+def nutritional_insights(request):
+    try:
+        user = request.user
+        one_week_ago = now() - timedelta(days=7)
+        food_logs = FoodLog.objects.filter(user=user, timestamp__gte=one_week_ago)
+
+        log_count = 0
+        protein_count = 0
+        carb_count = 0
+        fiber_count = 0
+
+        for ingredient_ids, in stream_rows(food_logs, ["ingredient_ids"]):
+            log_count += 1
+            ingredients = decode_ingredients(ingredient_ids)
+            if ingredients:
+                for ingredient in ingredients:
+                    ingredient = ingredient.lower()
+                    if ingredient in PROTEIN_RICH:
+                        protein_count += 1
+                    if ingredient in CARBS_RICH:
+                        carb_count += 1
+                    if ingredient in FIBER_RICH:
+                        fiber_count += 1
+
+        if not log_count:
+            return Response({"message": "No food logs found in the past week."}, status=status.HTTP_404_NOT_FOUND)
+
+        suggestions = []
+        if protein_count > carb_count and protein_count > fiber_count:
+            suggestions.append("You've logged a lot of protein. Try adding more fiber-rich foods like vegetables or whole grains.")
+        if carb_count > protein_count:
+            suggestions.append("Consider increasing protein intake for better balance.")
+        if fiber_count < protein_count and fiber_count < carb_count:
+            suggestions.append("Your fiber intake seems low. Add more leafy greens, beans, and nuts.")
+
+        return Response({
+            "summary": {
+                "Protein-Rich Meals": protein_count,
+                "Carb-Rich Meals": carb_count,
+                "Fiber-Rich Meals": fiber_count
+            },
+            "suggestions": suggestions or ["Your diet seems balanced!"]
+        }, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def trends(request):
+    try:
+        days = int(request.GET.get('days', 90))
+        window = int(request.GET.get('window', 7))
+        hydration_goal = request.GET.get('hydration_goal')
+        if hydration_goal is None:
+            preferences = get_preferences(request.user)
+            hydration_goal = getattr(preferences, "hydration_goal_ml", None) or DEFAULT_HYDRATION_GOAL_ML
+        hydration_goal = int(hydration_goal)
+    except ValueError:
+        return Response({"error": "days, window and hydration_goal must be valid integers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not (1 <= days <= 3660):
+        return Response({"error": "days must be between 1 and 3660."}, status=status.HTTP_400_BAD_REQUEST)
+    if not (1 <= window <= days):
+        return Response({"error": "window must be between 1 and days."}, status=status.HTTP_400_BAD_REQUEST)
+    if hydration_goal <= 0:
+        return Response({"error": "hydration_goal must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        from ..analytics import compute_trends
+
+        tz = user_timezone(request.user)
+        first_day = local_today(tz) - timedelta(days=days - 1)
+        data = compute_trends(request.user, first_day, days, tz, window=window, hydration_goal=hydration_goal)
+        return Response(data, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def population_stats(request):
+    try:
+        stats = PopulationStats.objects.latest()
+    except PopulationStats.DoesNotExist:
+        return Response(
+            {"message": "No statistics computed yet. Run 'manage.py compute_stats' first."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return Response({
+        "computed_at": stats.computed_at.strftime("%Y-%m-%d %I:%M %p"),
+        "user_count": stats.user_count,
+        "food_log_count": stats.food_log_count,
+        "hydration_log_count": stats.hydration_log_count,
+        "top_foods": stats.top_foods,
+        "calories_by_category": stats.calories_by_category,
+        "hydration_by_beverage": stats.hydration_by_beverage,
+    }, status=status.HTTP_200_OK)
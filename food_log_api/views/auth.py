@@ -0,0 +1,36 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+
+from ..sharding import assign_shard
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def register_user(request):
+    username = request.data.get('username')
+    password = request.data.get('password')
+
+    if not username or not password:
+        return Response({"error": "Username and password are required"}, status=400)
+
+    # Hash before opening the transaction so the slow KDF never holds the SQLite writer lock.
+    password = make_password(password)
+    try:
+        with transaction.atomic():
+            user = User.objects.create(username=username, password=password)
+            assign_shard(user)
+    except IntegrityError:
+        return Response({"error": "User already exists"}, status=400)
+
+    refresh = RefreshToken.for_user(user)
+    access_token = str(refresh.access_token)
+
+    return Response({
+        "message": "Registration successful",
+        "access_token": access_token,
+        "refresh_token": str(refresh)
+    })
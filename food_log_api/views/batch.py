@@ -0,0 +1,120 @@
+import io
+import json
+from contextlib import ExitStack
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from ..sharding import shard_for
+
+API_PREFIX = "/api/"
+MAX_BATCH_REQUESTS = 20
+BATCH_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class BatchRollback(Exception):
+    pass
+
+
+def build_subrequest(request, method, url, body):
+    parts = urlsplit(url)
+    payload = json.dumps(body).encode() if body is not None else b""
+    environ = {
+        **request.META,
+        "REQUEST_METHOD": method,
+        "SCRIPT_NAME": "",
+        "PATH_INFO": parts.path,
+        "QUERY_STRING": parts.query,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(payload)),
+        "wsgi.input": io.BytesIO(payload),
+    }
+    subrequest = WSGIRequest(environ)
+    # Sub-requests call the view directly. The middleware stack already ran once for the batch request:
+    # UserShardMiddleware's user context covers every sub-request, and a profile covers the whole batch.
+    # Authenticate once: sub-requests reuse the batch's user and token instead of decoding the JWT again.
+    subrequest._force_auth_user = request.user
+    subrequest._force_auth_token = request.auth
+    return subrequest
+
+
+def run_subrequest(request, operation):
+    method = str(operation.get("method", "GET")).upper()
+    url = operation.get("path") or ""
+    if method not in BATCH_METHODS:
+        return {"status": status.HTTP_405_METHOD_NOT_ALLOWED, "body": {"error": f"Method {method} is not allowed in a batch."}}
+
+    path = urlsplit(url).path
+    if not path.startswith(API_PREFIX):
+        path = API_PREFIX + path.lstrip("/")
+        url = API_PREFIX + url.lstrip("/")
+    try:
+        match = resolve(path[len(API_PREFIX) - 1:], urlconf="food_log_api.urls")
+    except Resolver404:
+        match = None
+    if match is None or match.url_name == "batch":
+        return {"status": status.HTTP_404_NOT_FOUND, "body": {"error": f"No API route matches {path}."}}
+    if iscoroutinefunction(match.func):
+        return {"status": status.HTTP_400_BAD_REQUEST, "body": {"error": f"{path} streams its response and cannot be batched."}}
+
+    response = match.func(build_subrequest(request, method, url, operation.get("body")), *match.args, **match.kwargs)
+    if getattr(response, "streaming", False):
+        response.close()
+        return {"status": status.HTTP_400_BAD_REQUEST, "body": {"error": f"{path} streams its response and cannot be batched."}}
+    if method not in SAFE_METHODS:
+        # Writes may change what the shared user caches (e.g. preferences) hold.
+        request.user._state.fields_cache.clear()
+    return {"status": response.status_code, "body": getattr(response, "data", None)}
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch(request):
+    operations = request.data.get("requests")
+    atomic = bool(request.data.get("atomic", False))
+
+    if not isinstance(operations, list) or not operations:
+        return Response({"error": "requests must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+    if len(operations) > MAX_BATCH_REQUESTS:
+        return Response({"error": f"A batch can contain at most {MAX_BATCH_REQUESTS} requests."}, status=status.HTTP_400_BAD_REQUEST)
+    if not all(isinstance(operation, dict) for operation in operations):
+        return Response({"error": "Each request must be an object with method, path and optional body."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        if not atomic:
+            results = [run_subrequest(request, operation) for operation in operations]
+            return Response({"responses": results}, status=status.HTTP_200_OK)
+
+        results = []
+        try:
+            # Sub-views write to the user's shard and to default (users, shard placements, interned
+            # ingredients), so both are held open, shard first as the views themselves lock them. The two
+            # commits are still separate steps when the shard is not default.
+            with ExitStack() as stack:
+                for alias in dict.fromkeys([shard_for(request.user, for_write=True), DEFAULT_DB_ALIAS]):
+                    stack.enter_context(transaction.atomic(using=alias))
+                for operation in operations:
+                    result = run_subrequest(request, operation)
+                    results.append(result)
+                    if result["status"] >= 400:
+                        raise BatchRollback
+        except BatchRollback:
+            request.user._state.fields_cache.clear()
+            return Response({
+                "error": f"Request {len(results) - 1} failed; no changes from this batch were saved.",
+                "rolled_back": True,
+                "responses": results,
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"responses": results, "rolled_back": False}, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
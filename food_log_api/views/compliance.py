@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from ..compliance import compliance_report, compliance_settings
+from ..filters import local_today, user_timezone
+from ..preferences import get_preferences
+
+DEFAULT_DAYS = 7
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def calorie_compliance(request):
+    max_days = compliance_settings()["MAX_DAYS"]
+    try:
+        days = int(request.GET.get('days', DEFAULT_DAYS))
+    except ValueError:
+        return Response({"error": "days must be a valid integer."}, status=status.HTTP_400_BAD_REQUEST)
+    if not (1 <= days <= max_days):
+        return Response({"error": f"days must be between 1 and {max_days}."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        preferences = get_preferences(request.user)
+        target = preferences.calorie_target if preferences else None
+        if not target:
+            return Response(
+                {"error": "No calorie target set. Add one with set-food-preferences to track compliance."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        first_day = local_today(user_timezone(request.user)) - timedelta(days=days - 1)
+        return Response(compliance_report(request.user, target, first_day, days), status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,65 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from ..events import event_settings, format_event, get_broker
+
+
+def authenticate(request):
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    # EventSource cannot send headers, so browsers pass the access token as ?token= instead.
+    raw_token = authentication.get_raw_token(header) if header else request.GET.get("token", "").encode() or None
+    if raw_token is None:
+        return None
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+
+
+RETRY_MS = 3000
+
+
+async def event_stream(user_id, last_event_id, heartbeat):
+    broker = get_broker()
+    subscription, missed, expired = broker.subscribe(user_id, last_event_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        if expired:
+            yield "event: reset\ndata: {}\n\n"
+        for event in missed:
+            yield format_event(event)
+
+        while not subscription.overflowed:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+async def events(request):
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    user = await sync_to_async(authenticate)(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=status.HTTP_401_UNAUTHORIZED)
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    response = StreamingHttpResponse(
+        event_stream(user.pk, last_event_id, event_settings()["HEARTBEAT_SECONDS"]),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
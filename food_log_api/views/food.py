@@ -0,0 +1,404 @@
+from rest_framework import status
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.http import Http404
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from ..models import DailyCalorieTotal, FoodLog, LogArchive
+from ..serializers import FoodLogCreateSerializer, FoodLogSerializer, first_error
+from ..preferences import PreferenceChecker, get_preferences
+from ..catalog import estimate_nutrition
+from ..compliance import apply_calorie_delta
+from ..events import food_event_data, publish_event
+from ..recommendations import invalidate_user_vectors, log_features, record_food_change
+from ..rows import stream_log_rows, stream_rows
+from ..sharding import shard_for
+from ..archive import archived_log, archived_logs, archived_logs_by_id, delete_archived
+from ..filters import FilterError, build_food_log_query, day_bounds, food_log_filter, local_day, parse_date_range, user_timezone
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def log_food(request):
+    serializer = FoodLogCreateSerializer(data=request.data, context={"request": request})
+    if not serializer.is_valid():
+        return Response({"error": first_error(serializer.errors), "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        food_log = serializer.save()
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    response_data = {
+        "user_food_id": food_log.user_food_id,
+        "food_name": food_log.food_name,
+        "category": food_log.category,
+        "calories": food_log.calories,
+        "ingredients": food_log.ingredients,
+        "serving_size": food_log.serving_size,
+        "cooking_time": food_log.cooking_time,
+        "rating": food_log.rating,
+        "review": food_log.review,
+        "message": "Food logged successfully!",
+    }
+
+    if food_log.estimated_nutrition:
+        response_data["estimated_nutrition"] = food_log.estimated_nutrition
+
+    if food_log.warnings:
+        response_data["warnings"] = food_log.warnings
+
+    return Response(response_data, status=status.HTTP_201_CREATED)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def list_food_logs(request):
+    try:
+        food_logs = [*archived_logs(LogArchive.FOOD, request.user), *FoodLog.objects.filter(user=request.user)]
+        if not food_logs:
+            return Response({"message": "No food logs found. Start logging your food intake!"}, status=status.HTTP_200_OK)
+
+        serializer = FoodLogSerializer(food_logs, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def food_log_details(request, user_food_id):
+    try:
+        try:
+            food_log = get_object_or_404(FoodLog, user_food_id=user_food_id, user=request.user)
+        except Http404:
+            food_log = archived_log(LogArchive.FOOD, request.user, user_food_id)
+            if food_log is None:
+                raise
+        preferences = get_preferences(request.user)
+
+        data = {
+            "user_food_id": food_log.user_food_id,
+            "food_name": food_log.food_name,
+            "serving_size": food_log.serving_size,
+            "category": food_log.category,
+            "cooking_time": food_log.cooking_time,
+            "rating": food_log.rating,
+            "review": food_log.review,
+            "ingredients": food_log.ingredients,
+            "calories": food_log.calories,
+            "timestamp": food_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+        }
+
+        if preferences:
+            excluded_ingredients = getattr(preferences, "excluded_ingredients", [])
+            for ingredient in data["ingredients"]:
+                if ingredient in excluded_ingredients:
+                    data["warning"] = f"This food contains an ingredient you want to avoid: {ingredient}"
+                    break
+
+        return Response(data, status=status.HTTP_200_OK)
+
+    except Http404:
+        return Response({"error": "Food log not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def food_log_details_bulk(request):
+    ids_param = request.GET.get('ids', '').strip()
+
+    if not ids_param:
+        return Response({"error": "ids is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        requested_ids = [int(value) for value in ids_param.split(',') if value.strip()]
+    except ValueError:
+        return Response({"error": "ids must be a comma-separated list of integers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not requested_ids:
+        return Response({"error": "ids is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        food_logs = {
+            food_log.user_food_id: food_log
+            for food_log in FoodLog.objects.filter(user=request.user, user_food_id__in=set(requested_ids))
+        }
+        food_logs.update(archived_logs_by_id(LogArchive.FOOD, request.user, set(requested_ids) - set(food_logs)))
+        preferences = get_preferences(request.user)
+        excluded_ingredients = set(getattr(preferences, "excluded_ingredients", None) or [])
+
+        results = []
+        for user_food_id in requested_ids:
+            food_log = food_logs.get(user_food_id)
+            if food_log is None:
+                results.append({"user_food_id": user_food_id, "error": "Food log not found or access denied."})
+                continue
+
+            data = {
+                "user_food_id": food_log.user_food_id,
+                "food_name": food_log.food_name,
+                "serving_size": food_log.serving_size,
+                "category": food_log.category,
+                "cooking_time": food_log.cooking_time,
+                "rating": food_log.rating,
+                "review": food_log.review,
+                "ingredients": food_log.ingredients,
+                "calories": food_log.calories,
+                "timestamp": food_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+            }
+
+            if excluded_ingredients:
+                for ingredient in data["ingredients"] or []:
+                    if ingredient in excluded_ingredients:
+                        data["warning"] = f"This food contains an ingredient you want to avoid: {ingredient}"
+                        break
+
+            results.append(data)
+
+        return Response(results, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['PUT'])
+@permission_classes([IsAuthenticated])
+def edit_food(request, user_food_id):
+    try:
+        food_log = get_object_or_404(FoodLog, user_food_id=user_food_id, user=request.user)
+
+        allowed_fields = {"food_name", "category", "calories", "ingredients", "serving_size", "cooking_time", "rating", "review"}
+        invalid_fields = [field for field in request.data if field not in allowed_fields]
+
+        if invalid_fields:
+            return Response({"error": f"Invalid fields in request: {invalid_fields}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = FoodLogSerializer(food_log, data=request.data, partial=True)
+
+        if serializer.is_valid():
+            updated_food = serializer.validated_data
+            estimated_nutrition = None
+            if updated_food.get("calories", food_log.calories) is None:
+                estimated_nutrition = estimate_nutrition(updated_food.get("ingredients", food_log.ingredients))
+                if estimated_nutrition:
+                    updated_food["calories"] = estimated_nutrition["calories"]
+            previous = log_features(food_log)
+            with transaction.atomic(using=shard_for(request.user, for_write=True)):
+                serializer.save()
+                apply_calorie_delta(
+                    request.user, local_day(food_log.timestamp, user_timezone(request.user)),
+                    (food_log.calories or 0) - (previous.calories or 0), 0
+                )
+                publish_event(request.user, "food.updated", food_event_data(food_log))
+                record_food_change(request.user, old=previous, new=log_features(food_log))
+
+            warnings = PreferenceChecker.for_user(request.user).warnings(
+                updated_food.get("ingredients", food_log.ingredients), updated_food.get("calories", food_log.calories)
+            )
+
+            response_data = {
+                "user_food_id": food_log.user_food_id,
+                "food_name": food_log.food_name,
+                "category": food_log.category,
+                "calories": food_log.calories,
+                "ingredients": food_log.ingredients,
+                "serving_size": food_log.serving_size,
+                "cooking_time": food_log.cooking_time,
+                "rating": food_log.rating,
+                "review": food_log.review,
+                "timestamp": food_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+                "message": "Food log successfully updated!"
+            }
+
+            if estimated_nutrition:
+                response_data["estimated_nutrition"] = estimated_nutrition
+
+            if warnings:
+                response_data["warnings"] = warnings
+
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    except Http404:
+        if archived_log(LogArchive.FOOD, request.user, user_food_id) is not None:
+            return Response({"error": "This food log is archived and can no longer be changed."}, status=status.HTTP_409_CONFLICT)
+        return Response({"error": "Food log not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def remove_food(request, user_food_id):
+    try:
+        food_log = get_object_or_404(FoodLog, user_food_id=user_food_id, user=request.user)
+        with transaction.atomic(using=shard_for(request.user, for_write=True)):
+            food_log.delete()
+            apply_calorie_delta(
+                request.user, local_day(food_log.timestamp, user_timezone(request.user)), -(food_log.calories or 0), -1
+            )
+            publish_event(request.user, "food.deleted", {"user_food_id": user_food_id})
+            record_food_change(request.user, old=log_features(food_log))
+        return Response({"message": "Food log deleted successfully"}, status=status.HTTP_204_NO_CONTENT)
+
+    except Http404:
+        if archived_log(LogArchive.FOOD, request.user, user_food_id) is not None:
+            return Response({"error": "This food log is archived and can no longer be changed."}, status=status.HTTP_409_CONFLICT)
+        return Response({"error": "Food log not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def filter_food_category(request):
+    try:
+        category = request.GET.get('category', '').strip()
+
+        if not category:
+            return Response({"error": "Category is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        filtered_food = FoodLog.objects.filter(
+            food_log_filter(request.user, {"category": category})
+        ).values('user_food_id', 'food_name', 'category')
+
+        if not filtered_food.exists():
+            return Response({"message": f"No food logs found for category: {category}"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(list(filtered_food), status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def filter_food_date(request):
+    params = {key: request.GET.get(key) for key in ('date', 'dateFrom', 'dateTo')}
+    try:
+        date_from, date_to = parse_date_range(params)
+        query = food_log_filter(request.user, params)
+    except FilterError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    rows = stream_log_rows(
+        LogArchive.FOOD, request.user, FoodLog.objects.filter(query),
+        ["user_food_id", "food_name", "timestamp"], *day_bounds(date_from, date_to, user_timezone(request.user)),
+    )
+    response_data = [
+        {
+            "user_food_id": user_food_id,
+            "food_name": food_name,
+            "timestamp": timestamp.strftime("%Y-%m-%d %I:%M %p")
+        }
+        for user_food_id, food_name, timestamp in rows
+    ]
+
+    if not response_data:
+        return Response(
+            {"message": f"No food logs found for the given date range ({date_from} - {date_to})."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return Response(response_data, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def filter_food_by_rating(request):
+    min_rating = request.GET.get('min_rating', '')
+    try:
+        query = food_log_filter(request.user, {"min_rating": min_rating})
+    except FilterError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    filtered_food = FoodLog.objects.filter(query).order_by('-rating')
+    response_data = [
+        {
+            "user_food_id": user_food_id,
+            "food_name": food_name,
+            "rating": rating,
+            "review": review
+        }
+        for user_food_id, food_name, rating, review in stream_rows(filtered_food, ["user_food_id", "food_name", "rating", "review"])
+    ]
+
+    if not response_data:
+        return Response(
+            {"message": f"No food logs found with a rating of {min_rating} or higher."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return Response(response_data, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def food_cooking_time(request):
+    min_time = request.GET.get('min_time')
+    max_time = request.GET.get('max_time')
+
+    if min_time is None or max_time is None:
+        return Response({"error": "Both min_time and max_time are required."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        query = food_log_filter(request.user, {"min_time": min_time, "max_time": max_time})
+    except FilterError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    filtered_food = FoodLog.objects.filter(query).order_by('cooking_time')
+    response_data = [
+        {
+            "user_food_id": user_food_id,
+            "food_name": food_name,
+            "cooking_time": cooking_time
+        }
+        for user_food_id, food_name, cooking_time in stream_rows(filtered_food, ["user_food_id", "food_name", "cooking_time"])
+    ]
+
+    if not response_data:
+        return Response(
+            {"message": f"No food logs found with a cooking time between {min_time} and {max_time} minutes."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    return Response(response_data, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def query_food_logs(request):
+    try:
+        results, next_cursor = build_food_log_query(request.user, request.GET)
+    except FilterError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    return Response({"results": results, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def clear_food_logs(request):
+    try:
+        with transaction.atomic(using=shard_for(request.user, for_write=True)):
+            deleted_count, _ = FoodLog.objects.filter(user=request.user).delete()
+            deleted_count += delete_archived(LogArchive.FOOD, request.user)
+            DailyCalorieTotal.objects.filter(user=request.user).delete()
+            if deleted_count:
+                publish_event(request.user, "food.cleared", {"deleted": deleted_count})
+                invalidate_user_vectors(request.user)
+
+        if deleted_count == 0:
+            return Response(
+                {"message": "No food logs found to clear. You're all set!"},
+                status=status.HTTP_200_OK
+            )
+
+        return Response(
+            {"message": f"Successfully cleared {deleted_count} food log(s)!"},
+            status=status.HTTP_200_OK
+        )
+
+    except Exception as e:
+        return Response(
+            {"error": "An unexpected error occurred while clearing food logs. Please try again later."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
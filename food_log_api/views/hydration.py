@@ -0,0 +1,193 @@
+from rest_framework import status
+from django.db import transaction
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from ..models import DailyHydrationTotal, HydrationLog, LogArchive
+from ..preferences import get_preferences
+from ..serializers import HydrationLogCreateSerializer, first_error
+from ..sharding import UserShardMoving, shard_for
+from ..archive import archived_log, archived_logs, delete_archived
+from ..events import publish_event
+from ..hydration import apply_hydration_delta
+from ..filters import local_day, local_today, user_timezone
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def log_hydration(request):
+    try:
+        serializer = HydrationLogCreateSerializer(data=request.data, context={"request": request})
+        if not serializer.is_valid():
+            return Response({"error": first_error(serializer.errors), "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            hydration_log = serializer.save()
+        except UserShardMoving as e:
+            return Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={"Retry-After": "5"})
+
+        return Response({
+            "user_hydration_id": hydration_log.user_hydration_id,
+            "user": request.user.username,
+            "amount": hydration_log.amount,
+            "beverage": hydration_log.beverage_type,
+            "timestamp": hydration_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+            "message": f"Successfully logged {hydration_log.amount}ml of {hydration_log.beverage_type}!"
+        }, status=status.HTTP_201_CREATED)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def hydration_today(request):
+    try:
+        preferences = get_preferences(request.user)
+        goal_ml = preferences.hydration_goal_ml if preferences else None
+        today = local_today(user_timezone(request.user))
+        total_ml, log_count = (
+            DailyHydrationTotal.objects.filter(user=request.user, date=today).values_list("total_ml", "log_count").first()
+            or (0, 0)
+        )
+
+        return Response({
+            "date": today.isoformat(),
+            "total_ml": total_ml,
+            "log_count": log_count,
+            "goal_ml": goal_ml,
+            "remaining_ml": max(goal_ml - total_ml, 0) if goal_ml else None,
+            "percent": round(total_ml / goal_ml * 100, 1) if goal_ml else None,
+        }, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def find_hydration_log(user, user_hydration_id):
+    try:
+        return HydrationLog.objects.get(user_hydration_id=user_hydration_id, user=user), None
+    except HydrationLog.DoesNotExist:
+        if archived_log(LogArchive.HYDRATION, user, user_hydration_id) is not None:
+            return None, Response({"error": "This hydration log is archived and can no longer be changed."}, status=status.HTTP_409_CONFLICT)
+        return None, Response({"error": "Hydration log not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+    except HydrationLog.MultipleObjectsReturned:
+        return None, Response(
+            {"error": "More than one hydration log has this id, so it cannot be changed by id."},
+            status=status.HTTP_409_CONFLICT
+        )
+
+@api_view(['PUT'])
+@permission_classes([IsAuthenticated])
+def edit_hydration(request, user_hydration_id):
+    try:
+        hydration_log, error = find_hydration_log(request.user, user_hydration_id)
+        if error:
+            return error
+        allowed_fields = {"amount", "beverage_type", "timestamp"}
+        invalid_fields = [field for field in request.data if field not in allowed_fields]
+
+        if invalid_fields:
+            return Response(
+                {"error": f"Invalid fields in request: {invalid_fields}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = HydrationLogCreateSerializer(hydration_log, data=request.data, partial=True, context={"request": request})
+        if not serializer.is_valid():
+            return Response({"error": first_error(serializer.errors), "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            hydration_log = serializer.save()
+        except UserShardMoving as e:
+            return Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={"Retry-After": "5"})
+
+        return Response({
+            "user_hydration_id": hydration_log.user_hydration_id,
+            "amount": hydration_log.amount,
+            "beverage": hydration_log.beverage_type,
+            "timestamp": hydration_log.timestamp.strftime("%Y-%m-%d %I:%M %p"),
+            "message": "Hydration log successfully updated!"
+        }, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def remove_hydration(request, user_hydration_id):
+    try:
+        hydration_log, error = find_hydration_log(request.user, user_hydration_id)
+        if error:
+            return error
+        with transaction.atomic(using=shard_for(request.user, for_write=True)):
+            hydration_log.delete()
+            apply_hydration_delta(
+                request.user, local_day(hydration_log.timestamp, user_timezone(request.user)), -hydration_log.amount, -1
+            )
+            publish_event(request.user, "hydration.deleted", {"user_hydration_id": user_hydration_id})
+
+        return Response(
+            {"message": "Hydration log has been removed successfully!"},
+            status=status.HTTP_204_NO_CONTENT
+        )
+
+    except Exception as e:
+        return Response(
+            {"error": "An unexpected error occurred while deleting the hydration log. Please try again later."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def list_hydration_logs(request):
+    try:
+        hydration_logs = [*archived_logs(LogArchive.HYDRATION, request.user), *HydrationLog.objects.filter(user=request.user)]
+        if not hydration_logs:
+            return Response(
+                {"message": "No hydration logs found. Start logging your hydration intake!"},
+                status=status.HTTP_200_OK
+            )
+
+        response_data = [
+            {
+                "user_hydration_id": log.user_hydration_id,
+                "amount": log.amount,
+                "beverage": log.beverage_type,
+                "timestamp": log.timestamp.strftime("%Y-%m-%d %I:%M %p")
+            }
+            for log in hydration_logs
+        ]
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response(
+            {"error": "An unexpected error occurred while retrieving hydration logs. Please try again later."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def clear_hydration_logs(request):
+    try:
+        with transaction.atomic(using=shard_for(request.user, for_write=True)):
+            deleted_count, _ = HydrationLog.objects.filter(user=request.user).delete()
+            deleted_count += delete_archived(LogArchive.HYDRATION, request.user)
+            DailyHydrationTotal.objects.filter(user=request.user).delete()
+            if deleted_count:
+                publish_event(request.user, "hydration.cleared", {"deleted": deleted_count})
+
+        if deleted_count == 0:
+            return Response(
+                {"message": "No hydration logs found to clear. You're all set!"},
+                status=status.HTTP_200_OK
+            )
+
+        return Response(
+            {"message": f"Successfully cleared {deleted_count} hydration log(s)!"},
+            status=status.HTTP_200_OK
+        )
+
+    except Exception as e:
+        return Response(
+            {"error": "An unexpected error occurred while clearing hydration logs. Please try again later."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
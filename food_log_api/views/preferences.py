@@ -0,0 +1,68 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from ..models import FoodPreference, MealTemplate
+from ..serializers import FoodPreferenceSerializer
+from ..events import publish_event
+from ..compliance import rebuild_calorie_totals
+from ..hydration import rebuild_hydration_totals
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def set_food_preferences(request):
+    try:
+        user = request.user
+        preferences, created = FoodPreference.objects.get_or_create(user=user)
+        user.foodpreference = preferences
+        previous_timezone = preferences.timezone
+        serializer = FoodPreferenceSerializer(preferences, data=request.data, partial=True)
+
+        if serializer.is_valid():
+            serializer.save()
+            if preferences.timezone != previous_timezone:
+                rebuild_hydration_totals(user)
+                rebuild_calorie_totals(user)
+            MealTemplate.objects.filter(user=user).update(warnings=None)
+            publish_event(user, "preferences.updated", serializer.data)
+            return Response({
+                "message": "Preferences updated successfully.",
+                "preferences": serializer.data
+            }, status=status.HTTP_200_OK)
+
+        return Response({"error": "Invalid data provided.", "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def list_food_preferences(request):
+    try:
+        preferences = request.user.foodpreference
+
+        return Response({
+            "message": "User dietary preferences retrieved successfully.",
+            "dietary_preferences": {
+                "vegetarian": preferences.vegetarian,
+                "vegan": preferences.vegan,
+                "nut_free": preferences.nut_free,
+                "gluten_free": preferences.gluten_free,
+                "dairy_free": preferences.dairy_free,
+            },
+            "excluded_ingredients": preferences.excluded_ingredients or [],
+            "calorie_target": preferences.calorie_target if preferences.calorie_target else "No target set",
+            "timezone": preferences.timezone,
+            "hydration_goal_ml": preferences.hydration_goal_ml
+        }, status=status.HTTP_200_OK)
+
+    except FoodPreference.DoesNotExist:
+        return Response({
+            "message": "No dietary preferences found. Please set your preferences first.",
+            "dietary_preferences": None,
+            "excluded_ingredients": [],
+            "calorie_target": "No target set"
+        }, status=status.HTTP_404_NOT_FOUND)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,69 @@
+import time
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from ..filters import FilterError, local_today, parse_min_rating, user_timezone
+from ..preferences import get_preferences
+from ..recommendations import user_vectors
+from ..vectors import get_catalog_vectors
+
+DEFAULT_MIN_RATING = 4
+DEFAULT_RECOMMENDATIONS = 10
+MAX_RECOMMENDATIONS = 50
+TRUE_VALUES = {"1", "true", "yes"}
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def recommendations(request):
+    try:
+        min_rating = parse_min_rating(request.GET.get('min_rating', DEFAULT_MIN_RATING))
+        try:
+            max_cooking_time = request.GET.get('max_cooking_time')
+            max_cooking_time = int(max_cooking_time) if max_cooking_time else None
+        except ValueError:
+            raise FilterError("max_cooking_time must be a valid positive integer.")
+        if max_cooking_time is not None and max_cooking_time < 0:
+            raise FilterError("max_cooking_time must be a positive integer.")
+        try:
+            limit = int(request.GET.get('limit', DEFAULT_RECOMMENDATIONS))
+        except ValueError:
+            raise FilterError("limit must be a valid positive integer.")
+        if not (1 <= limit <= MAX_RECOMMENDATIONS):
+            raise FilterError(f"limit must be between 1 and {MAX_RECOMMENDATIONS}.")
+    except FilterError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    category = request.GET.get('category', '').strip().lower()
+    include_catalog = request.GET.get('include_catalog', '').strip().lower() in TRUE_VALUES
+
+    try:
+        preferences = get_preferences(request.user)
+        tz = user_timezone(request.user)
+        vectors = user_vectors(request.user, tz)
+
+        consumed = vectors.consumed_on(local_today(tz))
+        calorie_target = preferences.calorie_target if preferences else None
+        remaining = max(calorie_target - consumed, 0) if calorie_target else None
+
+        results = vectors.rank(
+            preferences, time.time(), min_rating,
+            max_cooking_time=max_cooking_time, max_calories=remaining, category=category, limit=limit,
+        )
+        if include_catalog and not category and len(results) < limit:
+            results += get_catalog_vectors().rank(
+                preferences, max_calories=remaining, skip_names=vectors.rows, limit=limit - len(results),
+            )
+
+        return Response({
+            "calories_today": consumed,
+            "calorie_target": calorie_target,
+            "calories_remaining": remaining,
+            "recommendations": results,
+        }, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
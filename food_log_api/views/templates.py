@@ -0,0 +1,102 @@
+from django.db import IntegrityError, transaction
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from ..filters import local_today, user_timezone
+from ..meal_templates import log_template, template_warnings
+from ..models import MealTemplate
+from ..serializers import MealTemplateSerializer
+from ..sharding import UserShardMoving, shard_for
+
+MAX_TEMPLATE_DATES = 31
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def meal_templates(request):
+    try:
+        if request.method == 'GET':
+            templates = MealTemplate.objects.filter(user=request.user).order_by('name')
+            return Response(MealTemplateSerializer(templates, many=True).data, status=status.HTTP_200_OK)
+
+        serializer = MealTemplateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({"error": "Invalid data provided.", "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic(using=shard_for(request.user, for_write=True)):
+                template = serializer.save(user=request.user)
+        except IntegrityError:
+            return Response({"error": "A template with this name already exists."}, status=status.HTTP_400_BAD_REQUEST)
+
+        template_warnings(template)
+        return Response({
+            "message": "Template created successfully.",
+            "template": MealTemplateSerializer(template).data
+        }, status=status.HTTP_201_CREATED)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['DELETE'])
+@permission_classes([IsAuthenticated])
+def remove_meal_template(request, template_id):
+    try:
+        template = get_object_or_404(MealTemplate, id=template_id, user=request.user)
+        template.delete()
+        return Response({"message": "Template has been removed successfully!"}, status=status.HTTP_204_NO_CONTENT)
+
+    except Http404:
+        return Response({"error": "Template not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def log_meal_template(request, template_id):
+    template = MealTemplate.objects.filter(id=template_id, user=request.user).first()
+    if template is None:
+        return Response({"error": "Template not found or access denied."}, status=status.HTTP_404_NOT_FOUND)
+
+    tz = user_timezone(request.user)
+    raw_dates = request.data.get("dates") or [local_today(tz).isoformat()]
+    if not isinstance(raw_dates, list):
+        raw_dates = [raw_dates]
+    if len(raw_dates) > MAX_TEMPLATE_DATES:
+        return Response({"error": f"At most {MAX_TEMPLATE_DATES} dates can be logged at once."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        days = [parse_date(str(value)) for value in raw_dates]
+    except ValueError:
+        days = [None]
+    if None in days:
+        return Response({"error": "Invalid date format. Use YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        food_logs = log_template(template, days, tz)
+    except UserShardMoving as e:
+        return Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={"Retry-After": "5"})
+    except Exception as e:
+        return Response({"error": f"An unexpected error occurred: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    response_data = {
+        "template_id": template.id,
+        "food_name": template.food_name,
+        "logged": [
+            {"user_food_id": food_log.user_food_id, "timestamp": food_log.timestamp.astimezone(tz).strftime("%Y-%m-%d %I:%M %p")}
+            for food_log in food_logs
+        ],
+        "message": f"Logged {template.name} for {len(food_logs)} day(s)!",
+    }
+
+    warnings = template_warnings(template)
+    if warnings:
+        response_data["warnings"] = warnings
+
+    return Response(response_data, status=status.HTTP_201_CREATED)